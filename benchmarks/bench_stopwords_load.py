@@ -0,0 +1,90 @@
+"""
+Benchmark: stop word list loading
+
+Measures the cold-start cost of the default stop word set in a fresh
+interpreter (import of the generated module), compared with parsing the
+plain-text list, and the cost of loading a custom list file the first time
+and from the per-process cache.
+
+Usage:
+    python benchmarks/bench_stopwords_load.py --repeat 20
+"""
+
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bidnlp.utils import PersianStopWords
+from bidnlp.utils.stopwords import read_stopwords_file
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each snippet prints the seconds spent loading, measured inside the child
+# (the package itself is imported before the timer starts)
+COLD_DEFAULT = (
+    "import time, bidnlp.utils; start = time.perf_counter(); "
+    "from bidnlp.utils.stopwords_data import STOPWORDS; "
+    "print(time.perf_counter() - start)"
+)
+COLD_TEXT = (
+    "import time, sys; from bidnlp.utils.stopwords import read_stopwords_file; "
+    "start = time.perf_counter(); read_stopwords_file(sys.argv[1]); "
+    "print(time.perf_counter() - start)"
+)
+
+
+def cold(snippet: str, repeat: int, *args: str) -> float:
+    """Median load time of a snippet over fresh interpreters, in ms."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', snippet, *args], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True).stdout
+        times.append(float(out) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20, help='runs per measurement')
+    parser.add_argument('--words', type=int, default=50000, help='words in the custom list')
+    args = parser.parse_args()
+
+    # Byte-compile the package like a wheel install does
+    compileall.compile_dir(os.path.join(ROOT, 'bidnlp'), quiet=1)
+
+    source = os.path.join(ROOT, 'stopwords.txt')
+    print(f"{'load':<34}{'median (ms)':>12}")
+    print(f"{'default set, generated module':<34}{cold(COLD_DEFAULT, args.repeat):>12.3f}")
+    if os.path.exists(source):
+        print(f"{'default set, parse stopwords.txt':<34}"
+              f"{cold(COLD_TEXT, args.repeat, source):>12.3f}")
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+        f.write('\n'.join(f"واژه{i}" for i in range(args.words)))
+        path = f.name
+    try:
+        start = time.perf_counter()
+        read_stopwords_file(path)
+        first = (time.perf_counter() - start) * 1000
+
+        PersianStopWords.load_file(path)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            PersianStopWords(stopwords_file=path, include_defaults=False)
+        cached = (time.perf_counter() - start) * 1000 / args.repeat
+    finally:
+        os.unlink(path)
+
+    print(f"{f'custom file ({args.words} words), parse':<34}{first:>12.3f}")
+    print(f"{f'custom file ({args.words} words), cached':<34}{cached:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
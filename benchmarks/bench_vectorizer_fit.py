@@ -0,0 +1,64 @@
+"""
+Benchmark: BagOfWords / TfidfVectorizer fit
+
+Measures wall time and peak traced memory of ``fit`` on a synthetic corpus.
+Timing runs use a pre-built list of documents; memory runs stream the corpus
+from a generator so that only the memory held by ``fit`` itself is measured.
+
+Usage:
+    python benchmarks/bench_vectorizer_fit.py --docs 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from bidnlp.classification import BagOfWords, TfidfVectorizer
+
+from corpus import generate_documents
+
+
+def run(extractor_cls, args, trace_memory: bool) -> float:
+    """Fit one extractor and return elapsed seconds or peak MiB."""
+    extractor = extractor_cls(max_features=args.max_features, min_df=args.min_df)
+    docs = generate_documents(args.docs, args.vocab, args.words, args.seed)
+
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        extractor.fit(docs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+    docs = list(docs)
+    gc.collect()
+    start = time.perf_counter()
+    extractor.fit(docs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=1000000, help='number of documents')
+    parser.add_argument('--vocab', type=int, default=50000, help='distinct words in the corpus')
+    parser.add_argument('--words', type=int, default=20, help='words per document')
+    parser.add_argument('--max-features', type=int, default=10000)
+    parser.add_argument('--min-df', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"docs={args.docs} vocab={args.vocab} words/doc={args.words} "
+          f"max_features={args.max_features} min_df={args.min_df}")
+    print(f"{'extractor':<18}{'fit time (s)':>14}{'peak memory (MiB)':>20}")
+
+    # Time and memory are measured in separate runs; tracing slows Python down
+    for extractor_cls in (BagOfWords, TfidfVectorizer):
+        elapsed = run(extractor_cls, args, trace_memory=False)
+        peak = run(extractor_cls, args, trace_memory=True)
+        print(f"{extractor_cls.__name__:<18}{elapsed:>14.2f}{peak:>20.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark comparison: two run.py result files
+
+Matches results by benchmark name and size and prints the ratio of the new
+median time (and peak memory) to the old one. Cases slower than the
+threshold are reported as regressions and make the script exit with status 1,
+so it can gate a CI job.
+
+Usage:
+    python benchmarks/run.py --output before.json
+    git checkout my-branch
+    python benchmarks/run.py --output after.json
+    python benchmarks/compare.py before.json after.json --threshold 1.2
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Tuple
+
+Key = Tuple[str, int]
+
+
+def load(path: str) -> Tuple[Dict[str, Any], Dict[Key, Dict[str, Any]]]:
+    """Load a result file as (meta, results keyed by (name, size))."""
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    return report['meta'], {(r['name'], r['size']): r for r in report['results']}
+
+
+def _ratio(new: float, old: float) -> float:
+    return new / old if old else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('old', help='baseline result file')
+    parser.add_argument('new', help='result file to check')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='time ratio above which a case is a regression')
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help='peak memory ratio above which a case is a regression')
+    args = parser.parse_args()
+
+    old_meta, old = load(args.old)
+    new_meta, new = load(args.new)
+    print(f"old: {old_meta.get('commit') or '?'} ({old_meta.get('python')})")
+    print(f"new: {new_meta.get('commit') or '?'} ({new_meta.get('python')})")
+    print(f"{'benchmark':<44}{'size':>7}{'old (s)':>11}{'new (s)':>11}{'time':>8}{'memory':>8}")
+
+    regressions = []
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        time_ratio = _ratio(after['median_s'], before['median_s'])
+        memory_ratio = None
+        if 'peak_memory_kib' in before and 'peak_memory_kib' in after:
+            memory_ratio = _ratio(after['peak_memory_kib'], before['peak_memory_kib'])
+
+        flag = ''
+        if time_ratio > args.threshold:
+            flag = '  SLOWER'
+        elif (args.memory_threshold is not None and memory_ratio is not None
+              and memory_ratio > args.memory_threshold):
+            flag = '  MORE MEMORY'
+        elif time_ratio < 1 / args.threshold:
+            flag = '  faster'
+        if flag.strip() in ('SLOWER', 'MORE MEMORY'):
+            regressions.append(key)
+
+        memory = '' if memory_ratio is None else f'{memory_ratio:.2f}x'
+        print(f"{key[0]:<44}{key[1]:>7}{before['median_s']:>11.4f}{after['median_s']:>11.4f}"
+              f"{time_ratio:>7.2f}x{memory:>8}{flag}")
+
+    for key in sorted(old.keys() - new.keys()):
+        print(f"{key[0]:<44}{key[1]:>7}  only in {args.old}")
+    for key in sorted(new.keys() - old.keys()):
+        print(f"{key[0]:<44}{key[1]:>7}  only in {args.new}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above the threshold")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
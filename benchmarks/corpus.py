@@ -0,0 +1,205 @@
+"""
+Synthetic Persian Corpus
+
+Generates reproducible synthetic Persian text for the benchmarks:
+- generate_documents: Random words with Zipf-distributed frequencies
+- generate_texts: Sentences built from the package's POS and sentiment
+  lexicons, optionally with noise for the cleaner and normalizer
+- generate_tagged_sentences: The same sentences with their POS tags
+- generate_labeled_texts: Texts labelled by their sentiment words
+"""
+
+import random
+from itertools import accumulate
+from typing import Dict, Iterator, List, Tuple
+
+PERSIAN_LETTERS = 'ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی'
+
+
+def build_vocabulary(size: int, seed: int = 0) -> List[str]:
+    """
+    Build a list of distinct synthetic Persian words.
+
+    Args:
+        size: Number of words
+        seed: Random seed
+
+    Returns:
+        List of words
+    """
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    while len(words) < size:
+        word = ''.join(rng.choice(PERSIAN_LETTERS) for _ in range(rng.randint(2, 8)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def generate_documents(num_documents: int,
+                       vocabulary_size: int = 50000,
+                       words_per_document: int = 20,
+                       seed: int = 0) -> Iterator[str]:
+    """
+    Lazily generate synthetic documents.
+
+    Args:
+        num_documents: Number of documents to generate
+        vocabulary_size: Number of distinct words
+        words_per_document: Words per document
+        seed: Random seed
+
+    Yields:
+        Space-separated documents
+    """
+    vocabulary = build_vocabulary(vocabulary_size, seed)
+    cum_weights = list(accumulate(1.0 / rank for rank in range(1, vocabulary_size + 1)))
+    rng = random.Random(seed + 1)
+
+    for _ in range(num_documents):
+        yield ' '.join(rng.choices(vocabulary, cum_weights=cum_weights, k=words_per_document))
+
+
+# Lexicon-based text: (tag, words) pools from the package's own word lists
+def _lexicon() -> Dict[str, List[str]]:
+    """Collect tagged word pools from the POS resources and sentiment lexicon."""
+    from bidnlp.classification import PersianSentimentAnalyzer
+    from bidnlp.pos import PersianPOSResources as resources
+
+    return {
+        'N': sorted(resources.COMMON_NOUNS),
+        'N_LOC': sorted(resources.PERSIAN_CITIES),
+        'ADJ': sorted(resources.COMMON_ADJECTIVES
+                      | {w for w in PersianSentimentAnalyzer.DEFAULT_POSITIVE_KEYWORDS if ' ' not in w}
+                      | {w for w in PersianSentimentAnalyzer.DEFAULT_NEGATIVE_KEYWORDS if ' ' not in w}),
+        'ADV': sorted(resources.COMMON_ADVERBS),
+        'PRO_PERS': sorted(resources.PERSONAL_PRONOUNS),
+        'PREP': sorted(resources.PREPOSITIONS),
+        'CONJ': sorted(resources.CONJUNCTIONS),
+        'DET': sorted(resources.DETERMINERS),
+        'V_ROOT': sorted(resources.COMMON_VERB_ROOTS),
+    }
+
+
+_PAST_ENDINGS = ['م', 'ی', '', 'یم', 'ید', 'ند']
+_ARABIC_VARIANTS = str.maketrans('یک', 'يك')
+_NOISE = ['http://example.com/page', '@user', '#خبر', 'info@example.com', '😀',
+          '<b>', '</b>', '&amp;', '۱۴۰۲', '٣٤', '12.5']
+
+
+def _tagged_sentence(rng: random.Random, lexicon: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+    """Build one sentence with an S (PREP N) (ADJ) (ADV) V pattern."""
+    words = []
+    if rng.random() < 0.5:
+        words.append((rng.choice(lexicon['PRO_PERS']), 'PRO_PERS'))
+    else:
+        if rng.random() < 0.3:
+            words.append((rng.choice(lexicon['DET']), 'DET'))
+        noun = rng.choice(lexicon['N'])
+        if rng.random() < 0.3:
+            words.append((noun + 'ها', 'N_PL'))
+        else:
+            words.append((noun, 'N'))
+        if rng.random() < 0.4:
+            words.append((rng.choice(lexicon['ADJ']), 'ADJ'))
+    if rng.random() < 0.5:
+        words.append((rng.choice(lexicon['PREP']), 'PREP'))
+        tag = rng.choice(['N', 'N_LOC'])
+        words.append((rng.choice(lexicon[tag]), tag))
+    if rng.random() < 0.4:
+        words.append((rng.choice(lexicon['ADV']), 'ADV'))
+    if rng.random() < 0.2:
+        words.append((rng.choice(lexicon['CONJ']), 'CONJ'))
+        words.append((rng.choice(lexicon['ADJ']), 'ADJ'))
+    root = rng.choice(lexicon['V_ROOT'])
+    if rng.random() < 0.5:
+        words.append((root + rng.choice(_PAST_ENDINGS), 'V_PAST'))
+    else:
+        words.append(('می‌' + root + rng.choice(_PAST_ENDINGS), 'V'))
+    words.append((rng.choice('.!؟'), 'PUNC'))
+    return words
+
+
+def generate_tagged_sentences(num_sentences: int, seed: int = 0) -> List[List[Tuple[str, str]]]:
+    """
+    Generate POS-tagged sentences from the package's lexicons.
+
+    Args:
+        num_sentences: Number of sentences
+        seed: Random seed
+
+    Returns:
+        List of sentences as (word, tag) lists
+    """
+    lexicon = _lexicon()
+    rng = random.Random(seed)
+    return [_tagged_sentence(rng, lexicon) for _ in range(num_sentences)]
+
+
+def generate_texts(num_texts: int, sentences_per_text: int = 3,
+                   noise: float = 0.1, seed: int = 0) -> List[str]:
+    """
+    Generate raw Persian texts from the package's lexicons.
+
+    With ``noise`` > 0, some words get Arabic letter variants or diacritics
+    and some URLs, mentions, hashtags, emails, emojis, HTML and digits are
+    mixed in, so the cleaner and normalizer have work to do.
+
+    Args:
+        num_texts: Number of texts
+        sentences_per_text: Sentences per text
+        noise: Probability of noise per word
+        seed: Random seed
+
+    Returns:
+        List of texts
+    """
+    lexicon = _lexicon()
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(num_texts):
+        words = []
+        for _ in range(sentences_per_text):
+            for word, tag in _tagged_sentence(rng, lexicon):
+                if tag == 'PUNC' and words:
+                    words[-1] += word
+                    continue
+                if rng.random() < noise:
+                    kind = rng.random()
+                    if kind < 0.4:
+                        word = word.translate(_ARABIC_VARIANTS)
+                    elif kind < 0.6:
+                        word += 'َ'
+                    else:
+                        words.append(rng.choice(_NOISE))
+                words.append(word)
+        texts.append(' '.join(words))
+    return texts
+
+
+def generate_labeled_texts(num_texts: int, seed: int = 0) -> Tuple[List[str], List[str]]:
+    """
+    Generate texts labelled 'positive' or 'negative' by their sentiment words.
+
+    Args:
+        num_texts: Number of texts
+        seed: Random seed
+
+    Returns:
+        Tuple of (texts, labels)
+    """
+    from bidnlp.classification import PersianSentimentAnalyzer
+
+    positive = sorted(PersianSentimentAnalyzer.DEFAULT_POSITIVE_KEYWORDS)
+    negative = sorted(PersianSentimentAnalyzer.DEFAULT_NEGATIVE_KEYWORDS)
+    texts = generate_texts(num_texts, sentences_per_text=2, noise=0.0, seed=seed)
+    rng = random.Random(seed + 1)
+    labels = []
+    for i, text in enumerate(texts):
+        label = rng.choice(['positive', 'negative'])
+        pool = positive if label == 'positive' else negative
+        texts[i] = f"{text} {' '.join(rng.choices(pool, k=3))}"
+        labels.append(label)
+    return texts, labels
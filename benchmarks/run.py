@@ -0,0 +1,408 @@
+"""
+Benchmark suite: public entry points of every subsystem
+
+Measures throughput, per-call latency and peak traced memory of the public
+entry points of preprocessing, tokenization, stemming, lemmatization, POS
+tagging, classification and utils, at several input sizes, on reproducible
+synthetic corpora built from the package's lexicons (see corpus.py).
+
+Each benchmark case is run once to warm up, then ``--repeat`` times for
+timing. Per-item entry points (e.g. ``PersianStemmer.stem``) are also timed
+call by call to get latency percentiles; batch entry points report the mean
+latency per item. Memory is measured in a separate run under tracemalloc,
+which slows Python down.
+
+Results are written as JSON and can be compared across commits with
+compare.py.
+
+Usage:
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --sizes 100,1000 --filter stem,hmm --repeat 10
+    python benchmarks/run.py --list
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import bidnlp
+from bidnlp.classification import (
+    HashingVectorizer, KeywordClassifier, LinearClassifier, MinHash,
+    NaiveBayesClassifier, PersianSentimentAnalyzer, SimilaritySearch, TfidfVectorizer,
+)
+from bidnlp.lemmatization import PersianLemmatizer
+from bidnlp.pos import HMMPOSTagger, RuleBasedPOSTagger
+from bidnlp.preprocessing import (
+    Pipeline, PersianNormalizer, PersianNumberNormalizer,
+    PersianPunctuationNormalizer, PersianTextCleaner,
+)
+from bidnlp.stemming import PersianStemmer
+from bidnlp.tokenization import (
+    PersianMorphemeTokenizer, PersianSentenceTokenizer, PersianSyllableTokenizer,
+    PersianWordTokenizer,
+)
+from bidnlp.utils import PersianStopWords
+
+from corpus import generate_labeled_texts, generate_tagged_sentences, generate_texts
+
+
+class Case(NamedTuple):
+    """A prepared benchmark: ``func`` on each of ``items``, or on the whole list if ``batch``."""
+    func: Callable
+    items: List[Any]
+    batch: bool = False
+
+
+class Benchmark(NamedTuple):
+    name: str
+    unit: str
+    setup: Callable[[int, int], Case]
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, unit: str):
+    """Register a setup function ``(size, seed) -> Case``."""
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, unit, setup))
+        return setup
+    return register
+
+
+def _words(size: int, seed: int) -> List[str]:
+    """Tokens of generated texts, at least ``size`` of them."""
+    tokenizer = PersianWordTokenizer()
+    words = []
+    texts = generate_texts(size, seed=seed)
+    for text in texts:
+        words.extend(token for token in tokenizer.tokenize(text) if token.isalpha())
+        if len(words) >= size:
+            break
+    return words[:size]
+
+
+# Preprocessing
+
+@benchmark('preprocessing.normalize', 'texts')
+def _(size, seed):
+    return Case(PersianNormalizer().normalize, generate_texts(size, seed=seed))
+
+
+@benchmark('preprocessing.clean', 'texts')
+def _(size, seed):
+    cleaner = PersianTextCleaner(remove_urls=True, remove_emails=True, remove_emojis=True)
+    return Case(cleaner.clean, generate_texts(size, seed=seed))
+
+
+@benchmark('preprocessing.punctuation', 'texts')
+def _(size, seed):
+    return Case(PersianPunctuationNormalizer().normalize, generate_texts(size, seed=seed))
+
+
+@benchmark('preprocessing.digits', 'texts')
+def _(size, seed):
+    numbers = PersianNumberNormalizer()
+    return Case(numbers.normalize_digits, generate_texts(size, seed=seed))
+
+
+@benchmark('preprocessing.pipeline', 'texts')
+def _(size, seed):
+    pipeline = Pipeline(['clean', 'normalize', 'digits', 'punctuation', 'tokenize'])
+    return Case(pipeline.run, generate_texts(size, seed=seed))
+
+
+# Tokenization
+
+@benchmark('tokenization.word', 'texts')
+def _(size, seed):
+    return Case(PersianWordTokenizer().tokenize, generate_texts(size, seed=seed))
+
+
+@benchmark('tokenization.sentence', 'texts')
+def _(size, seed):
+    return Case(PersianSentenceTokenizer().tokenize, generate_texts(size, seed=seed))
+
+
+@benchmark('tokenization.syllable', 'words')
+def _(size, seed):
+    return Case(PersianSyllableTokenizer().tokenize, _words(size, seed))
+
+
+@benchmark('tokenization.morpheme', 'words')
+def _(size, seed):
+    return Case(PersianMorphemeTokenizer().tokenize, _words(size, seed))
+
+
+# Stemming and lemmatization
+
+@benchmark('stemming.stem', 'words')
+def _(size, seed):
+    return Case(PersianStemmer().stem, _words(size, seed))
+
+
+@benchmark('lemmatization.lemmatize', 'words')
+def _(size, seed):
+    return Case(PersianLemmatizer().lemmatize, _words(size, seed))
+
+
+# POS tagging
+
+@benchmark('pos.rule_based.tag', 'texts')
+def _(size, seed):
+    return Case(RuleBasedPOSTagger().tag, generate_texts(size, sentences_per_text=1, seed=seed))
+
+
+@benchmark('pos.hmm.tag', 'texts')
+def _(size, seed):
+    tagger = HMMPOSTagger()
+    tagger.train(generate_tagged_sentences(1000, seed=seed + 1))
+    return Case(tagger.tag, generate_texts(size, sentences_per_text=1, noise=0.0, seed=seed))
+
+
+@benchmark('pos.hmm.train', 'sentences')
+def _(size, seed):
+    return Case(lambda sentences: HMMPOSTagger().train(sentences),
+                generate_tagged_sentences(size, seed=seed), batch=True)
+
+
+# Classification
+
+def _labeled(size: int, seed: int):
+    return generate_labeled_texts(size, seed=seed)
+
+
+@benchmark('classification.naive_bayes.train', 'texts')
+def _(size, seed):
+    texts, labels = _labeled(size, seed)
+    return Case(lambda texts: NaiveBayesClassifier().train(texts, labels), texts, batch=True)
+
+
+@benchmark('classification.naive_bayes.predict_batch', 'texts')
+def _(size, seed):
+    classifier = NaiveBayesClassifier()
+    classifier.train(*_labeled(500, seed + 1))
+    return Case(classifier.predict_batch, _labeled(size, seed)[0], batch=True)
+
+
+@benchmark('classification.linear.train', 'texts')
+def _(size, seed):
+    texts, labels = _labeled(size, seed)
+    return Case(lambda texts: LinearClassifier().train(texts, labels), texts, batch=True)
+
+
+@benchmark('classification.linear.predict_batch', 'texts')
+def _(size, seed):
+    classifier = LinearClassifier()
+    classifier.train(*_labeled(500, seed + 1))
+    return Case(classifier.predict_batch, _labeled(size, seed)[0], batch=True)
+
+
+@benchmark('classification.keyword.predict', 'texts')
+def _(size, seed):
+    classifier = KeywordClassifier()
+    classifier.train(*_labeled(500, seed + 1))
+    return Case(classifier.predict, _labeled(size, seed)[0])
+
+
+@benchmark('classification.sentiment.analyze', 'texts')
+def _(size, seed):
+    return Case(PersianSentimentAnalyzer().analyze, _labeled(size, seed)[0])
+
+
+@benchmark('classification.sentiment.analyze_batch', 'texts')
+def _(size, seed):
+    return Case(PersianSentimentAnalyzer().analyze_batch, _labeled(size, seed)[0], batch=True)
+
+
+@benchmark('classification.tfidf.fit', 'texts')
+def _(size, seed):
+    return Case(lambda texts: TfidfVectorizer().fit(texts), generate_texts(size, seed=seed), batch=True)
+
+
+@benchmark('classification.tfidf.transform', 'texts')
+def _(size, seed):
+    vectorizer = TfidfVectorizer().fit(generate_texts(500, seed=seed + 1))
+    return Case(vectorizer.transform, generate_texts(size, seed=seed), batch=True)
+
+
+@benchmark('classification.hashing.transform', 'texts')
+def _(size, seed):
+    vectorizer = HashingVectorizer(n_features=2 ** 18)
+    return Case(lambda texts: vectorizer.transform(texts, output='csr'),
+                generate_texts(size, seed=seed), batch=True)
+
+
+@benchmark('classification.minhash.signatures', 'texts')
+def _(size, seed):
+    return Case(MinHash().signatures, generate_texts(size, seed=seed), batch=True)
+
+
+@benchmark('classification.similarity.query', 'queries')
+def _(size, seed):
+    texts = generate_texts(size, seed=seed)
+    vectors = TfidfVectorizer().fit_transform(texts, output='csr')
+    search = SimilaritySearch().fit(vectors)
+    queries = vectors.to_dicts()[:100]
+    return Case(lambda queries: search.query(queries, k=10), queries, batch=True)
+
+
+# Utils
+
+@benchmark('utils.stopwords.filter_tokens_batch', 'texts')
+def _(size, seed):
+    tokenizer = PersianWordTokenizer()
+    token_lists = [tokenizer.tokenize(text) for text in generate_texts(size, seed=seed)]
+    return Case(PersianStopWords().filter_tokens_batch, token_lists, batch=True)
+
+
+def _run_once(case: Case) -> None:
+    if case.batch:
+        case.func(case.items)
+    else:
+        func = case.func
+        for item in case.items:
+            func(item)
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Percentile of sorted values by the nearest-rank method."""
+    index = max(0, min(len(values) - 1, int(round(q / 100.0 * len(values))) - 1))
+    return values[index]
+
+
+def measure(case: Case, repeat: int, trace_memory: bool) -> Dict[str, Any]:
+    """
+    Time a prepared case and optionally trace its peak memory.
+
+    Args:
+        case: Prepared benchmark case
+        repeat: Number of timed runs
+        trace_memory: Also record the peak traced memory of one run
+
+    Returns:
+        Dict of measurements
+    """
+    n = len(case.items)
+    _run_once(case)  # warm up caches and lazily built state
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _run_once(case)
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    result = {
+        'items': n,
+        'repeat': repeat,
+        'median_s': median,
+        'min_s': min(times),
+        'max_s': max(times),
+        'throughput': n / median if median > 0 else float('inf'),
+        'mean_latency_us': median / n * 1e6 if n else 0.0,
+    }
+
+    if not case.batch and n:
+        latencies = []
+        func = case.func
+        perf_counter = time.perf_counter
+        for item in case.items:
+            start = perf_counter()
+            func(item)
+            latencies.append(perf_counter() - start)
+        latencies.sort()
+        for q in (50, 95, 99):
+            result[f'p{q}_latency_us'] = _percentile(latencies, q) * 1e6
+
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        _run_once(case)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result['peak_memory_kib'] = peak / 1024
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def select(patterns: List[str]) -> List[Benchmark]:
+    """Select the benchmarks whose name contains any of the patterns."""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [bench for bench in BENCHMARKS if any(p in bench.name for p in patterns)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='10,100,1000',
+                        help='comma-separated input sizes (items per case)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case')
+    parser.add_argument('--filter', default='', help='comma-separated substrings of benchmark names')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs')
+    parser.add_argument('--output', help='write JSON results to this file')
+    parser.add_argument('--list', action='store_true', help='list the benchmarks and exit')
+    args = parser.parse_args()
+
+    benchmarks = select([p for p in args.filter.split(',') if p])
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name} ({bench.unit})")
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = []
+    print(f"{'benchmark':<44}{'size':>7}{'median (s)':>12}{'items/s':>12}"
+          f"{'p50 (us)':>10}{'p99 (us)':>10}{'peak KiB':>10}")
+    for bench in benchmarks:
+        for size in sizes:
+            case = bench.setup(size, args.seed)
+            result = measure(case, args.repeat, trace_memory=not args.no_memory)
+            result.update(name=bench.name, unit=bench.unit, size=size)
+            results.append(result)
+            p50 = result.get('p50_latency_us', result['mean_latency_us'])
+            p99 = result.get('p99_latency_us')
+            peak = result.get('peak_memory_kib')
+            print(f"{bench.name:<44}{size:>7}{result['median_s']:>12.4f}{result['throughput']:>12.0f}"
+                  f"{p50:>10.1f}{'' if p99 is None else f'{p99:.1f}':>10}"
+                  f"{'' if peak is None else f'{peak:.0f}':>10}")
+
+    if args.output:
+        report = {
+            'meta': {
+                'commit': _git_commit(),
+                'bidnlp_version': bidnlp.__version__,
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                'argv': sys.argv[1:],
+                'sizes': sizes,
+                'repeat': args.repeat,
+                'seed': args.seed,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {len(results)} results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,22 +4,48 @@ Classification module for Persian text
 This module provides text classification tools:
 - BaseTextClassifier: Base class for classifiers
 - PersianSentimentAnalyzer: Sentiment analysis
+- SentimentBatchResult: Columnar results of batch sentiment analysis
 - KeywordClassifier: Keyword-based classification
+- KeywordMatcher: Multi-pattern keyword and phrase matching
+- NaiveBayesClassifier: Multinomial Naive Bayes on sparse features
+- LinearClassifier: SGD-trained logistic regression / linear SVM on sparse features
 - BagOfWords: Bag of Words feature extraction
 - TfidfVectorizer: TF-IDF feature extraction
 - NgramExtractor: N-gram feature extraction
+- HashingVectorizer: Stateless feature-hashing extraction
+- PersianAnalyzer: Normalize/tokenize/filter/stem pipeline for the extractors
+- CSRMatrix: Compact sparse matrix output of the feature extractors
+- SimilaritySearch: Top-k cosine similarity search and deduplication
+- MinHash, LSHIndex: Near-duplicate detection with MinHash signatures
 """
 
 from .base_classifier import BaseTextClassifier
-from .sentiment_analyzer import PersianSentimentAnalyzer
+from .sentiment_analyzer import PersianSentimentAnalyzer, SentimentBatchResult
 from .keyword_classifier import KeywordClassifier
-from .feature_extraction import BagOfWords, TfidfVectorizer, NgramExtractor
+from .keyword_matcher import KeywordMatcher
+from .naive_bayes import NaiveBayesClassifier
+from .linear import LinearClassifier
+from .feature_extraction import BagOfWords, TfidfVectorizer, NgramExtractor, HashingVectorizer
+from .analyzer import PersianAnalyzer
+from .sparse import CSRMatrix
+from .similarity import SimilaritySearch
+from .minhash import MinHash, LSHIndex
 
 __all__ = [
     'BaseTextClassifier',
     'PersianSentimentAnalyzer',
+    'SentimentBatchResult',
     'KeywordClassifier',
+    'KeywordMatcher',
+    'NaiveBayesClassifier',
+    'LinearClassifier',
     'BagOfWords',
     'TfidfVectorizer',
     'NgramExtractor',
+    'HashingVectorizer',
+    'PersianAnalyzer',
+    'CSRMatrix',
+    'SimilaritySearch',
+    'MinHash',
+    'LSHIndex',
 ]
@@ -0,0 +1,124 @@
+"""
+Persian Text Analyzer
+
+Provides an analysis pipeline (normalization, tokenization, stop word
+filtering and stemming) that turns a document into feature tokens for the
+feature extractors.
+"""
+
+from typing import Dict, List, Optional, Set
+
+from ..preprocessing import PersianNormalizer
+from ..stemming import PersianStemmer
+from ..tokenization import PersianWordTokenizer
+from ..utils import PersianStopWords
+
+# Cache marker for tokens that are removed (stop words)
+_REMOVED = ''
+
+
+class PersianAnalyzer:
+    """
+    Callable analysis pipeline for Persian documents.
+
+    Normalization and tokenization run once per document. Stop word filtering
+    and stemming run once per distinct token: their results are cached, so
+    frequent words are analyzed only the first time they are seen.
+
+    Pass an instance as the ``analyzer`` of a feature extractor::
+
+        tfidf = TfidfVectorizer(analyzer=PersianAnalyzer(stem=True))
+    """
+
+    def __init__(self,
+                 normalize: bool = True,
+                 tokenize: bool = True,
+                 remove_stopwords: bool = False,
+                 stem: bool = False,
+                 stopwords: Optional[Set[str]] = None,
+                 cache_size: int = 100000):
+        """
+        Initialize the analyzer.
+
+        Args:
+            normalize: Normalize documents with PersianNormalizer
+            tokenize: Tokenize with PersianWordTokenizer (whitespace split if False)
+            remove_stopwords: Drop stop words
+            stem: Stem tokens with PersianStemmer
+            stopwords: Stop word set (defaults to PersianStopWords defaults)
+            cache_size: Maximum number of distinct tokens kept in the cache
+        """
+        self.normalize = normalize
+        self.tokenize = tokenize
+        self.remove_stopwords = remove_stopwords
+        self.stem = stem
+        self.cache_size = cache_size
+
+        # ZWNJ insertion is left off: it would split words such as
+        # 'دانشگاه' once the tokenizer breaks tokens at ZWNJ
+        self.normalizer = PersianNormalizer(normalize_zwnj=False) if normalize else None
+        self.tokenizer = PersianWordTokenizer() if tokenize else None
+        self.stemmer = PersianStemmer() if stem else None
+
+        if not remove_stopwords:
+            self.stopwords = frozenset()
+        elif stopwords is not None:
+            self.stopwords = frozenset(stopwords)
+        else:
+            self.stopwords = PersianStopWords.get_shared_stopwords()
+
+        self._cache: Dict[str, str] = {}
+
+    def analyze_token(self, token: str) -> Optional[str]:
+        """
+        Analyze a single token (without caching).
+
+        Args:
+            token: Input token
+
+        Returns:
+            Feature term, or None if the token is removed
+        """
+        if token in self.stopwords:
+            return None
+        if self.stemmer is not None:
+            token = self.stemmer.stem(token)
+        return token or None
+
+    def __call__(self, doc: str) -> List[str]:
+        """
+        Analyze a document into feature tokens.
+
+        Args:
+            doc: Input document
+
+        Returns:
+            List of feature tokens
+        """
+        if self.normalizer is not None:
+            doc = self.normalizer.normalize(doc)
+
+        if self.tokenizer is not None:
+            tokens = self.tokenizer.tokenize(doc)
+        else:
+            tokens = doc.split()
+
+        if not self.stopwords and self.stemmer is None:
+            return tokens
+
+        cache = self._cache
+        terms = []
+        for token in tokens:
+            term = cache.get(token)
+            if term is None:
+                term = self.analyze_token(token) or _REMOVED
+                if len(cache) < self.cache_size:
+                    cache[token] = term
+            if term:
+                terms.append(term)
+
+        return terms
+
+    def clear_cache(self) -> None:
+        """Clear the per-token cache."""
+        self._cache.clear()
@@ -11,6 +11,10 @@ from abc import ABC, abstractmethod
 class BaseTextClassifier(ABC):
     """Base class for text classifiers."""
 
+    # Normalizer and shared stop word set, created on first use and reused across calls
+    _normalizer = None
+    _stopwords = None
+
     def __init__(self, normalize: bool = True, remove_stopwords: bool = False):
         """
         Initialize the base classifier.
@@ -40,17 +44,21 @@ class BaseTextClassifier(ABC):
 
         if self.normalize:
             try:
-                from ..preprocessing import PersianNormalizer
-                normalizer = PersianNormalizer()
-                processed_text = normalizer.normalize(processed_text)
+                if self._normalizer is None:
+                    from ..preprocessing import PersianNormalizer
+                    self._normalizer = PersianNormalizer()
+                processed_text = self._normalizer.normalize(processed_text)
             except ImportError:
                 pass
 
         if self.remove_stopwords:
             try:
-                from ..utils import PersianStopWords
-                stopwords = PersianStopWords()
-                processed_text = stopwords.remove_stopwords(processed_text)
+                if self._stopwords is None:
+                    from ..utils import PersianStopWords
+                    self._stopwords = PersianStopWords.get_shared_stopwords()
+                stopwords = self._stopwords
+                processed_text = ' '.join([word for word in processed_text.split()
+                                           if word not in stopwords])
             except ImportError:
                 pass
 
@@ -115,33 +123,36 @@ class BaseTextClassifier(ABC):
         """
         return self._is_trained
 
-    def evaluate(self, texts: List[str], true_labels: List[str]) -> Dict[str, float]:
+    def evaluate(self, texts: List[str], true_labels: List[str],
+                 chunksize: int = 1000) -> Dict[str, float]:
         """
         Evaluate classifier performance.
 
+        Predictions are made with ``predict_batch`` one chunk at a time and
+        counted into a streaming confusion matrix.
+
         Args:
             texts: List of test texts
             true_labels: List of true labels
+            chunksize: Number of texts predicted at a time
 
         Returns:
             Dictionary with evaluation metrics
         """
         if not self.is_trained():
             raise ValueError("Classifier must be trained before evaluation")
+        if len(texts) != len(true_labels):
+            raise ValueError("Predicted and actual lists must have the same length")
 
-        predicted_labels = self.predict_batch(texts)
-
-        # Calculate accuracy
-        correct = sum(1 for pred, true in zip(predicted_labels, true_labels) if pred == true)
-        accuracy = correct / len(true_labels) if true_labels else 0.0
-
-        # Calculate per-class metrics
-        from ..utils import PersianTextMetrics
-        report = PersianTextMetrics.classification_report(predicted_labels, true_labels)
+        from ..utils import ConfusionMatrix
+        cm = ConfusionMatrix()
+        for start in range(0, len(texts), chunksize):
+            end = start + chunksize
+            cm.update(self.predict_batch(texts[start:end]), true_labels[start:end])
 
         return {
-            'accuracy': accuracy,
-            'classification_report': report
+            'accuracy': cm.accuracy(),
+            'classification_report': cm.report()
         }
 
     def get_params(self) -> Dict[str, Any]:
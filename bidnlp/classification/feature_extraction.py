@@ -4,338 +4,603 @@ Feature Extraction for Persian Text
 Provides feature extraction methods for text classification.
 """
 
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
 from collections import defaultdict, Counter
+from operator import itemgetter
+import copy
+import heapq
 import math
+import zlib
 
+from .sparse import CSRMatrix
+from ..utils.parallel import map_chunks, resolve_n_jobs
+
+
+def _ngrams(words: List[str], min_n: int, max_n: int) -> List[str]:
+    """
+    Extract the space-joined n-grams of every order in [min_n, max_n].
+
+    Each order is built from the previous one: an n-gram extends the
+    (n-1)-gram starting at the same position, so no word slices are built
+    and re-joined.
+    """
+    ngrams = list(words) if min_n == 1 else []
+    grams = words
+    for n in range(2, max_n + 1):
+        grams = [f'{gram} {word}' for gram, word in zip(grams, words[n - 1:])]
+        if n >= min_n:
+            ngrams.extend(grams)
+    return ngrams
+
+
+def _ngram_tuples(words: List, min_n: int, max_n: int) -> List[tuple]:
+    """Extract the n-grams of every order in [min_n, max_n] as tuples."""
+    ngrams = []
+    for n in range(min_n, max_n + 1):
+        ngrams.extend(zip(*[words[k:] for k in range(n)]))
+    return ngrams
+
+
+def saved_vectorizer(vectorizer):
+    """
+    Get the part of a vectorizer a saved model needs.
+
+    For the feature extractors of this module that is a copy with the
+    fitted vocabulary and statistics but none of the running counts; other
+    vectorizers are returned as is.
+    """
+    fitted_copy = getattr(vectorizer, 'fitted_copy', None)
+    return fitted_copy() if fitted_copy is not None else vectorizer
+
+
+def _transform_chunk(extractor: '_BaseVectorizer', documents: List[str]) -> CSRMatrix:
+    """Transform one chunk of documents in a worker process."""
+    return extractor.transform(documents, output='csr')
 
-class BagOfWords:
-    """Bag of Words feature extractor."""
 
-    def __init__(self, max_features: Optional[int] = None, min_df: int = 1):
+class _BaseVectorizer:
+    """Shared fit and transform logic for the feature extractors."""
+
+    # Array typecode of the produced values ('q' for counts, 'd' for weights)
+    _dtype = 'q'
+
+    # Running counts kept between partial_fit calls
+    _term_counts: Optional[Counter] = None
+    _doc_freq: Optional[Counter] = None
+    _needs_finalize = False
+    num_documents = 0
+    analyzer: Optional[Callable[[str], List[str]]] = None
+
+    def _tokenize(self, doc: str) -> List[str]:
+        """Split a document into tokens with the analyzer (whitespace by default)."""
+        if self.analyzer is not None:
+            return self.analyzer(doc)
+        return doc.split()
+
+    def _features(self, doc: str) -> List[str]:
+        """Extract the feature keys of one document."""
+        return self._tokenize(doc)
+
+    def _vectorize(self, doc: str) -> List[Tuple[int, float]]:
+        """Return the (feature index, value) pairs of one document."""
+        vocabulary = self.vocabulary
+        return [(vocabulary[feature], count)
+                for feature, count in Counter(self._features(doc)).items()
+                if feature in vocabulary]
+
+    def _num_features(self) -> int:
+        """Number of columns of the produced vectors."""
+        return len(self.vocabulary)
+
+    def _build(self, vocabulary_features: List[str]) -> None:
+        """Build the fitted state from the selected vocabulary."""
+        self.vocabulary = {feature: idx for idx, feature in enumerate(vocabulary_features)}
+
+    def _update_counts(self, documents: Iterable[str]) -> None:
         """
-        Initialize Bag of Words extractor.
+        Update term and document frequencies in a single pass.
+
+        Each document is split once; the same token list feeds both counters.
 
         Args:
-            max_features: Maximum number of features to extract
-            min_df: Minimum document frequency for a word to be included
+            documents: Iterable of text documents
         """
-        self.max_features = max_features
-        self.min_df = min_df
-        self.vocabulary = {}
-        self.document_frequency = defaultdict(int)
-        self._is_fitted = False
+        term_counts = self._term_counts
+        doc_freq = self._doc_freq
+        num_documents = 0
 
-    def fit(self, documents: List[str]) -> 'BagOfWords':
+        for doc in documents:
+            features = self._features(doc)
+            term_counts.update(features)
+            doc_freq.update(set(features))
+            num_documents += 1
+
+        self.num_documents += num_documents
+        self._needs_finalize = True
+
+    def _select_vocabulary(self, term_counts: Counter, doc_freq: Counter) -> List[str]:
+        """
+        Apply ``min_df`` and ``max_features`` to the counted terms.
+
+        Args:
+            term_counts: Total count of every term
+            doc_freq: Document frequency of every term
+
+        Returns:
+            Vocabulary terms in index order
+        """
+        min_df = self.min_df
+        candidates = ((term, count) for term, count in term_counts.items()
+                      if doc_freq[term] >= min_df)
+
+        if self.max_features:
+            # Same order as a stable sort by count, without sorting everything
+            top_terms = heapq.nlargest(self.max_features, candidates, key=itemgetter(1))
+            return [term for term, _ in top_terms]
+
+        return sorted(term for term, _ in candidates)
+
+    def fit(self, documents: Iterable[str]) -> '_BaseVectorizer':
         """
         Fit the vocabulary from documents.
 
         Args:
-            documents: List of text documents
+            documents: Iterable of text documents (consumed once)
+
+        Only the fitted state is kept: the counts of the whole corpus, which
+        include the pruned terms, are dropped once the vocabulary is built.
 
         Returns:
             Self
         """
-        # Count word frequencies across documents
-        word_docs = defaultdict(set)
-        all_words = Counter()
+        self._term_counts = Counter()
+        self._doc_freq = Counter()
+        self.num_documents = 0
+        return self.partial_fit(documents).finalize(keep_counts=False)
 
-        for doc_id, doc in enumerate(documents):
-            words = doc.split()
-            all_words.update(words)
-            for word in set(words):
-                word_docs[word].add(doc_id)
+    def partial_fit(self, documents: Iterable[str]) -> '_BaseVectorizer':
+        """
+        Update the running counts with more documents.
 
-        # Filter by document frequency
-        valid_words = {word for word, docs in word_docs.items()
-                      if len(docs) >= self.min_df}
+        Any iterable or generator is accepted. The running term and document
+        frequencies are kept so that calls can be repeated over a stream; the
+        vocabulary is rebuilt by ``finalize``, which ``transform`` calls on
+        demand. Feature indices may change after further ``partial_fit`` calls.
+        ``fit`` and ``finalize(keep_counts=False)`` drop the counts, so a
+        vectorizer fitted that way cannot be updated further.
 
-        # Get most common words
-        if self.max_features:
-            word_counts = {word: count for word, count in all_words.items()
-                          if word in valid_words}
-            top_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-            vocabulary_words = [word for word, _ in top_words[:self.max_features]]
-        else:
-            vocabulary_words = sorted(valid_words)
-
-        # Create vocabulary mapping
-        self.vocabulary = {word: idx for idx, word in enumerate(vocabulary_words)}
-        self.document_frequency = {word: len(word_docs[word]) for word in vocabulary_words}
-        self._is_fitted = True
+        Args:
+            documents: Iterable of text documents (consumed once)
 
+        Returns:
+            Self
+
+        Raises:
+            ValueError: If the vectorizer was fitted without keeping its counts
+        """
+        if self._term_counts is None:
+            if self._is_fitted:
+                raise ValueError(
+                    f"{type(self).__name__} was fitted without its running counts; "
+                    "use partial_fit and finalize() to keep updating it")
+            self._term_counts = Counter()
+            self._doc_freq = Counter()
+            self.num_documents = 0
+
+        self._update_counts(documents)
+        self._is_fitted = True
         return self
 
-    def transform(self, documents: List[str]) -> List[Dict[int, int]]:
+    def finalize(self, keep_counts: bool = True) -> '_BaseVectorizer':
         """
-        Transform documents to BoW vectors.
+        Build the vocabulary from the running counts.
 
         Args:
-            documents: List of text documents
+            keep_counts: Keep the running counts so that ``partial_fit`` can
+                continue. With False they are dropped, which keeps a saved or
+                pickled vectorizer down to its vocabulary and statistics.
 
         Returns:
-            List of sparse vectors (dict mapping feature index to count)
+            Self
         """
+        if self._needs_finalize:
+            self._build(self._select_vocabulary(self._term_counts, self._doc_freq))
+            self._needs_finalize = False
+        if not keep_counts:
+            self._term_counts = None
+            self._doc_freq = None
+        return self
+
+    def _check_transform(self, output: str) -> None:
+        """Validate the output format and make sure the state is final."""
+        if output not in ('dict', 'csr'):
+            raise ValueError(f"Unknown output format: {output!r} (use 'dict' or 'csr')")
         if not self._is_fitted:
-            raise ValueError("BagOfWords must be fitted before transform")
+            raise ValueError(f"{type(self).__name__} must be fitted before transform")
+        self.finalize()
+
+    def transform(self, documents: Iterable[str], output: str = 'dict',
+                  n_jobs: Optional[int] = 1,
+                  chunksize: int = 1000) -> Union[List[Dict[int, float]], CSRMatrix]:
+        """
+        Transform documents to sparse vectors.
+
+        Args:
+            documents: Iterable of text documents
+            output: 'dict' for a list of dicts, 'csr' for a CSRMatrix
+            n_jobs: Number of worker processes (1 for serial, -1 for all CPUs)
+            chunksize: Number of documents sent to a worker at a time
+
+        Returns:
+            List of sparse vectors (dict mapping feature index to value),
+            or a CSRMatrix with one row per document
+        """
+        self._check_transform(output)
+
+        if resolve_n_jobs(n_jobs) > 1:
+            # The fitted state reaches each worker once; chunks come back as
+            # CSR buffers, which pickle as flat bytes
+            matrix = CSRMatrix(n_features=self._num_features(), dtype=self._dtype)
+            chunks = map_chunks(_transform_chunk, self.fitted_copy(), documents,
+                                n_jobs=n_jobs, chunksize=chunksize)
+            matrix = CSRMatrix.vstack([matrix] + list(chunks))
+            return matrix.to_dicts() if output == 'dict' else matrix
 
-        vectors = []
+        if output == 'dict':
+            return [dict(self._vectorize(doc)) for doc in documents]
+
+        matrix = CSRMatrix(n_features=self._num_features(), dtype=self._dtype)
         for doc in documents:
-            words = doc.split()
-            vector = defaultdict(int)
+            matrix.append_row(sorted(self._vectorize(doc)))
+        return matrix
+
+    def fitted_copy(self) -> '_BaseVectorizer':
+        """
+        Get a shallow copy holding only the fitted state.
 
-            for word in words:
-                if word in self.vocabulary:
-                    idx = self.vocabulary[word]
-                    vector[idx] += 1
+        The copy has no running counts, so it is cheap to send to worker
+        processes or to save with a model. This vectorizer keeps its counts.
 
-            vectors.append(dict(vector))
+        Returns:
+            Finalized copy of this vectorizer
+        """
+        self.finalize()
+        fitted = copy.copy(self)
+        fitted._term_counts = None
+        fitted._doc_freq = None
+        return fitted
+
+    def transform_iter(self, documents: Iterable[str], output: str = 'dict',
+                       chunksize: int = 1000) -> Iterator[Union[Dict[int, float], CSRMatrix]]:
+        """
+        Lazily transform a stream of documents.
 
-        return vectors
+        Only the current chunk is held in memory, so a corpus read from disk
+        can be vectorized in bounded memory.
 
-    def fit_transform(self, documents: List[str]) -> List[Dict[int, int]]:
+        Args:
+            documents: Iterable of text documents
+            output: 'dict' to yield one vector per document, 'csr' to yield
+                one CSRMatrix per chunk of ``chunksize`` documents
+            chunksize: Number of documents per CSRMatrix chunk
+
+        Yields:
+            Sparse vectors or CSRMatrix chunks
+        """
+        self._check_transform(output)
+
+        if output == 'dict':
+            for doc in documents:
+                yield dict(self._vectorize(doc))
+            return
+
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+
+        n_features = self._num_features()
+        matrix = CSRMatrix(n_features=n_features, dtype=self._dtype)
+        for doc in documents:
+            matrix.append_row(sorted(self._vectorize(doc)))
+            if len(matrix) == chunksize:
+                yield matrix
+                matrix = CSRMatrix(n_features=n_features, dtype=self._dtype)
+        if len(matrix):
+            yield matrix
+
+    def fit_transform(self, documents: List[str], output: str = 'dict',
+                      n_jobs: Optional[int] = 1,
+                      chunksize: int = 1000) -> Union[List[Dict[int, float]], CSRMatrix]:
         """
         Fit and transform documents.
 
         Args:
             documents: List of text documents
+            output: 'dict' for a list of dicts, 'csr' for a CSRMatrix
+            n_jobs: Number of worker processes used by transform
+            chunksize: Number of documents sent to a worker at a time
 
         Returns:
-            List of sparse vectors
+            Sparse vectors in the requested format
         """
         self.fit(documents)
-        return self.transform(documents)
+        return self.transform(documents, output=output, n_jobs=n_jobs, chunksize=chunksize)
 
     def get_feature_names(self) -> List[str]:
-        """Get feature names (words in vocabulary)."""
+        """Get feature names (vocabulary entries ordered by index)."""
         if not self._is_fitted:
             return []
-        # Sort by index
+        self.finalize()
         sorted_vocab = sorted(self.vocabulary.items(), key=lambda x: x[1])
-        return [word for word, idx in sorted_vocab]
+        return [feature for feature, idx in sorted_vocab]
 
 
-class TfidfVectorizer:
-    """TF-IDF feature extractor."""
+class BagOfWords(_BaseVectorizer):
+    """Bag of Words feature extractor."""
 
-    def __init__(self, max_features: Optional[int] = None, min_df: int = 1):
+    def __init__(self, max_features: Optional[int] = None, min_df: int = 1,
+                 analyzer: Optional[Callable[[str], List[str]]] = None):
         """
-        Initialize TF-IDF vectorizer.
+        Initialize Bag of Words extractor.
 
         Args:
-            max_features: Maximum number of features
-            min_df: Minimum document frequency
+            max_features: Maximum number of features to extract
+            min_df: Minimum document frequency for a word to be included
+            analyzer: Callable turning a document into tokens (e.g. a
+                PersianAnalyzer); whitespace split if None
         """
         self.max_features = max_features
         self.min_df = min_df
+        self.analyzer = analyzer
         self.vocabulary = {}
-        self.idf = {}
-        self.num_documents = 0
+        self.document_frequency = defaultdict(int)
         self._is_fitted = False
 
-    def fit(self, documents: List[str]) -> 'TfidfVectorizer':
-        """
-        Fit IDF from documents.
+    def _build(self, vocabulary_words: List[str]) -> None:
+        """Create the vocabulary mapping and document frequencies."""
+        super()._build(vocabulary_words)
+        doc_freq = self._doc_freq
+        self.document_frequency = {word: doc_freq[word] for word in vocabulary_words}
 
-        Args:
-            documents: List of text documents
 
-        Returns:
-            Self
-        """
-        self.num_documents = len(documents)
+class TfidfVectorizer(_BaseVectorizer):
+    """TF-IDF feature extractor."""
 
-        # Count document frequencies
-        word_docs = defaultdict(set)
-        all_words = Counter()
+    _dtype = 'd'
 
-        for doc_id, doc in enumerate(documents):
-            words = doc.split()
-            all_words.update(words)
-            for word in set(words):
-                word_docs[word].add(doc_id)
+    def __init__(self, max_features: Optional[int] = None, min_df: int = 1,
+                 analyzer: Optional[Callable[[str], List[str]]] = None):
+        """
+        Initialize TF-IDF vectorizer.
 
-        # Filter by document frequency
-        valid_words = {word for word, docs in word_docs.items()
-                      if len(docs) >= self.min_df}
+        Args:
+            max_features: Maximum number of features
+            min_df: Minimum document frequency
+            analyzer: Callable turning a document into tokens (e.g. a
+                PersianAnalyzer); whitespace split if None
+        """
+        self.max_features = max_features
+        self.min_df = min_df
+        self.analyzer = analyzer
+        self.vocabulary = {}
+        self.idf = {}
+        self.num_documents = 0
+        self._is_fitted = False
 
-        # Get most common words
-        if self.max_features:
-            word_counts = {word: count for word, count in all_words.items()
-                          if word in valid_words}
-            top_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-            vocabulary_words = [word for word, _ in top_words[:self.max_features]]
-        else:
-            vocabulary_words = sorted(valid_words)
-
-        # Create vocabulary and calculate IDF
-        self.vocabulary = {word: idx for idx, word in enumerate(vocabulary_words)}
+    def _build(self, vocabulary_words: List[str]) -> None:
+        """Create the vocabulary and calculate IDF."""
+        super()._build(vocabulary_words)
+        doc_freq = self._doc_freq
         self.idf = {}
 
         for word in vocabulary_words:
-            df = len(word_docs[word])
             # IDF = log(N / df) + 1
-            self.idf[word] = math.log(self.num_documents / df) + 1
+            self.idf[word] = math.log(self.num_documents / doc_freq[word]) + 1
 
-        self._is_fitted = True
-        return self
+    def _vectorize(self, doc: str) -> List[Tuple[int, float]]:
+        """Compute the L2-normalized TF-IDF weights of a document."""
+        words = self._tokenize(doc)
+        total_words = len(words)
+        vocabulary = self.vocabulary
+        idf = self.idf
 
-    def transform(self, documents: List[str]) -> List[Dict[int, float]]:
-        """
-        Transform documents to TF-IDF vectors.
+        row = []
+        for word, count in Counter(words).items():
+            if word in vocabulary:
+                # TF-IDF = (count / total_words) * IDF
+                row.append((vocabulary[word], count / total_words * idf[word]))
 
-        Args:
-            documents: List of text documents
+        # Normalize vector (L2 norm)
+        norm = math.sqrt(sum(v * v for _, v in row))
+        if norm > 0:
+            row = [(idx, v / norm) for idx, v in row]
 
-        Returns:
-            List of sparse TF-IDF vectors
-        """
-        if not self._is_fitted:
-            raise ValueError("TfidfVectorizer must be fitted before transform")
+        return row
 
-        vectors = []
-        for doc in documents:
-            words = doc.split()
-            word_counts = Counter(words)
-            total_words = len(words)
-
-            vector = {}
-            for word, count in word_counts.items():
-                if word in self.vocabulary:
-                    idx = self.vocabulary[word]
-                    # TF = count / total_words
-                    tf = count / total_words if total_words > 0 else 0
-                    # TF-IDF = TF * IDF
-                    tfidf = tf * self.idf[word]
-                    vector[idx] = tfidf
-
-            # Normalize vector (L2 norm)
-            norm = math.sqrt(sum(v * v for v in vector.values()))
-            if norm > 0:
-                vector = {k: v / norm for k, v in vector.items()}
 
-            vectors.append(vector)
-
-        return vectors
-
-    def fit_transform(self, documents: List[str]) -> List[Dict[int, float]]:
-        """
-        Fit and transform documents.
-
-        Args:
-            documents: List of text documents
-
-        Returns:
-            List of sparse TF-IDF vectors
-        """
-        self.fit(documents)
-        return self.transform(documents)
-
-    def get_feature_names(self) -> List[str]:
-        """Get feature names (words in vocabulary)."""
-        if not self._is_fitted:
-            return []
-        sorted_vocab = sorted(self.vocabulary.items(), key=lambda x: x[1])
-        return [word for word, idx in sorted_vocab]
-
-
-class NgramExtractor:
+class NgramExtractor(_BaseVectorizer):
     """N-gram feature extractor."""
 
-    def __init__(self, n: int = 2, max_features: Optional[int] = None):
+    NGRAM_TYPES = ('str', 'tuple', 'id')
+
+    def __init__(self, n: int = 2, max_features: Optional[int] = None,
+                 ngram_range: Optional[Tuple[int, int]] = None,
+                 min_df: int = 1, ngram_type: str = 'str',
+                 analyzer: Optional[Callable[[str], List[str]]] = None):
         """
         Initialize N-gram extractor.
 
         Args:
             n: Size of n-grams (2 for bigrams, 3 for trigrams, etc.)
             max_features: Maximum number of features
+            ngram_range: (min_n, max_n) to extract every order in the range
+                in one pass; overrides ``n``
+            min_df: Minimum document frequency for an n-gram to be included
+            ngram_type: Vocabulary key type: 'str' for space-joined strings,
+                'tuple' for tuples of words, 'id' for tuples of integer
+                word ids (see ``token_vocabulary``)
+            analyzer: Callable turning a document into tokens (e.g. a
+                PersianAnalyzer); whitespace split if None
         """
+        ngram_range = tuple(ngram_range) if ngram_range else (n, n)
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError("ngram_range must satisfy 1 <= min_n <= max_n")
+        if ngram_type not in self.NGRAM_TYPES:
+            raise ValueError(f"Unknown ngram_type: {ngram_type!r}")
+
         self.n = n
+        self.ngram_range = ngram_range
         self.max_features = max_features
+        self.min_df = min_df
+        self.ngram_type = ngram_type
+        self.analyzer = analyzer
         self.vocabulary = {}
+        self.token_vocabulary = {}
+        self._assign_token_ids = False
         self._is_fitted = False
 
-    def _extract_ngrams(self, text: str) -> List[str]:
-        """Extract n-grams from text."""
-        words = text.split()
-        ngrams = []
-        for i in range(len(words) - self.n + 1):
-            ngram = ' '.join(words[i:i + self.n])
-            ngrams.append(ngram)
-        return ngrams
-
-    def fit(self, documents: List[str]) -> 'NgramExtractor':
+    def _encode_words(self, words: List[str]) -> List[int]:
+        """Map words to integer ids (-1 for words unseen during fit)."""
+        token_ids = self.token_vocabulary
+        if self._assign_token_ids:
+            return [token_ids.setdefault(word, len(token_ids)) for word in words]
+        return [token_ids.get(word, -1) for word in words]
+
+    def _extract_ngrams(self, text: str) -> List:
+        """Extract n-grams of every order in ``ngram_range`` from text."""
+        words = self._tokenize(text)
+        min_n, max_n = self.ngram_range
+
+        if self.ngram_type == 'str':
+            return _ngrams(words, min_n, max_n)
+        if self.ngram_type == 'id':
+            words = self._encode_words(words)
+        return _ngram_tuples(words, min_n, max_n)
+
+    def _features(self, doc: str) -> List:
+        """Extract the n-grams of one document."""
+        return self._extract_ngrams(doc)
+
+    def _update_counts(self, documents: Iterable[str]) -> None:
+        """Count n-grams, assigning ids to new words in 'id' mode."""
+        self._assign_token_ids = True
+        try:
+            super()._update_counts(documents)
+        finally:
+            self._assign_token_ids = False
+
+    def fit(self, documents: Iterable[str]) -> 'NgramExtractor':
         """
         Fit vocabulary from documents.
 
         Args:
-            documents: List of text documents
+            documents: Iterable of text documents (consumed once)
 
         Returns:
             Self
         """
-        # Extract all n-grams
-        all_ngrams = Counter()
-        for doc in documents:
-            ngrams = self._extract_ngrams(doc)
-            all_ngrams.update(ngrams)
-
-        # Get top n-grams
-        if self.max_features:
-            top_ngrams = all_ngrams.most_common(self.max_features)
-            vocabulary_ngrams = [ngram for ngram, _ in top_ngrams]
-        else:
-            vocabulary_ngrams = sorted(all_ngrams.keys())
+        self.token_vocabulary = {}
+        return super().fit(documents)
 
-        # Create vocabulary
-        self.vocabulary = {ngram: idx for idx, ngram in enumerate(vocabulary_ngrams)}
-        self._is_fitted = True
-
-        return self
-
-    def transform(self, documents: List[str]) -> List[Dict[int, int]]:
+    def get_feature_names(self) -> List:
         """
-        Transform documents to n-gram vectors.
-
-        Args:
-            documents: List of text documents
+        Get feature names (n-grams in vocabulary).
 
         Returns:
-            List of sparse n-gram vectors
+            Strings for 'str' n-grams, tuples of words otherwise
         """
-        if not self._is_fitted:
-            raise ValueError("NgramExtractor must be fitted before transform")
+        features = super().get_feature_names()
+        if self.ngram_type != 'id':
+            return features
+
+        words = {idx: word for word, idx in self.token_vocabulary.items()}
+        return [tuple(words[idx] for idx in feature) for feature in features]
 
-        vectors = []
-        for doc in documents:
-            ngrams = self._extract_ngrams(doc)
-            vector = defaultdict(int)
 
-            for ngram in ngrams:
-                if ngram in self.vocabulary:
-                    idx = self.vocabulary[ngram]
-                    vector[idx] += 1
+class HashingVectorizer(_BaseVectorizer):
+    """
+    Feature-hashing vectorizer.
 
-            vectors.append(dict(vector))
+    Maps tokens and n-grams to a fixed number of buckets with CRC32, so no
+    vocabulary is stored and no fit is needed. The hash does not depend on
+    the process (unlike ``hash()``), so sharded workers produce identical
+    features.
+    """
 
-        return vectors
+    _dtype = 'd'
 
-    def fit_transform(self, documents: List[str]) -> List[Dict[int, int]]:
+    def __init__(self,
+                 n_features: int = 2 ** 20,
+                 ngram_range: Tuple[int, int] = (1, 1),
+                 alternate_sign: bool = True,
+                 norm: Optional[str] = 'l2',
+                 analyzer: Optional[Callable[[str], List[str]]] = None):
         """
-        Fit and transform documents.
+        Initialize hashing vectorizer.
 
         Args:
-            documents: List of text documents
-
-        Returns:
-            List of sparse n-gram vectors
+            n_features: Number of hash buckets (at most 2**31)
+            ngram_range: (min_n, max_n) range of n-gram orders to hash
+            alternate_sign: Give each feature a hash-derived sign so that
+                collisions tend to cancel out instead of accumulating
+            norm: 'l2' to L2-normalize each vector, None to keep raw counts
+            analyzer: Callable turning a document into tokens (e.g. a
+                PersianAnalyzer); whitespace split if None
         """
-        self.fit(documents)
-        return self.transform(documents)
+        if not 1 <= n_features <= 2 ** 31:
+            raise ValueError("n_features must be between 1 and 2**31")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError("ngram_range must satisfy 1 <= min_n <= max_n")
+        if norm not in ('l2', None):
+            raise ValueError(f"Unknown norm: {norm!r} (use 'l2' or None)")
+
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.alternate_sign = alternate_sign
+        self.norm = norm
+        self.analyzer = analyzer
+        self._is_fitted = True
+
+    def fit(self, documents: Iterable[str]) -> 'HashingVectorizer':
+        """No-op: the hashing vectorizer is stateless."""
+        return self
+
+    def partial_fit(self, documents: Iterable[str]) -> 'HashingVectorizer':
+        """No-op: the hashing vectorizer is stateless."""
+        return self
+
+    def _num_features(self) -> int:
+        return self.n_features
+
+    def _features(self, doc: str) -> List[str]:
+        """Extract the tokens and n-grams of one document."""
+        words = self._tokenize(doc)
+        min_n, max_n = self.ngram_range
+        if min_n == max_n == 1:
+            return words
+        return _ngrams(words, min_n, max_n)
+
+    def _vectorize(self, doc: str) -> List[Tuple[int, float]]:
+        """Hash the features of a document into buckets."""
+        n_features = self.n_features
+        alternate_sign = self.alternate_sign
+
+        buckets = defaultdict(float)
+        for feature, count in Counter(self._features(doc)).items():
+            h = zlib.crc32(feature.encode('utf-8'))
+            # Low 31 bits pick the bucket, the top bit picks the sign
+            if alternate_sign and h & 0x80000000:
+                count = -count
+            buckets[(h & 0x7FFFFFFF) % n_features] += count
+
+        row = [(idx, value) for idx, value in buckets.items() if value != 0]
+
+        if self.norm == 'l2':
+            norm = math.sqrt(sum(v * v for _, v in row))
+            if norm > 0:
+                row = [(idx, v / norm) for idx, v in row]
+
+        return row
 
     def get_feature_names(self) -> List[str]:
-        """Get feature names (n-grams in vocabulary)."""
-        if not self._is_fitted:
-            return []
-        sorted_vocab = sorted(self.vocabulary.items(), key=lambda x: x[1])
-        return [ngram for ngram, idx in sorted_vocab]
+        """Hashed features have no names; always returns an empty list."""
+        return []
@@ -4,18 +4,36 @@ Keyword-Based Text Classifier
 Provides keyword-based text classification for Persian text.
 """
 
-from typing import List, Dict, Optional, Set
-from collections import defaultdict
+from typing import Iterable, List, Dict, Optional, Set, Tuple
+from collections import Counter
 from .base_classifier import BaseTextClassifier
+from .keyword_matcher import KeywordMatcher
+from ..utils.topk import SpaceSavingCounter
 
 
 class KeywordClassifier(BaseTextClassifier):
-    """Keyword-based text classifier."""
+    """
+    Keyword-based text classifier.
+
+    Keywords of all categories are compiled into one KeywordMatcher, so a
+    text is scanned once regardless of the number of categories. Keywords may
+    be multi-word phrases; a ZWNJ and a space are treated alike. Keywords are
+    preprocessed like the input text. The matcher is rebuilt when the
+    categories change, including edits made in place to ``categories`` or to
+    its keyword sets; ``add_keyword_to_category`` extends it incrementally.
+
+    The batch methods (``classify_batch``, ``predict_batch``,
+    ``predict_proba_batch``, ``predict_top_k_batch``) score each text once
+    against the shared keyword index. ``predict_all_batch`` returns the
+    category, probabilities and top K categories from that single scan.
+    """
 
     def __init__(self,
                  normalize: bool = True,
                  remove_stopwords: bool = True,
-                 categories: Optional[Dict[str, Set[str]]] = None):
+                 categories: Optional[Dict[str, Set[str]]] = None,
+                 num_keywords: int = 50,
+                 counter_capacity: int = 1000):
         """
         Initialize keyword classifier.
 
@@ -23,10 +41,18 @@ class KeywordClassifier(BaseTextClassifier):
             normalize: Whether to normalize text
             remove_stopwords: Whether to remove stop words
             categories: Dictionary mapping category names to keyword sets
+            num_keywords: Number of keywords kept per category when training
+            counter_capacity: Number of words tracked per category by partial_fit
         """
         super().__init__(normalize=normalize, remove_stopwords=remove_stopwords)
         self.categories = categories or {}
+        self.num_keywords = num_keywords
+        self.counter_capacity = counter_capacity
+        self._word_counters: Dict[str, SpaceSavingCounter] = {}
         self._is_trained = len(self.categories) > 0
+        self._matcher: Optional[KeywordMatcher] = None
+        # Copy of the categories the matcher was built from
+        self._indexed: Optional[Dict[str, Set[str]]] = None
 
     def train(self, texts: List[str], labels: List[str]) -> None:
         """
@@ -40,31 +66,65 @@ class KeywordClassifier(BaseTextClassifier):
         if len(texts) != len(labels):
             raise ValueError("texts and labels must have the same length")
 
-        # Group texts by category
-        category_texts = defaultdict(list)
+        # Count word frequencies per category, text by text
+        word_freqs: Dict[str, Counter] = {}
         for text, label in zip(texts, labels):
-            processed = self.preprocess(text)
-            category_texts[label].append(processed)
+            word_freq = word_freqs.setdefault(label, Counter())
+            word_freq.update(self._candidate_words(text))
 
         # Extract keywords for each category (top frequent words)
         self.categories = {}
-        for category, cat_texts in category_texts.items():
-            # Concatenate all texts for this category
-            all_text = ' '.join(cat_texts)
-            words = all_text.split()
-
-            # Count word frequencies
-            word_freq = defaultdict(int)
-            for word in words:
-                if len(word) > 2:  # Skip very short words
-                    word_freq[word] += 1
-
-            # Get top N keywords
-            top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:50]
+        self._word_counters = {}
+        for category, word_freq in word_freqs.items():
+            top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+            self.categories[category] = {word for word, freq in top_keywords[:self.num_keywords]}
+
+            # Seed the streaming counter so partial_fit continues from here
+            counter = SpaceSavingCounter(self.counter_capacity)
+            for word, freq in top_keywords[:self.counter_capacity]:
+                counter.update(word, freq)
+            counter.total = sum(word_freq.values())
+            self._word_counters[category] = counter
+
+        self._matcher = None
+        self._is_trained = True
+
+    def partial_fit(self, examples: Iterable[Tuple[str, str]]) -> None:
+        """
+        Update keywords from a stream of labeled texts.
+
+        Word frequencies are tracked per category with a bounded
+        SpaceSavingCounter (``counter_capacity`` words), so memory does not
+        grow with the stream. The keyword sets of the categories seen in
+        ``examples`` are refreshed with their current top words.
+
+        Args:
+            examples: Iterable of (text, label) pairs
+        """
+        updated = set()
+        for text, label in examples:
+            counter = self._word_counters.get(label)
+            if counter is None:
+                counter = SpaceSavingCounter(self.counter_capacity)
+                self._word_counters[label] = counter
+            counter.update_many(self._candidate_words(text))
+            updated.add(label)
+
+        if not updated:
+            return
+
+        for category in updated:
+            top_keywords = self._word_counters[category].most_common(self.num_keywords)
             self.categories[category] = {word for word, freq in top_keywords}
 
+        self._matcher = None
         self._is_trained = True
 
+    def _candidate_words(self, text: str) -> List[str]:
+        """Get the preprocessed words of a text that can become keywords."""
+        # Skip very short words
+        return [word for word in self.preprocess(text).split() if len(word) > 2]
+
     def add_category(self, category: str, keywords: Set[str]) -> None:
         """
         Add a new category with keywords.
@@ -74,6 +134,8 @@ class KeywordClassifier(BaseTextClassifier):
             keywords: Set of keywords for this category
         """
         self.categories[category] = keywords
+        self._word_counters.pop(category, None)
+        self._matcher = None
         self._is_trained = True
 
     def add_keyword_to_category(self, category: str, keyword: str) -> None:
@@ -84,9 +146,16 @@ class KeywordClassifier(BaseTextClassifier):
             category: Category name
             keyword: Keyword to add
         """
-        if category not in self.categories:
-            self.categories[category] = set()
-        self.categories[category].add(keyword)
+        if keyword in self.categories.get(category, ()):
+            return
+        # Extend the compiled matcher in place instead of rebuilding it,
+        # unless the categories were edited since it was built
+        extend = self._matcher is not None and not self._categories_changed()
+
+        self.categories.setdefault(category, set()).add(keyword)
+        if extend:
+            self._index_keyword(category, keyword)
+            self._indexed.setdefault(category, set()).add(keyword)
 
     def remove_category(self, category: str) -> None:
         """
@@ -97,6 +166,8 @@ class KeywordClassifier(BaseTextClassifier):
         """
         if category in self.categories:
             del self.categories[category]
+            self._word_counters.pop(category, None)
+            self._matcher = None
 
     def get_categories(self) -> List[str]:
         """
@@ -119,50 +190,178 @@ class KeywordClassifier(BaseTextClassifier):
         """
         return self.categories.get(category, set())
 
-    def classify(self, text: str) -> Dict[str, any]:
+    def _index_keyword(self, category: str, keyword: str) -> None:
+        """Add a (category, keyword) pair to the keyword index."""
+        category_id = self._category_ids.get(category)
+        if category_id is None:
+            category_id = len(self._category_names)
+            self._category_ids[category] = category_id
+            self._category_names.append(category)
+
+        keyword_id = self._keyword_ids.get(keyword)
+        if keyword_id is None:
+            keyword_id = len(self._keywords)
+            self._keyword_ids[keyword] = keyword_id
+            self._keywords.append(keyword)
+            self._keyword_masks.append(0)
+            # Keywords are preprocessed like the input text
+            self._matcher.add(self.preprocess(keyword), keyword_id)
+
+        self._keyword_masks[keyword_id] |= 1 << category_id
+
+    def _categories_changed(self) -> bool:
+        """Check whether the categories differ from the ones the matcher was built from."""
+        indexed = self._indexed
+        if indexed is None or len(indexed) != len(self.categories):
+            return True
+        for (category, keywords), (indexed_category, indexed_keywords) in \
+                zip(self.categories.items(), indexed.items()):
+            if category != indexed_category or keywords != indexed_keywords:
+                return True
+        return False
+
+    def _get_matcher(self) -> KeywordMatcher:
         """
-        Classify text with detailed results.
+        Get the compiled keyword matcher, building the keyword index if needed.
+
+        The index maps each keyword id to a bitmask of the categories that
+        contain the keyword, so a keyword shared by several categories is
+        matched once.
+
+        Returns:
+            KeywordMatcher reporting keyword ids
+        """
+        if self._matcher is None or self._categories_changed():
+            self._matcher = KeywordMatcher()
+            self._indexed = {category: set(keywords)
+                             for category, keywords in self.categories.items()}
+            self._category_ids: Dict[str, int] = {}
+            self._category_names: List[str] = []
+            self._keyword_ids: Dict[str, int] = {}
+            self._keywords: List[str] = []
+            self._keyword_masks: List[int] = []
+
+            for category, keywords in self.categories.items():
+                self._category_ids[category] = len(self._category_names)
+                self._category_names.append(category)
+                for keyword in keywords:
+                    self._index_keyword(category, keyword)
+        return self._matcher
+
+    def _score(self, text: str,
+               matcher: Optional[KeywordMatcher] = None) -> Tuple[List[int], List[int]]:
+        """
+        Score all categories for a text in one scan.
 
         Args:
             text: Input text
+            matcher: Matcher from ``_get_matcher`` (looked up if None), so a
+                batch checks the categories once
 
         Returns:
-            Dictionary with classification results
+            Tuple of (score per category id, distinct matched keyword ids in
+            order of first match)
         """
         if not self._is_trained:
             raise ValueError("Classifier must be trained or have categories defined")
 
-        # Preprocess
-        processed_text = self.preprocess(text)
-        words = set(processed_text.split())
-
-        # Score each category
-        scores = {}
-        matched_keywords = {}
-
-        for category, keywords in self.categories.items():
-            # Count matching keywords
-            matches = words & keywords
-            score = len(matches)
-            scores[category] = score
-            matched_keywords[category] = list(matches)
+        if matcher is None:
+            matcher = self._get_matcher()
+        masks = self._keyword_masks
+        scores = [0] * len(self._category_names)
+        matched = []
+        seen = set()
+
+        for _, _, keyword_id in matcher.find_all(self.preprocess(text)):
+            if keyword_id in seen:
+                continue
+            seen.add(keyword_id)
+            matched.append(keyword_id)
+
+            mask = masks[keyword_id]
+            while mask:
+                low_bit = mask & -mask
+                scores[low_bit.bit_length() - 1] += 1
+                mask ^= low_bit
+
+        return scores, matched
+
+    def _result(self, scores: List[int], matched: List[int]) -> Dict[str, any]:
+        """Build the classify result from category scores."""
+        names = self._category_names
+        score_dict = dict(zip(names, scores))
+        matched_keywords = {category: [] for category in names}
+
+        for keyword_id in matched:
+            keyword = self._keywords[keyword_id]
+            mask = self._keyword_masks[keyword_id]
+            while mask:
+                low_bit = mask & -mask
+                matched_keywords[names[low_bit.bit_length() - 1]].append(keyword)
+                mask ^= low_bit
 
         # Find best category
-        if not scores or all(score == 0 for score in scores.values()):
-            best_category = 'unknown'
-            confidence = 0.0
-        else:
-            best_category = max(scores, key=scores.get)
-            total_matches = sum(scores.values())
-            confidence = scores[best_category] / total_matches if total_matches > 0 else 0.0
+        total_matches = sum(scores)
+        best_category = self._category(scores)
+        confidence = score_dict[best_category] / total_matches if total_matches else 0.0
 
         return {
             'category': best_category,
             'confidence': confidence,
-            'scores': scores,
+            'scores': score_dict,
             'matched_keywords': matched_keywords,
         }
 
+    def _score_batch(self, texts: Iterable[str]) -> List[List[int]]:
+        """Score all categories for each text, one scan per text."""
+        matcher = self._get_matcher() if self._is_trained else None
+        return [self._score(text, matcher)[0] for text in texts]
+
+    def _category(self, scores: List[int]) -> str:
+        """Get the best category from category scores ('unknown' if none matched)."""
+        if not any(scores):
+            return 'unknown'
+        return self._category_names[max(range(len(scores)), key=scores.__getitem__)]
+
+    def _proba(self, scores: List[int]) -> Dict[str, float]:
+        """Convert category scores to probabilities."""
+        names = self._category_names
+        total = sum(scores)
+
+        if total == 0:
+            # Equal probability for all categories
+            if not names:
+                return {}
+            prob = 1.0 / len(names)
+            return {cat: prob for cat in names}
+
+        return {cat: score / total for cat, score in zip(names, scores)}
+
+    def classify(self, text: str) -> Dict[str, any]:
+        """
+        Classify text with detailed results.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary with classification results
+        """
+        return self._result(*self._score(text))
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Classify multiple texts with detailed results.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of classification results
+        """
+        matcher = self._get_matcher() if self._is_trained else None
+        return [self._result(*self._score(text, matcher)) for text in texts]
+
     def predict(self, text: str) -> str:
         """
         Predict category for text.
@@ -173,8 +372,19 @@ class KeywordClassifier(BaseTextClassifier):
         Returns:
             Predicted category
         """
-        result = self.classify(text)
-        return result['category']
+        return self._category(self._score(text)[0])
+
+    def predict_batch(self, texts: List[str]) -> List[str]:
+        """
+        Predict categories for multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of predicted categories
+        """
+        return [self._category(scores) for scores in self._score_batch(texts)]
 
     def predict_proba(self, text: str) -> Dict[str, float]:
         """
@@ -186,21 +396,20 @@ class KeywordClassifier(BaseTextClassifier):
         Returns:
             Dictionary mapping categories to probabilities
         """
-        result = self.classify(text)
-        scores = result['scores']
-        total = sum(scores.values())
+        scores, _ = self._score(text)
+        return self._proba(scores)
 
-        if total == 0:
-            # Equal probability for all categories
-            num_categories = len(self.categories)
-            if num_categories == 0:
-                return {}
-            prob = 1.0 / num_categories
-            return {cat: prob for cat in self.categories.keys()}
+    def predict_proba_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Predict category probabilities for multiple texts.
+
+        Args:
+            texts: List of input texts
 
-        # Convert scores to probabilities
-        proba = {cat: score / total for cat, score in scores.items()}
-        return proba
+        Returns:
+            List of dictionaries mapping categories to probabilities
+        """
+        return [self._proba(scores) for scores in self._score_batch(texts)]
 
     def predict_top_k(self, text: str, k: int = 3) -> List[tuple]:
         """
@@ -213,9 +422,48 @@ class KeywordClassifier(BaseTextClassifier):
         Returns:
             List of (category, probability) tuples
         """
-        proba = self.predict_proba(text)
-        sorted_proba = sorted(proba.items(), key=lambda x: x[1], reverse=True)
-        return sorted_proba[:k]
+        return self._top_k(self.predict_proba(text), k)
+
+    def predict_top_k_batch(self, texts: List[str], k: int = 3) -> List[List[tuple]]:
+        """
+        Predict top K categories for multiple texts.
+
+        Args:
+            texts: List of input texts
+            k: Number of top categories to return
+
+        Returns:
+            List of (category, probability) tuple lists
+        """
+        return [self._top_k(proba, k) for proba in self.predict_proba_batch(texts)]
+
+    def predict_all_batch(self, texts: List[str],
+                          k: int = 3) -> List[Tuple[str, Dict[str, float], List[tuple]]]:
+        """
+        Predict the category, probabilities and top K categories together.
+
+        Each text is scored once and the three results are derived from the
+        same category scores, as returned by ``predict_batch``,
+        ``predict_proba_batch`` and ``predict_top_k_batch``.
+
+        Args:
+            texts: List of input texts
+            k: Number of top categories to return
+
+        Returns:
+            List of (category, probabilities, top K (category, probability)
+            list) tuples
+        """
+        results = []
+        for scores in self._score_batch(texts):
+            proba = self._proba(scores)
+            results.append((self._category(scores), proba, self._top_k(proba, k)))
+        return results
+
+    @staticmethod
+    def _top_k(proba: Dict[str, float], k: int) -> List[tuple]:
+        """Get the K most probable categories."""
+        return sorted(proba.items(), key=lambda x: x[1], reverse=True)[:k]
 
     def get_params(self) -> Dict[str, any]:
         """Get classifier parameters."""
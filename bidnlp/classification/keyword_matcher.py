@@ -0,0 +1,159 @@
+"""
+Keyword Matcher
+
+Provides a token-level Aho–Corasick automaton that finds every occurrence of
+a set of keywords and phrases in one linear scan of a text.
+"""
+
+from collections import deque
+from typing import Dict, Hashable, List, Tuple
+
+ZWNJ = '\u200c'
+
+
+def _split_parts(text: str) -> Tuple[List[str], List[int], List[bool]]:
+    """
+    Split text into word parts.
+
+    Words are separated by whitespace, and each word is further split at
+    ZWNJ, so 'نرم‌افزار' and 'نرم افزار' give the same parts.
+
+    Returns:
+        Tuple of (parts, word index of each part, whether each part ends a word)
+    """
+    parts: List[str] = []
+    word_ids: List[int] = []
+    word_ends: List[bool] = []
+
+    for word_id, word in enumerate(text.split()):
+        pieces = [piece for piece in word.split(ZWNJ) if piece] if ZWNJ in word else [word]
+        if not pieces:
+            continue
+        parts.extend(pieces)
+        word_ids.extend([word_id] * len(pieces))
+        word_ends.extend([False] * (len(pieces) - 1))
+        word_ends.append(True)
+
+    return parts, word_ids, word_ends
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern keyword matcher (Aho–Corasick over word parts).
+
+    Keywords may be single words or multi-word phrases, and a ZWNJ inside a
+    keyword or text is treated like a space. Matches are aligned to whole
+    words: the keyword 'کتاب' does not match inside 'کتاب‌ها'.
+
+    Each keyword is stored with a value that is reported on every match, so
+    a single automaton can serve many categories. Keywords can be added at
+    any time; the failure links are recomputed lazily before the next search.
+    """
+
+    def __init__(self):
+        """Initialize an empty matcher."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._depth: List[int] = [0]
+        self._values: List[List[Hashable]] = [[]]
+        self._fail: List[int] = [0]
+        # Nearest node on the failure chain that has values
+        self._output: List[int] = [-1]
+        self._num_keywords = 0
+        self._built = True
+
+    def __len__(self) -> int:
+        return self._num_keywords
+
+    def add(self, keyword: str, value: Hashable) -> bool:
+        """
+        Add a keyword.
+
+        Args:
+            keyword: Keyword or phrase
+            value: Value reported when the keyword matches
+
+        Returns:
+            True if the keyword was added, False if it is empty
+        """
+        parts, _, _ = _split_parts(keyword)
+        if not parts:
+            return False
+
+        node = 0
+        for part in parts:
+            next_node = self._goto[node].get(part)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._depth.append(self._depth[node] + 1)
+                self._values.append([])
+                self._fail.append(0)
+                self._output.append(-1)
+                self._goto[node][part] = next_node
+            node = next_node
+
+        self._values[node].append(value)
+        self._num_keywords += 1
+        self._built = False
+        return True
+
+    def build(self) -> None:
+        """Compute the failure and output links (breadth-first)."""
+        goto, fail, output, values = self._goto, self._fail, self._output, self._values
+        queue = deque()
+
+        for child in goto[0].values():
+            fail[child] = 0
+            output[child] = -1
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for part, child in goto[node].items():
+                state = fail[node]
+                while part not in goto[state] and state:
+                    state = fail[state]
+                fail[child] = goto[state].get(part, 0)
+                output[child] = fail[child] if values[fail[child]] else output[fail[child]]
+                queue.append(child)
+
+        self._built = True
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Hashable]]:
+        """
+        Find all keyword occurrences in a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            List of (start word, end word, value) tuples in order of match
+            end, where the keyword spans words [start, end)
+        """
+        if not self._built:
+            self.build()
+
+        parts, word_ids, word_ends = _split_parts(text)
+        goto, fail, output, values, depth = (self._goto, self._fail, self._output,
+                                             self._values, self._depth)
+        matches = []
+        state = 0
+
+        for i, part in enumerate(parts):
+            while part not in goto[state] and state:
+                state = fail[state]
+            state = goto[state].get(part, 0)
+
+            if not word_ends[i]:
+                continue
+
+            node = state if values[state] else output[state]
+            while node > 0:
+                start = i - depth[node] + 1
+                # Only keep matches that start at the beginning of a word
+                if start == 0 or word_ids[start - 1] != word_ids[start]:
+                    for value in values[node]:
+                        matches.append((word_ids[start], word_ids[i] + 1, value))
+                node = output[node]
+
+        return matches
@@ -0,0 +1,414 @@
+"""
+Linear Text Classifier
+
+Provides a linear classifier (multinomial logistic regression or linear SVM)
+trained by stochastic gradient descent over the sparse output of the feature
+extractors.
+"""
+
+import math
+import pickle
+import random
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .base_classifier import BaseTextClassifier
+from .feature_extraction import TfidfVectorizer, saved_vectorizer
+from .sparse import CSRMatrix
+from ..utils.parallel import iter_chunks
+
+# Rescale the weights into the stored vectors when the shared scale gets this small
+_MIN_WSCALE = 1e-9
+
+
+class LinearClassifier(BaseTextClassifier):
+    """
+    Linear classifier trained with mini-batch SGD.
+
+    Two losses are available:
+
+    - ``'log'``: multinomial logistic regression (softmax over all classes)
+    - ``'hinge'``: linear SVM, one-vs-rest
+
+    Weights are kept as one ``array`` per class multiplied by a shared scale,
+    so L2 regularization shrinks all weights in constant time per mini-batch
+    and an update only touches the features present in the batch. The
+    learning rate decays as ``eta0 / (1 + eta0 * alpha * t)``.
+    """
+
+    LOSSES = ('log', 'hinge')
+
+    def __init__(self,
+                 vectorizer=None,
+                 loss: str = 'log',
+                 alpha: float = 1e-4,
+                 eta0: float = 0.5,
+                 epochs: int = 5,
+                 batch_size: int = 32,
+                 seed: int = 0,
+                 normalize: bool = True,
+                 remove_stopwords: bool = False):
+        """
+        Initialize the classifier.
+
+        Args:
+            vectorizer: Feature extractor (a new TfidfVectorizer if None)
+            loss: 'log' for softmax regression, 'hinge' for one-vs-rest SVM
+            alpha: L2 regularization strength
+            eta0: Initial learning rate
+            epochs: Number of passes over the data in ``train``
+            batch_size: Number of examples per SGD update
+            seed: Seed for shuffling the training data
+            normalize: Whether to normalize text
+            remove_stopwords: Whether to remove stop words
+        """
+        super().__init__(normalize=normalize, remove_stopwords=remove_stopwords)
+        if loss not in self.LOSSES:
+            raise ValueError(f"loss must be one of {self.LOSSES}")
+        if alpha < 0:
+            raise ValueError("alpha must be non-negative")
+        if batch_size < 1 or epochs < 1:
+            raise ValueError("batch_size and epochs must be at least 1")
+
+        self.vectorizer = vectorizer if vectorizer is not None else TfidfVectorizer()
+        self.loss = loss
+        self.alpha = alpha
+        self.eta0 = eta0
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.seed = seed
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear the learned weights."""
+        self.classes: List[str] = []
+        self.n_features = 0
+        self._class_index: Dict[str, int] = {}
+        self._weights: List[array] = []
+        self._bias = array('d')
+        self._wscale = 1.0
+        self._t = 0
+
+    def _vectorize(self, texts: Sequence[str]) -> CSRMatrix:
+        """Preprocess texts and transform them with the fitted vectorizer."""
+        return self.vectorizer.transform([self.preprocess(text) for text in texts], output='csr')
+
+    def _add_classes(self, labels: Iterable[str]) -> None:
+        """Register unseen labels with zero weights."""
+        for label in labels:
+            if label not in self._class_index:
+                self._class_index[label] = len(self.classes)
+                self.classes.append(label)
+                self._weights.append(array('d', [0.0]) * self.n_features)
+                self._bias.append(0.0)
+
+    def _grow_features(self, n_features: int) -> None:
+        """Extend the weight vectors to n_features columns."""
+        if n_features > self.n_features:
+            extra = array('d', [0.0]) * (n_features - self.n_features)
+            for weights in self._weights:
+                weights.extend(extra)
+            self.n_features = n_features
+
+    def _rescale(self) -> None:
+        """Fold the shared scale into the stored weights."""
+        wscale = self._wscale
+        for k, weights in enumerate(self._weights):
+            self._weights[k] = array('d', [w * wscale for w in weights])
+        self._wscale = 1.0
+
+    def _step(self, rows: List[Tuple[Sequence[int], Sequence[float]]], targets: List[int]) -> None:
+        """Apply one SGD update for a mini-batch of sparse rows."""
+        self._t += 1
+        eta = self.eta0 / (1.0 + self.eta0 * self.alpha * self._t)
+        step = eta / len(rows)
+        wscale = self._wscale
+        weights, bias = self._weights, self._bias
+        num_classes = len(weights)
+
+        # Gradients are computed with the weights from before the update
+        scores = self._scores(rows)
+        updates = []
+        for row_scores, target in zip(scores, targets):
+            if self.loss == 'log':
+                proba = _softmax(row_scores)
+                proba[target] -= 1.0
+                coefs = proba
+            else:
+                coefs = []
+                for k in range(num_classes):
+                    y = 1.0 if k == target else -1.0
+                    coefs.append(-y if y * row_scores[k] < 1.0 else 0.0)
+            updates.append(coefs)
+
+        # L2 shrinkage of all weights through the shared scale
+        wscale *= 1.0 - eta * self.alpha
+        if wscale < _MIN_WSCALE:
+            self._wscale = wscale
+            self._rescale()
+            wscale = 1.0
+        self._wscale = wscale
+
+        for (indices, values), coefs in zip(rows, updates):
+            for k in range(num_classes):
+                coef = coefs[k]
+                if not coef:
+                    continue
+                bias[k] -= step * coef
+                scaled = step * coef / wscale
+                class_weights = weights[k]
+                for idx, value in zip(indices, values):
+                    class_weights[idx] -= scaled * value
+
+    def _scores(self, rows: List[Tuple[Sequence[int], Sequence[float]]]) -> List[List[float]]:
+        """Compute class scores for (indices, values) rows."""
+        matrix = CSRMatrix(n_features=self.n_features)
+        for indices, values in rows:
+            matrix.append_row(list(zip(indices, values)))
+        return self._matrix_scores(matrix)
+
+    def _matrix_scores(self, matrix: CSRMatrix) -> List[List[float]]:
+        """Compute class scores for every row of a matrix."""
+        wscale, bias = self._wscale, self._bias
+        return [[wscale * dot + b for dot, b in zip(row, bias)]
+                for row in matrix.dot(self._weights)]
+
+    def partial_fit_vectors(self,
+                            vectors: Union[CSRMatrix, Sequence[Dict[int, float]]],
+                            labels: Sequence[str],
+                            shuffle: bool = False) -> None:
+        """
+        Run one SGD pass over labeled sparse vectors.
+
+        Args:
+            vectors: CSRMatrix or list of sparse vectors
+            labels: Label of each vector
+            shuffle: Shuffle the examples before the pass
+        """
+        if not isinstance(vectors, CSRMatrix):
+            vectors = CSRMatrix.from_dicts(vectors, n_features=self.n_features or None)
+        if len(vectors) != len(labels):
+            raise ValueError("vectors and labels must have the same length")
+
+        self._grow_features(vectors.n_features)
+        self._add_classes(labels)
+
+        order = list(range(len(labels)))
+        if shuffle:
+            random.Random(self.seed + self._t).shuffle(order)
+
+        class_index = self._class_index
+        for batch in iter_chunks(order, self.batch_size):
+            rows = [vectors.row(i) for i in batch]
+            self._step(rows, [class_index[labels[i]] for i in batch])
+
+        self._is_trained = len(self.classes) > 0
+
+    def train(self, texts: List[str], labels: List[str]) -> None:
+        """
+        Fit the vectorizer and train for ``epochs`` passes over the data.
+
+        Args:
+            texts: List of training texts
+            labels: List of corresponding labels
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+
+        processed = [self.preprocess(text) for text in texts]
+        matrix = self.vectorizer.fit_transform(processed, output='csr')
+
+        self._reset()
+        # Fix the class order to the order of first appearance
+        self._grow_features(matrix.n_features)
+        self._add_classes(labels)
+        for _ in range(self.epochs):
+            self.partial_fit_vectors(matrix, labels, shuffle=True)
+
+    def partial_fit(self, texts: List[str], labels: List[str]) -> None:
+        """
+        Run one SGD pass over more labeled texts.
+
+        The vectorizer must already be fitted (or be a HashingVectorizer), so
+        that feature indices stay fixed between calls.
+
+        Args:
+            texts: List of training texts
+            labels: List of corresponding labels
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        if not getattr(self.vectorizer, '_is_fitted', False):
+            raise ValueError("partial_fit requires a fitted vectorizer or a HashingVectorizer")
+
+        self.partial_fit_vectors(self._vectorize(texts), labels)
+
+    def fit_stream(self,
+                   make_stream: Callable[[], Iterable[Tuple[str, str]]],
+                   epochs: Optional[int] = None,
+                   chunksize: int = 1000) -> None:
+        """
+        Train over a labeled stream that can be re-read, e.g. from disk.
+
+        Each epoch calls ``make_stream`` for a fresh iterator of (text, label)
+        pairs and processes it chunk by chunk, so only one chunk is held in
+        memory. The vectorizer must already be fitted (or be a
+        HashingVectorizer).
+
+        Args:
+            make_stream: Callable returning an iterable of (text, label) pairs
+            epochs: Number of passes (defaults to ``epochs``)
+            chunksize: Number of examples vectorized at a time
+        """
+        if not getattr(self.vectorizer, '_is_fitted', False):
+            raise ValueError("fit_stream requires a fitted vectorizer or a HashingVectorizer")
+
+        for _ in range(self.epochs if epochs is None else epochs):
+            for chunk in iter_chunks(make_stream(), chunksize):
+                texts = [text for text, _ in chunk]
+                labels = [label for _, label in chunk]
+                self.partial_fit_vectors(self._vectorize(texts), labels, shuffle=True)
+
+    def decision_function(self, vectors: Union[CSRMatrix, Sequence[Dict[int, float]]]) -> List[List[float]]:
+        """
+        Compute class scores for a batch of sparse vectors.
+
+        Args:
+            vectors: CSRMatrix or list of sparse vectors
+
+        Returns:
+            For each vector, the score of every class (in the order of ``classes``)
+        """
+        if not self._is_trained:
+            raise ValueError("Classifier must be trained before prediction")
+        if not isinstance(vectors, CSRMatrix):
+            vectors = CSRMatrix.from_dicts(vectors, n_features=self.n_features)
+        return self._matrix_scores(vectors)
+
+    def predict(self, text: str) -> str:
+        """
+        Predict the class of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Predicted class label
+        """
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> List[str]:
+        """
+        Predict the classes of multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of predicted class labels
+        """
+        classes = self.classes
+        return [classes[max(range(len(row)), key=row.__getitem__)]
+                for row in self.decision_function(self._vectorize(texts))]
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """
+        Predict class probabilities for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary mapping class labels to probabilities
+        """
+        return self.predict_proba_batch([text])[0]
+
+    def predict_proba_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Predict class probabilities for multiple texts.
+
+        With the hinge loss the probabilities are a softmax over the SVM
+        scores and serve as confidence values only.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of dictionaries mapping class labels to probabilities
+        """
+        return [dict(zip(self.classes, _softmax(row)))
+                for row in self.decision_function(self._vectorize(texts))]
+
+    def save(self, path: str) -> None:
+        """
+        Save the trained model (including the vectorizer) to a file.
+
+        The file is a pickle, so only load files from trusted sources.
+
+        Args:
+            path: Output file path
+        """
+        self._rescale()
+        state = {
+            'params': {
+                'loss': self.loss, 'alpha': self.alpha, 'eta0': self.eta0,
+                'epochs': self.epochs, 'batch_size': self.batch_size, 'seed': self.seed,
+                'normalize': self.normalize, 'remove_stopwords': self.remove_stopwords,
+            },
+            'vectorizer': saved_vectorizer(self.vectorizer),
+            'classes': self.classes,
+            'n_features': self.n_features,
+            'weights': self._weights,
+            'bias': self._bias,
+            't': self._t,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'LinearClassifier':
+        """
+        Load a model saved with ``save``.
+
+        The file is unpickled, so only load files from trusted sources.
+
+        Args:
+            path: Input file path
+
+        Returns:
+            LinearClassifier
+        """
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+
+        classifier = cls(vectorizer=state['vectorizer'], **state['params'])
+        classifier.classes = state['classes']
+        classifier.n_features = state['n_features']
+        classifier._class_index = {label: i for i, label in enumerate(classifier.classes)}
+        classifier._weights = state['weights']
+        classifier._bias = state['bias']
+        classifier._t = state['t']
+        classifier._is_trained = len(classifier.classes) > 0
+        return classifier
+
+    def get_params(self) -> Dict[str, any]:
+        """Get classifier parameters."""
+        params = super().get_params()
+        params.update({
+            'loss': self.loss,
+            'alpha': self.alpha,
+            'eta0': self.eta0,
+            'epochs': self.epochs,
+            'batch_size': self.batch_size,
+            'classes': list(self.classes),
+            'n_features': self.n_features,
+        })
+        return params
+
+
+def _softmax(scores: List[float]) -> List[float]:
+    """Convert scores to probabilities."""
+    top = max(scores)
+    exps = [math.exp(score - top) for score in scores]
+    total = sum(exps)
+    return [value / total for value in exps]
@@ -0,0 +1,320 @@
+"""
+MinHash and LSH for Near-Duplicate Detection
+
+Provides MinHash signatures over word or character shingles of Persian
+documents and a banded locality-sensitive hashing (LSH) index for finding
+near-duplicate candidates without comparing every pair of documents.
+"""
+
+import pickle
+import random
+import zlib
+from array import array
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set
+
+from ..preprocessing import PersianNormalizer
+from .feature_extraction import _ngrams
+
+# Universal hashing h(x) = ((a * x + b) mod p) & _MAX_HASH with a Mersenne prime
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class MinHash:
+    """
+    MinHash signature generator.
+
+    A document is reduced to a set of shingles (word n-grams or character
+    n-grams) and each shingle is hashed with ``zlib.crc32``, so signatures are
+    reproducible across processes. The signature holds, for each of
+    ``num_perm`` hash permutations, the minimum permuted hash over the
+    shingles. The fraction of equal positions in two signatures estimates the
+    Jaccard similarity of their shingle sets.
+    """
+
+    SHINGLE_TYPES = ('word', 'char')
+
+    def __init__(self,
+                 num_perm: int = 128,
+                 shingle_type: str = 'word',
+                 shingle_size: int = 3,
+                 normalize: bool = True,
+                 seed: int = 1):
+        """
+        Initialize the signature generator.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_type: 'word' for word n-grams, 'char' for character n-grams
+            shingle_size: Number of words or characters per shingle
+            normalize: Normalize documents with PersianNormalizer first
+            seed: Seed for the hash permutations
+        """
+        if num_perm < 1:
+            raise ValueError("num_perm must be at least 1")
+        if shingle_type not in self.SHINGLE_TYPES:
+            raise ValueError(f"shingle_type must be one of {self.SHINGLE_TYPES}")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+
+        self.num_perm = num_perm
+        self.shingle_type = shingle_type
+        self.shingle_size = shingle_size
+        self.seed = seed
+        # Same normalizer settings as PersianAnalyzer (see there)
+        self.normalizer = PersianNormalizer(normalize_zwnj=False) if normalize else None
+
+        rng = random.Random(seed)
+        self._permutations = [(rng.randint(1, _MERSENNE_PRIME - 1),
+                               rng.randint(0, _MERSENNE_PRIME - 1))
+                              for _ in range(num_perm)]
+
+    def shingles(self, text: str) -> Set[str]:
+        """
+        Extract the shingle set of a document.
+
+        Documents shorter than one shingle yield a single shingle holding the
+        whole (non-empty) document.
+
+        Args:
+            text: Input document
+
+        Returns:
+            Set of shingles
+        """
+        if self.normalizer is not None:
+            text = self.normalizer.normalize(text)
+
+        n = self.shingle_size
+        if self.shingle_type == 'word':
+            words = text.split()
+            if len(words) < n:
+                return {' '.join(words)} if words else set()
+            return set(_ngrams(words, n, n))
+
+        text = ' '.join(text.split())
+        if len(text) < n:
+            return {text} if text else set()
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def signature_from_shingles(self, shingles: Iterable[str]) -> array:
+        """
+        Compute the signature of a shingle set.
+
+        Args:
+            shingles: Shingles of a document
+
+        Returns:
+            Signature as an array of ``num_perm`` unsigned integers
+        """
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles]
+        if not hashes:
+            return array('Q', [_MAX_HASH]) * self.num_perm
+
+        prime = _MERSENNE_PRIME
+        return array('Q', [min((a * h + b) % prime for h in hashes) & _MAX_HASH
+                           for a, b in self._permutations])
+
+    def signature(self, text: str) -> array:
+        """
+        Compute the signature of a document.
+
+        Args:
+            text: Input document
+
+        Returns:
+            Signature as an array of ``num_perm`` unsigned integers
+        """
+        return self.signature_from_shingles(self.shingles(text))
+
+    def signatures(self, texts: Iterable[str]) -> List[array]:
+        """
+        Compute the signatures of several documents.
+
+        Args:
+            texts: Input documents
+
+        Returns:
+            List of signatures
+        """
+        return [self.signature(text) for text in texts]
+
+    @staticmethod
+    def jaccard(signature1: array, signature2: array) -> float:
+        """
+        Estimate the Jaccard similarity of two documents from their signatures.
+
+        Args:
+            signature1: First signature
+            signature2: Second signature
+
+        Returns:
+            Estimated Jaccard similarity (0.0 to 1.0)
+        """
+        if len(signature1) != len(signature2):
+            raise ValueError("Signatures must have the same length")
+        if not signature1:
+            return 0.0
+        equal = sum(1 for a, b in zip(signature1, signature2) if a == b)
+        return equal / len(signature1)
+
+
+class LSHIndex:
+    """
+    Banded LSH index over MinHash signatures.
+
+    Each signature is split into ``bands`` bands of ``num_perm // bands``
+    values, and each band is used as a key into its own hash table. Documents
+    that agree on all values of at least one band become candidates, so a
+    lookup costs one dictionary access per band instead of a scan over the
+    index. More bands find less similar pairs (higher recall); fewer bands
+    return fewer false candidates.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32):
+        """
+        Initialize the index.
+
+        Args:
+            num_perm: Signature length (must match the MinHash generator)
+            bands: Number of bands (must divide num_perm)
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError("bands must be a positive divisor of num_perm")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._tables: List[Dict[bytes, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, array] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    @staticmethod
+    def _as_signature(signature: Sequence[int]) -> array:
+        """Get a signature as an array('Q'), converting lists and other sequences."""
+        if isinstance(signature, array) and signature.typecode == 'Q':
+            return signature
+        return array('Q', signature)
+
+    def _band_keys(self, signature: array) -> List[bytes]:
+        """Split a signature into one hashable key per band."""
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Signature length must be {self.num_perm}")
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: Hashable, signature: Sequence[int]) -> None:
+        """
+        Add a document to the index.
+
+        Args:
+            key: Document identifier
+            signature: MinHash signature of the document
+        """
+        if key in self._signatures:
+            raise ValueError(f"Key already in index: {key!r}")
+
+        signature = array('Q', signature)
+        for table, band_key in zip(self._tables, self._band_keys(signature)):
+            table.setdefault(band_key, set()).add(key)
+        self._signatures[key] = signature
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a document from the index.
+
+        Args:
+            key: Document identifier
+
+        Raises:
+            KeyError: If the key is not in the index
+        """
+        signature = self._signatures.pop(key)
+        for table, band_key in zip(self._tables, self._band_keys(signature)):
+            bucket = table[band_key]
+            bucket.discard(key)
+            if not bucket:
+                del table[band_key]
+
+    def candidates(self, signature: Sequence[int]) -> Set[Hashable]:
+        """
+        Get the documents sharing at least one band with a signature.
+
+        Args:
+            signature: MinHash signature (an array or a list of ints)
+
+        Returns:
+            Set of candidate keys
+        """
+        signature = self._as_signature(signature)
+        result: Set[Hashable] = set()
+        for table, band_key in zip(self._tables, self._band_keys(signature)):
+            bucket = table.get(band_key)
+            if bucket:
+                result.update(bucket)
+        return result
+
+    def query(self, signature: Sequence[int], threshold: Optional[float] = None) -> List[tuple]:
+        """
+        Find near-duplicates of a signature.
+
+        Args:
+            signature: MinHash signature (an array or a list of ints)
+            threshold: Minimum estimated Jaccard similarity (all candidates if None)
+
+        Returns:
+            List of (key, estimated similarity) tuples sorted by decreasing similarity
+        """
+        signature = self._as_signature(signature)
+        results = []
+        for key in self.candidates(signature):
+            similarity = MinHash.jaccard(signature, self._signatures[key])
+            if threshold is None or similarity >= threshold:
+                results.append((key, similarity))
+
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a file.
+
+        Only the signatures are stored; the band tables are rebuilt on load.
+        The file is a pickle, so only load files from trusted sources.
+
+        Args:
+            path: Output file path
+        """
+        state = {
+            'num_perm': self.num_perm,
+            'bands': self.bands,
+            'signatures': self._signatures,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'LSHIndex':
+        """
+        Load an index saved with ``save``.
+
+        The file is unpickled, so only load files from trusted sources.
+
+        Args:
+            path: Input file path
+
+        Returns:
+            LSHIndex
+        """
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+
+        index = cls(num_perm=state['num_perm'], bands=state['bands'])
+        for key, signature in state['signatures'].items():
+            index.add(key, signature)
+        return index
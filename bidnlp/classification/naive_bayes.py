@@ -0,0 +1,303 @@
+"""
+Naive Bayes Text Classifier
+
+Provides a multinomial Naive Bayes classifier over the sparse output of the
+feature extractors.
+"""
+
+import math
+import pickle
+from array import array
+from typing import Dict, List, Optional, Sequence, Union
+
+from .base_classifier import BaseTextClassifier
+from .feature_extraction import BagOfWords, saved_vectorizer
+from .sparse import CSRMatrix
+
+
+class NaiveBayesClassifier(BaseTextClassifier):
+    """
+    Multinomial Naive Bayes classifier.
+
+    Texts are preprocessed, turned into sparse vectors by a feature extractor
+    (``BagOfWords`` by default; ``TfidfVectorizer`` or a non-negative
+    ``HashingVectorizer`` also work) and scored with per-class feature log
+    probabilities. Feature counts are accumulated in one ``array`` per class,
+    so training can continue over a stream with ``partial_fit``.
+    """
+
+    def __init__(self,
+                 vectorizer=None,
+                 alpha: float = 1.0,
+                 normalize: bool = True,
+                 remove_stopwords: bool = False):
+        """
+        Initialize the classifier.
+
+        Args:
+            vectorizer: Feature extractor (a new BagOfWords if None)
+            alpha: Additive (Laplace) smoothing
+            normalize: Whether to normalize text
+            remove_stopwords: Whether to remove stop words
+        """
+        super().__init__(normalize=normalize, remove_stopwords=remove_stopwords)
+        if alpha <= 0:
+            raise ValueError("alpha must be positive")
+
+        self.vectorizer = vectorizer if vectorizer is not None else BagOfWords()
+        self.alpha = alpha
+        self.classes: List[str] = []
+        self.n_features = 0
+        self._class_index: Dict[str, int] = {}
+        self._class_counts = array('d')
+        self._feature_counts: List[array] = []
+        # Log probabilities derived from the counts; None when stale
+        self._class_log_prior: Optional[List[float]] = None
+        self._feature_log_prob: Optional[List[array]] = None
+
+    def _vectorize(self, texts: Sequence[str]) -> CSRMatrix:
+        """Preprocess texts and transform them with the fitted vectorizer."""
+        return self.vectorizer.transform([self.preprocess(text) for text in texts], output='csr')
+
+    def train(self, texts: List[str], labels: List[str]) -> None:
+        """
+        Fit the vectorizer and the classifier on labeled texts.
+
+        Args:
+            texts: List of training texts
+            labels: List of corresponding labels
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+
+        processed = [self.preprocess(text) for text in texts]
+        matrix = self.vectorizer.fit_transform(processed, output='csr')
+
+        self.classes = []
+        self.n_features = 0
+        self._class_index = {}
+        self._class_counts = array('d')
+        self._feature_counts = []
+        self.partial_fit_vectors(matrix, labels)
+
+    def partial_fit(self, texts: List[str], labels: List[str]) -> None:
+        """
+        Update the classifier with more labeled texts.
+
+        The vectorizer must already be fitted (or be a HashingVectorizer), so
+        that feature indices stay fixed between calls. New labels may appear
+        in any call.
+
+        Args:
+            texts: List of training texts
+            labels: List of corresponding labels
+        """
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+        if not getattr(self.vectorizer, '_is_fitted', False):
+            raise ValueError("partial_fit requires a fitted vectorizer or a HashingVectorizer")
+
+        self.partial_fit_vectors(self._vectorize(texts), labels)
+
+    def partial_fit_vectors(self,
+                            vectors: Union[CSRMatrix, Sequence[Dict[int, float]]],
+                            labels: Sequence[str]) -> None:
+        """
+        Update the classifier with labeled sparse vectors.
+
+        Args:
+            vectors: CSRMatrix or list of sparse vectors with non-negative values
+            labels: Label of each vector
+        """
+        if not isinstance(vectors, CSRMatrix):
+            vectors = CSRMatrix.from_dicts(vectors, n_features=self.n_features or None)
+        if len(vectors) != len(labels):
+            raise ValueError("vectors and labels must have the same length")
+        if any(value < 0 for value in vectors.data):
+            raise ValueError("Naive Bayes requires non-negative feature values")
+
+        n_features = vectors.n_features
+        if n_features > self.n_features:
+            # Grow the tables (e.g. vectors given as dicts with new indices)
+            extra = array('d', [0.0]) * (n_features - self.n_features)
+            for counts in self._feature_counts:
+                counts.extend(extra)
+            self.n_features = n_features
+
+        indptr, indices, data = vectors.indptr, vectors.indices, vectors.data
+        for i, label in enumerate(labels):
+            class_id = self._class_index.get(label)
+            if class_id is None:
+                class_id = len(self.classes)
+                self._class_index[label] = class_id
+                self.classes.append(label)
+                self._class_counts.append(0.0)
+                self._feature_counts.append(array('d', [0.0]) * self.n_features)
+
+            self._class_counts[class_id] += 1
+            counts = self._feature_counts[class_id]
+            for pos in range(indptr[i], indptr[i + 1]):
+                counts[indices[pos]] += data[pos]
+
+        self._class_log_prior = None
+        self._feature_log_prob = None
+        self._is_trained = len(self.classes) > 0
+
+    def _log_probabilities(self):
+        """Compute (and cache) the class log priors and feature log probabilities."""
+        if self._feature_log_prob is None:
+            if not self._is_trained:
+                raise ValueError("Classifier must be trained before prediction")
+
+            total_docs = sum(self._class_counts)
+            self._class_log_prior = [math.log(count / total_docs) for count in self._class_counts]
+
+            alpha = self.alpha
+            log_probs = []
+            for counts in self._feature_counts:
+                log_total = math.log(sum(counts) + alpha * self.n_features)
+                log_probs.append(array('d', [math.log(count + alpha) - log_total
+                                             for count in counts]))
+            self._feature_log_prob = log_probs
+
+        return self._class_log_prior, self._feature_log_prob
+
+    def joint_log_likelihood(self, vectors: Union[CSRMatrix, Sequence[Dict[int, float]]]) -> List[List[float]]:
+        """
+        Score a batch of sparse vectors.
+
+        Args:
+            vectors: CSRMatrix or list of sparse vectors
+
+        Returns:
+            For each vector, the joint log likelihood of every class (in the
+            order of ``classes``)
+        """
+        class_log_prior, feature_log_prob = self._log_probabilities()
+        if not isinstance(vectors, CSRMatrix):
+            vectors = CSRMatrix.from_dicts(vectors, n_features=self.n_features)
+
+        return [[prior + dot for prior, dot in zip(class_log_prior, row)]
+                for row in vectors.dot(feature_log_prob)]
+
+    def _proba_from_scores(self, scores: List[float]) -> Dict[str, float]:
+        """Normalize joint log likelihoods into class probabilities."""
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return {label: value / total for label, value in zip(self.classes, exps)}
+
+    def predict(self, text: str) -> str:
+        """
+        Predict the class of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Predicted class label
+        """
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: List[str]) -> List[str]:
+        """
+        Predict the classes of multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of predicted class labels
+        """
+        self._log_probabilities()
+        classes = self.classes
+        return [classes[max(range(len(row)), key=row.__getitem__)]
+                for row in self.joint_log_likelihood(self._vectorize(texts))]
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """
+        Predict class probabilities for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary mapping class labels to probabilities
+        """
+        return self.predict_proba_batch([text])[0]
+
+    def predict_proba_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Predict class probabilities for multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of dictionaries mapping class labels to probabilities
+        """
+        self._log_probabilities()
+        return [self._proba_from_scores(row)
+                for row in self.joint_log_likelihood(self._vectorize(texts))]
+
+    def save(self, path: str) -> None:
+        """
+        Save the trained model (including the vectorizer) to a file.
+
+        Only the fitted vectorizer state (vocabulary, IDF or document
+        frequencies) and the class tables are stored, not the vectorizer's
+        running counts. The file is a pickle, so only load files from
+        trusted sources.
+
+        Args:
+            path: Output file path
+        """
+        state = {
+            'normalize': self.normalize,
+            'remove_stopwords': self.remove_stopwords,
+            'alpha': self.alpha,
+            'vectorizer': saved_vectorizer(self.vectorizer),
+            'classes': self.classes,
+            'n_features': self.n_features,
+            'class_counts': self._class_counts,
+            'feature_counts': self._feature_counts,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'NaiveBayesClassifier':
+        """
+        Load a model saved with ``save``.
+
+        The file is unpickled, so only load files from trusted sources.
+
+        Args:
+            path: Input file path
+
+        Returns:
+            NaiveBayesClassifier
+        """
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+
+        classifier = cls(vectorizer=state['vectorizer'], alpha=state['alpha'],
+                         normalize=state['normalize'],
+                         remove_stopwords=state['remove_stopwords'])
+        classifier.classes = state['classes']
+        classifier.n_features = state['n_features']
+        classifier._class_index = {label: i for i, label in enumerate(classifier.classes)}
+        classifier._class_counts = state['class_counts']
+        classifier._feature_counts = state['feature_counts']
+        classifier._is_trained = len(classifier.classes) > 0
+        return classifier
+
+    def get_params(self) -> Dict[str, any]:
+        """Get classifier parameters."""
+        params = super().get_params()
+        params.update({
+            'alpha': self.alpha,
+            'classes': list(self.classes),
+            'n_features': self.n_features,
+        })
+        return params
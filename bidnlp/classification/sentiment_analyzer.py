@@ -4,12 +4,135 @@ Persian Sentiment Analyzer
 Provides sentiment analysis for Persian text using keyword-based approach.
 """
 
-from typing import List, Dict, Optional
+import json
+import math
+from array import array
+from collections import Counter
+from itertools import zip_longest
+from typing import Iterable, List, Dict, Optional, Tuple
 from .base_classifier import BaseTextClassifier
+from .keyword_matcher import ZWNJ, KeywordMatcher
+from ..utils.parallel import map_chunks
+
+# Number of words before and after a sentiment word checked for negation
+NEGATION_WINDOW = 2
+
+# Attributes the compiled lexicon is built from
+_LEXICON_ATTRIBUTES = frozenset((
+    'positive_keywords', 'negative_keywords', 'negation_keywords', 'term_weights', 'intensifiers',
+))
+
+
+class SentimentBatchResult:
+    """
+    Columnar sentiment results for a batch of texts.
+
+    Row ``i`` of every column belongs to the ``i``-th input text:
+
+    - ``labels``: 'positive', 'negative' or 'neutral'
+    - ``scores``: score of the label (0.0 to 1.0), as in ``analyze``
+    - ``sentiment_scores``: signed score (-1.0 to 1.0), as in ``get_sentiment_score``
+    - ``positive_proba``, ``negative_proba``, ``neutral_proba``: as in ``predict_proba``
+    - ``positive_counts``, ``negative_counts``: as in ``analyze``
+    """
+
+    def __init__(self):
+        """Initialize an empty result."""
+        self.labels: List[str] = []
+        self.scores = array('d')
+        self.sentiment_scores = array('d')
+        self.positive_proba = array('d')
+        self.negative_proba = array('d')
+        self.neutral_proba = array('d')
+        self.positive_counts = array('q')
+        self.negative_counts = array('q')
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __repr__(self) -> str:
+        return f"SentimentBatchResult(size={len(self)})"
+
+    def append(self, label: str, score: float, positive_count: int, negative_count: int) -> None:
+        """
+        Append the result of one text.
+
+        Args:
+            label: Sentiment label
+            score: Score of the label
+            positive_count: Number of positive hits
+            negative_count: Number of negative hits
+        """
+        proba = PersianSentimentAnalyzer._probabilities(label, score)
+        self.labels.append(label)
+        self.scores.append(score)
+        self.sentiment_scores.append(PersianSentimentAnalyzer._signed_score(label, score))
+        self.positive_proba.append(proba['positive'])
+        self.negative_proba.append(proba['negative'])
+        self.neutral_proba.append(proba['neutral'])
+        self.positive_counts.append(positive_count)
+        self.negative_counts.append(negative_count)
+
+    def extend(self, other: 'SentimentBatchResult') -> None:
+        """
+        Append all rows of another result.
+
+        Args:
+            other: Result to append
+        """
+        self.labels.extend(other.labels)
+        self.scores.extend(other.scores)
+        self.sentiment_scores.extend(other.sentiment_scores)
+        self.positive_proba.extend(other.positive_proba)
+        self.negative_proba.extend(other.negative_proba)
+        self.neutral_proba.extend(other.neutral_proba)
+        self.positive_counts.extend(other.positive_counts)
+        self.negative_counts.extend(other.negative_counts)
+
+    def probabilities(self, i: int) -> Dict[str, float]:
+        """
+        Get the probabilities of one row in the ``predict_proba`` format.
+
+        Args:
+            i: Row number
+
+        Returns:
+            Dictionary mapping sentiments to probabilities
+        """
+        return {
+            'positive': self.positive_proba[i],
+            'negative': self.negative_proba[i],
+            'neutral': self.neutral_proba[i],
+        }
+
+
+def _analyze_chunk(analyzer: 'PersianSentimentAnalyzer', texts: List[str]) -> SentimentBatchResult:
+    """Analyze one chunk of texts in a worker process."""
+    result = SentimentBatchResult()
+    for text in texts:
+        positive_count, negative_count, positive_weight, negative_weight, _, _ = \
+            analyzer._count(text)
+        result.append(*analyzer._label(positive_weight, negative_weight),
+                      positive_count, negative_count)
+    return result
 
 
 class PersianSentimentAnalyzer(BaseTextClassifier):
-    """Keyword-based sentiment analyzer for Persian text."""
+    """
+    Keyword-based sentiment analyzer for Persian text.
+
+    The keyword sets are compiled on first use into a word to polarity map
+    for single words and a KeywordMatcher for multi-word and ZWNJ-joined
+    entries such as 'خیلی خوب'. Keywords are preprocessed like the input
+    text. The compiled lexicon is rebuilt after a keyword set,
+    ``term_weights`` or ``intensifiers`` is reassigned or changed through
+    the methods of this class; edit them through those methods rather
+    than in place.
+
+    Each keyword counts with its weight from ``term_weights`` (1.0 by
+    default), optionally scaled by intensifiers. ``train`` learns the
+    weights from labeled texts, and ``save``/``load`` store the model as JSON.
+    """
 
     # Positive keywords
     DEFAULT_POSITIVE_KEYWORDS = {
@@ -39,12 +162,20 @@ class PersianSentimentAnalyzer(BaseTextClassifier):
         'نیست', 'نبود', 'ن\u200cیست', 'ن\u200cبود',  # With ZWNJ
     }
 
+    # Intensifiers (> 1) and diminishers (< 1) multiplying the next sentiment word
+    DEFAULT_INTENSIFIERS = {
+        'خیلی': 1.5, 'بسیار': 1.5, 'واقعا': 1.3, 'کاملا': 1.3, 'شدیدا': 1.5,
+        'کمی': 0.5, 'نسبتا': 0.7, 'تقریبا': 0.8, 'اندکی': 0.5,
+    }
+
     def __init__(self,
                  normalize: bool = True,
                  remove_stopwords: bool = False,
                  positive_keywords: Optional[set] = None,
                  negative_keywords: Optional[set] = None,
-                 custom_keywords: Optional[Dict[str, set]] = None):
+                 custom_keywords: Optional[Dict[str, set]] = None,
+                 term_weights: Optional[Dict[str, float]] = None,
+                 intensifiers: Optional[Dict[str, float]] = None):
         """
         Initialize sentiment analyzer.
 
@@ -54,9 +185,18 @@ class PersianSentimentAnalyzer(BaseTextClassifier):
             positive_keywords: Custom positive keywords (if None, use defaults)
             negative_keywords: Custom negative keywords (if None, use defaults)
             custom_keywords: Dictionary with 'positive' and 'negative' keys
+            term_weights: Weight (magnitude) per keyword; keywords not listed weigh 1.0
+            intensifiers: Multiplier per modifier word applied to the sentiment
+                word that directly follows it (none if None; see DEFAULT_INTENSIFIERS)
         """
         super().__init__(normalize=normalize, remove_stopwords=remove_stopwords)
 
+        # Bumped on every lexicon change; the compiled lexicon records the
+        # version it was built from
+        self._version = 0
+        self._compiled = None
+        self._compiled_version = None
+
         # Initialize keywords
         if custom_keywords:
             self.positive_keywords = custom_keywords.get('positive', set())
@@ -66,151 +206,368 @@ class PersianSentimentAnalyzer(BaseTextClassifier):
             self.negative_keywords = negative_keywords or self.DEFAULT_NEGATIVE_KEYWORDS.copy()
 
         self.negation_keywords = self.NEGATION_KEYWORDS.copy()
+        self.term_weights = term_weights or {}
+        self.intensifiers = intensifiers or {}
         self._is_trained = True  # Keyword-based, no training needed
 
-    def train(self, texts: List[str], labels: List[str]) -> None:
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _LEXICON_ATTRIBUTES:
+            # Lexicon replaced: recompile on next use
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Mark the compiled lexicon as outdated so it is rebuilt on next use."""
+        self._version += 1
+
+    def train(self,
+              texts: Iterable[str],
+              labels: Iterable[str],
+              alpha: float = 1.0,
+              min_df: int = 2,
+              max_terms: Optional[int] = None) -> None:
         """
-        Train is not required for keyword-based sentiment analysis.
-        This method can be used to extract keywords from training data.
+        Learn a weighted lexicon from labeled texts.
+
+        Term weights are Naive Bayes log-count ratios: with ``p`` and ``q``
+        the smoothed numbers of positive and negative texts containing a
+        term, the weight is ``log((p / |p|) / (q / |q|))``. Terms with a
+        positive weight become positive keywords, the others negative
+        keywords. Texts are read once, in a streaming fashion; 'neutral' and
+        other labels are ignored. The learned lexicon replaces the current
+        keywords.
 
         Args:
-            texts: List of training texts (not used)
-            labels: List of corresponding labels (not used)
+            texts: Training texts
+            labels: Corresponding labels ('positive' or 'negative')
+            alpha: Smoothing added to every term count
+            min_df: Minimum number of training texts containing a term
+            max_terms: Keep only the terms with the largest absolute weight
+
+        Raises:
+            ValueError: If texts and labels differ in length or a class has no texts
         """
-        # Keyword-based approach doesn't require training
-        # But we mark it as trained
+        doc_freq = {'positive': Counter(), 'negative': Counter()}
+        missing = object()
+
+        for text, label in zip_longest(texts, labels, fillvalue=missing):
+            if text is missing or label is missing:
+                raise ValueError("texts and labels must have the same length")
+            counter = doc_freq.get(label)
+            if counter is not None:
+                counter.update(set(self.preprocess(text).split()))
+
+        positive, negative = doc_freq['positive'], doc_freq['negative']
+        if not positive or not negative:
+            raise ValueError("Training data must contain positive and negative texts")
+
+        vocabulary = [term for term in positive.keys() | negative.keys()
+                      if positive[term] + negative[term] >= min_df]
+        positive_total = sum(positive[term] + alpha for term in vocabulary)
+        negative_total = sum(negative[term] + alpha for term in vocabulary)
+
+        weights = {}
+        for term in vocabulary:
+            weight = math.log(((positive[term] + alpha) / positive_total) /
+                              ((negative[term] + alpha) / negative_total))
+            if weight:
+                weights[term] = weight
+
+        if max_terms is not None:
+            weights = dict(sorted(weights.items(), key=lambda x: abs(x[1]),
+                                  reverse=True)[:max_terms])
+
+        self.positive_keywords = {term for term, weight in weights.items() if weight > 0}
+        self.negative_keywords = {term for term, weight in weights.items() if weight < 0}
+        self.term_weights = {term: abs(weight) for term, weight in weights.items()}
         self._is_trained = True
 
+    def save(self, path: str) -> None:
+        """
+        Save the lexicon model as JSON.
+
+        Args:
+            path: Output file path
+        """
+        model = {
+            'version': 1,
+            'normalize': self.normalize,
+            'remove_stopwords': self.remove_stopwords,
+            'positive': {kw: self.term_weights.get(kw, 1.0) for kw in sorted(self.positive_keywords)},
+            'negative': {kw: self.term_weights.get(kw, 1.0) for kw in sorted(self.negative_keywords)},
+            'negation': sorted(self.negation_keywords),
+            'intensifiers': self.intensifiers,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(model, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'PersianSentimentAnalyzer':
+        """
+        Load a lexicon model saved with ``save``.
+
+        Args:
+            path: Input file path
+
+        Returns:
+            PersianSentimentAnalyzer
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            model = json.load(f)
+
+        weights = {**model['negative'], **model['positive']}
+        analyzer = cls(normalize=model['normalize'],
+                       remove_stopwords=model['remove_stopwords'],
+                       custom_keywords={'positive': set(model['positive']),
+                                        'negative': set(model['negative'])},
+                       term_weights={kw: w for kw, w in weights.items() if w != 1.0},
+                       intensifiers=model['intensifiers'])
+        analyzer.negation_keywords = set(model['negation'])
+        return analyzer
+
     def add_positive_keyword(self, keyword: str) -> None:
         """Add a positive keyword."""
         self.positive_keywords.add(keyword)
+        self._invalidate()
 
     def add_negative_keyword(self, keyword: str) -> None:
         """Add a negative keyword."""
         self.negative_keywords.add(keyword)
+        self._invalidate()
 
     def add_positive_keywords(self, keywords: List[str]) -> None:
         """Add multiple positive keywords."""
         self.positive_keywords.update(keywords)
+        self._invalidate()
 
     def add_negative_keywords(self, keywords: List[str]) -> None:
         """Add multiple negative keywords."""
         self.negative_keywords.update(keywords)
+        self._invalidate()
+
+    def remove_keyword(self, keyword: str) -> None:
+        """Remove a keyword from the positive and negative keywords."""
+        self.positive_keywords.discard(keyword)
+        self.negative_keywords.discard(keyword)
+        self._invalidate()
+
+    def add_negation_keyword(self, keyword: str) -> None:
+        """Add a negation keyword."""
+        self.negation_keywords.add(keyword)
+        self._invalidate()
+
+    def remove_negation_keyword(self, keyword: str) -> None:
+        """Remove a negation keyword."""
+        self.negation_keywords.discard(keyword)
+        self._invalidate()
+
+    def set_term_weight(self, keyword: str, weight: Optional[float]) -> None:
+        """Set the weight of a keyword (None resets it to 1.0)."""
+        if weight is None:
+            self.term_weights.pop(keyword, None)
+        else:
+            self.term_weights[keyword] = weight
+        self._invalidate()
 
-    def _check_negation(self, words: List[str], index: int) -> bool:
+    def set_intensifier(self, word: str, multiplier: Optional[float]) -> None:
+        """Set the multiplier of a modifier word (None removes it)."""
+        if multiplier is None:
+            self.intensifiers.pop(word, None)
+        else:
+            self.intensifiers[word] = multiplier
+        self._invalidate()
+
+    def _keyword_forms(self, keyword: str) -> List[str]:
+        """Get the forms of a keyword to match: as given and preprocessed."""
+        forms = [keyword]
+        processed = self.preprocess(keyword)
+        if processed and processed != keyword:
+            forms.append(processed)
+        return forms
+
+    def _compile(self) -> Tuple[Dict[str, float], Optional[KeywordMatcher], frozenset,
+                                Dict[str, float]]:
         """
-        Check if a word at given index is negated.
-
-        Args:
-            words: List of words
-            index: Index to check
+        Compile the keyword sets, reusing the last compilation if unchanged.
 
         Returns:
-            True if word is negated
+            Tuple of (single word to signed weight map, phrase matcher or None
+            if there are no phrases, negation words, modifier multipliers)
         """
-        # Check 2 words before for negation
-        for i in range(max(0, index - 2), index):
-            if words[i] in self.negation_keywords:
-                return True
-
-        # Check 2 words after for negation (Persian often puts negation after)
-        for i in range(index + 1, min(len(words), index + 3)):
-            if words[i] in self.negation_keywords:
-                return True
-
-        return False
-
-    def analyze(self, text: str) -> Dict[str, any]:
+        if self._compiled_version == self._version:
+            return self._compiled
+
+        words: Dict[str, float] = {}
+        phrases: Dict[str, Tuple[str, float]] = {}
+        # Positive entries are added last so they win, as in the keyword sets
+        for keywords, polarity in ((self.negative_keywords, -1), (self.positive_keywords, 1)):
+            for keyword in keywords:
+                weight = polarity * self.term_weights.get(keyword, 1.0)
+                for form in self._keyword_forms(keyword):
+                    if ' ' in form.strip() or ZWNJ in form:
+                        phrases[form] = (keyword, weight)
+                    else:
+                        words[form.strip()] = weight
+
+        matcher = None
+        if phrases:
+            matcher = KeywordMatcher()
+            for phrase, value in phrases.items():
+                matcher.add(phrase, value)
+
+        negations = frozenset(form for keyword in self.negation_keywords
+                              for form in self._keyword_forms(keyword))
+        modifiers = {form: multiplier for keyword, multiplier in self.intensifiers.items()
+                     for form in self._keyword_forms(keyword)}
+
+        self._compiled = (words, matcher, negations, modifiers)
+        self._compiled_version = self._version
+        return self._compiled
+
+    @staticmethod
+    def _select_phrases(matches: List[tuple]) -> Dict[int, tuple]:
+        """Select non-overlapping phrase matches, leftmost-longest first."""
+        selected = {}
+        covered_until = 0
+        for start, end, value in sorted(matches, key=lambda m: (m[0], -m[1])):
+            if start >= covered_until:
+                selected[start] = (end, value)
+                covered_until = end
+        return selected
+
+    def _count(self, text: str) -> Tuple[int, int, float, float, List[str], List[str]]:
         """
-        Analyze sentiment of text.
+        Count and weigh the positive and negative hits of a text in one scan.
+
+        A sentiment word or phrase is negated when a negation word other than
+        itself occurs within two words before or after it, and its weight is multiplied by
+        the intensifiers directly before it.
 
         Args:
             text: Input text
 
         Returns:
-            Dictionary with sentiment analysis results
+            Tuple of (positive count, negative count, positive weight,
+            negative weight, positive words, negative words)
         """
         # Preprocess
         processed_text = self.preprocess(text)
         words = processed_text.split()
+        lexicon, matcher, negations, modifiers = self._compile()
+
+        phrase_hits = {}
+        if matcher is not None:
+            phrase_hits = self._select_phrases(matcher.find_all(processed_text))
+
+        # hits: [start, end, weight, text, negated]; hits[pending:] may
+        # still be negated by a negation word that follows them
+        hits = []
+        pending = 0
+        last_negation = -NEGATION_WINDOW - 1
+        # Product of the consecutive modifiers ending at modifier_end
+        modifier = 1.0
+        modifier_end = -1
+
+        i = 0
+        num_words = len(words)
+        while i < num_words:
+            phrase = phrase_hits.get(i)
+            if phrase is not None:
+                end, (entry, polarity) = phrase
+            else:
+                entry = words[i]
+                polarity = lexicon.get(entry)
+                end = i + 1
+
+                multiplier = modifiers.get(entry) if not polarity else None
+                if multiplier is not None:
+                    modifier = modifier * multiplier if modifier_end == i else multiplier
+                    modifier_end = end
+
+            # Checked before the entry's own words, which do not negate it
+            negated = i - last_negation <= NEGATION_WINDOW
+            for j in range(i, end):
+                if words[j] in negations:
+                    while pending < len(hits) and hits[pending][1] + NEGATION_WINDOW <= j:
+                        pending += 1
+                    for hit in hits[pending:]:
+                        hit[4] = True
+                    last_negation = j
+
+            if polarity:
+                if modifier_end == i:
+                    polarity *= modifier
+                hits.append([i, end, polarity, entry, negated])
+            i = end
 
         # Count sentiments
         positive_count = 0
         negative_count = 0
+        positive_weight = 0.0
+        negative_weight = 0.0
         positive_words = []
         negative_words = []
 
-        for i, word in enumerate(words):
-            is_negated = self._check_negation(words, i)
-
-            if word in self.positive_keywords:
+        for _, _, weight, entry, is_negated in hits:
+            if weight > 0:
                 if is_negated:
                     negative_count += 1
-                    negative_words.append(f"NOT {word}")
+                    negative_weight += weight
+                    negative_words.append(f"NOT {entry}")
                 else:
                     positive_count += 1
-                    positive_words.append(word)
-
-            elif word in self.negative_keywords:
+                    positive_weight += weight
+                    positive_words.append(entry)
+            else:
                 if is_negated:
                     positive_count += 1
-                    positive_words.append(f"NOT {word}")
+                    positive_weight -= weight
+                    positive_words.append(f"NOT {entry}")
                 else:
                     negative_count += 1
-                    negative_words.append(word)
-
-        # Calculate sentiment
-        total = positive_count + negative_count
+                    negative_weight -= weight
+                    negative_words.append(entry)
 
-        if total == 0:
-            sentiment = 'neutral'
-            score = 0.0
-        elif positive_count > negative_count:
-            sentiment = 'positive'
-            score = (positive_count - negative_count) / total
-        elif negative_count > positive_count:
-            sentiment = 'negative'
-            score = (negative_count - positive_count) / total
-        else:
-            sentiment = 'neutral'
-            score = 0.0
-
-        return {
-            'sentiment': sentiment,
-            'score': score,
-            'positive_count': positive_count,
-            'negative_count': negative_count,
-            'positive_words': positive_words,
-            'negative_words': negative_words,
-        }
+        return (positive_count, negative_count, positive_weight, negative_weight,
+                positive_words, negative_words)
 
-    def predict(self, text: str) -> str:
+    @staticmethod
+    def _label(positive_weight: float, negative_weight: float) -> Tuple[str, float]:
         """
-        Predict sentiment class.
+        Derive the sentiment label and its score from the hit weights.
+
+        With unit weights these are the hit counts.
 
         Args:
-            text: Input text
+            positive_weight: Total weight of positive hits
+            negative_weight: Total weight of negative hits
 
         Returns:
-            Sentiment label: 'positive', 'negative', or 'neutral'
+            Tuple of (sentiment, score)
         """
-        result = self.analyze(text)
-        return result['sentiment']
+        total = positive_weight + negative_weight
 
-    def predict_proba(self, text: str) -> Dict[str, float]:
+        if total == 0:
+            return 'neutral', 0.0
+        elif positive_weight > negative_weight:
+            return 'positive', (positive_weight - negative_weight) / total
+        elif negative_weight > positive_weight:
+            return 'negative', (negative_weight - positive_weight) / total
+        else:
+            return 'neutral', 0.0
+
+    @staticmethod
+    def _probabilities(sentiment: str, score: float) -> Dict[str, float]:
         """
-        Predict sentiment probabilities.
+        Convert a sentiment label and score to probabilities.
 
         Args:
-            text: Input text
+            sentiment: Sentiment label
+            score: Score of the label
 
         Returns:
             Dictionary mapping sentiments to probabilities
         """
-        result = self.analyze(text)
-        sentiment = result['sentiment']
-        score = result['score']
-
         if sentiment == 'neutral':
             return {
                 'positive': 0.33,
@@ -236,6 +593,95 @@ class PersianSentimentAnalyzer(BaseTextClassifier):
                 'neutral': neutral_prob
             }
 
+    @staticmethod
+    def _signed_score(sentiment: str, score: float) -> float:
+        """Convert a sentiment label and score to a score from -1.0 to 1.0."""
+        if sentiment == 'positive':
+            return score
+        elif sentiment == 'negative':
+            return -score
+        else:
+            return 0.0
+
+    def analyze(self, text: str) -> Dict[str, any]:
+        """
+        Analyze sentiment of text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary with sentiment analysis results
+        """
+        (positive_count, negative_count, positive_weight, negative_weight,
+         positive_words, negative_words) = self._count(text)
+        sentiment, score = self._label(positive_weight, negative_weight)
+
+        return {
+            'sentiment': sentiment,
+            'score': score,
+            'positive_count': positive_count,
+            'negative_count': negative_count,
+            'positive_weight': positive_weight,
+            'negative_weight': negative_weight,
+            'positive_words': positive_words,
+            'negative_words': negative_words,
+        }
+
+    def analyze_batch(self,
+                      texts: Iterable[str],
+                      n_jobs: Optional[int] = 1,
+                      chunksize: int = 1000) -> SentimentBatchResult:
+        """
+        Analyze the sentiment of many texts.
+
+        Each text is preprocessed and scanned once, and all views of the
+        result (label, scores, probabilities and counts) are derived from
+        that single analysis.
+
+        Args:
+            texts: Iterable of input texts (consumed lazily)
+            n_jobs: Number of processes (-1 for all CPUs)
+            chunksize: Number of texts per chunk sent to a worker
+
+        Returns:
+            SentimentBatchResult with one row per text
+        """
+        # Compile before forking so workers inherit the lexicon
+        self._compile()
+
+        result = SentimentBatchResult()
+        for chunk in map_chunks(_analyze_chunk, self, texts,
+                                n_jobs=n_jobs, chunksize=chunksize):
+            result.extend(chunk)
+        return result
+
+    def predict(self, text: str) -> str:
+        """
+        Predict sentiment class.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Sentiment label: 'positive', 'negative', or 'neutral'
+        """
+        result = self.analyze(text)
+        return result['sentiment']
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """
+        Predict sentiment probabilities.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Dictionary mapping sentiments to probabilities
+        """
+        result = self.analyze(text)
+        return self._probabilities(result['sentiment'], result['score'])
+
     def get_sentiment_score(self, text: str) -> float:
         """
         Get sentiment score (-1.0 to 1.0).
@@ -247,12 +693,7 @@ class PersianSentimentAnalyzer(BaseTextClassifier):
             Score: -1.0 (very negative) to 1.0 (very positive)
         """
         result = self.analyze(text)
-        if result['sentiment'] == 'positive':
-            return result['score']
-        elif result['sentiment'] == 'negative':
-            return -result['score']
-        else:
-            return 0.0
+        return self._signed_score(result['sentiment'], result['score'])
 
     def get_params(self) -> Dict[str, any]:
         """Get analyzer parameters."""
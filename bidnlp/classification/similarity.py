@@ -0,0 +1,223 @@
+"""
+Similarity Search over Sparse Vectors
+
+Provides top-k cosine similarity search and near-duplicate detection over
+the sparse output of the feature extractors.
+"""
+
+import heapq
+import math
+from array import array
+from bisect import bisect_right
+from operator import itemgetter
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+from .sparse import CSRMatrix
+
+
+def _as_csr(vectors: Union[CSRMatrix, Sequence[Dict[int, float]]]) -> CSRMatrix:
+    """Accept a CSRMatrix or the list-of-dicts format."""
+    if isinstance(vectors, CSRMatrix):
+        return vectors
+    return CSRMatrix.from_dicts(vectors)
+
+
+def _normalized_row(indices: Sequence[int], values: Sequence[float]) -> List[Tuple[int, float]]:
+    """L2-normalize one sparse row."""
+    norm = math.sqrt(sum(v * v for v in values))
+    if norm == 0:
+        return []
+    return [(idx, v / norm) for idx, v in zip(indices, values)]
+
+
+class SimilaritySearch:
+    """
+    Cosine similarity search over sparse document vectors.
+
+    ``fit`` normalizes the indexed rows once and stores them column-wise
+    (an inverted index from feature to documents). A query then only touches
+    the documents sharing at least one feature with it, instead of comparing
+    against every document. Queries are processed in chunks, so memory stays
+    bounded by the chunk size.
+    """
+
+    def __init__(self, chunksize: int = 1000):
+        """
+        Initialize the search index.
+
+        Args:
+            chunksize: Number of query rows processed per chunk
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+
+        self.chunksize = chunksize
+        self.num_documents = 0
+        self.n_features = 0
+        self._normalized = CSRMatrix()
+        self._colptr = array('q', [0])
+        self._rows = array('i')
+        self._values = array('d')
+
+    def fit(self, vectors: Union[CSRMatrix, Sequence[Dict[int, float]]]) -> 'SimilaritySearch':
+        """
+        Index document vectors.
+
+        Args:
+            vectors: CSRMatrix or list of sparse vectors (e.g. TfidfVectorizer output)
+
+        Returns:
+            Self
+        """
+        matrix = _as_csr(vectors)
+        num_rows, n_features = matrix.shape
+        indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+
+        normalized = CSRMatrix(n_features=n_features)
+        for r in range(num_rows):
+            start, end = indptr[r], indptr[r + 1]
+            normalized.append_row(_normalized_row(indices[start:end], data[start:end]))
+        # Rows with a zero norm are empty from here on
+        indptr, indices, data = normalized.indptr, normalized.indices, normalized.data
+
+        # Column counts -> column pointers (counting sort of CSR into CSC)
+        counts = [0] * (n_features + 1)
+        for idx in indices:
+            counts[idx + 1] += 1
+        colptr = array('q', [0]) * (n_features + 1)
+        total = 0
+        for j in range(n_features + 1):
+            total += counts[j]
+            colptr[j] = total
+
+        rows = array('i', [0]) * len(indices)
+        values = array('d', [0.0]) * len(indices)
+        fill = colptr[:-1]
+
+        # Rows are visited in order, so each column lists documents ascending
+        for r in range(num_rows):
+            start, end = indptr[r], indptr[r + 1]
+            for idx, value in zip(indices[start:end], data[start:end]):
+                pos = fill[idx]
+                rows[pos] = r
+                values[pos] = value
+                fill[idx] = pos + 1
+
+        self._normalized = normalized
+        self._colptr, self._rows, self._values = colptr, rows, values
+        self.num_documents = num_rows
+        self.n_features = n_features
+        return self
+
+    def _scores(self, row: List[Tuple[int, float]], min_doc: int = 0) -> Dict[int, float]:
+        """Accumulate the dot products of a normalized row with indexed documents."""
+        colptr, rows, values = self._colptr, self._rows, self._values
+        n_features = self.n_features
+        scores: Dict[int, float] = {}
+        get = scores.get
+
+        for idx, weight in row:
+            if idx >= n_features:
+                continue
+            start, end = colptr[idx], colptr[idx + 1]
+            if min_doc:
+                start = bisect_right(rows, min_doc - 1, start, end)
+            for doc, value in zip(rows[start:end], values[start:end]):
+                scores[doc] = get(doc, 0.0) + weight * value
+
+        return scores
+
+    def query_iter(self, queries: Union[CSRMatrix, Sequence[Dict[int, float]]],
+                   k: int = 10, min_score: float = 0.0) -> Iterator[List[List[Tuple[int, float]]]]:
+        """
+        Lazily find the top-k neighbors of query vectors, chunk by chunk.
+
+        Args:
+            queries: CSRMatrix or list of sparse query vectors
+            k: Number of neighbors per query
+            min_score: Minimum cosine similarity of returned neighbors
+
+        Yields:
+            For each chunk of queries, a list with one neighbor list per
+            query; each neighbor list holds (document index, similarity)
+            tuples sorted by decreasing similarity
+        """
+        matrix = _as_csr(queries)
+        indptr, indices, data = matrix.indptr, matrix.indices, matrix.data
+
+        for chunk_start in range(0, len(matrix), self.chunksize):
+            chunk_end = min(chunk_start + self.chunksize, len(matrix))
+            results = []
+            for q in range(chunk_start, chunk_end):
+                start, end = indptr[q], indptr[q + 1]
+                scores = self._scores(_normalized_row(indices[start:end], data[start:end]))
+                candidates = ((doc, score) for doc, score in scores.items()
+                              if score >= min_score)
+                results.append(heapq.nlargest(k, candidates, key=itemgetter(1)))
+            yield results
+
+    def query(self, queries: Union[CSRMatrix, Sequence[Dict[int, float]]],
+              k: int = 10, min_score: float = 0.0) -> List[List[Tuple[int, float]]]:
+        """
+        Find the top-k neighbors of query vectors.
+
+        Args:
+            queries: CSRMatrix or list of sparse query vectors
+            k: Number of neighbors per query
+            min_score: Minimum cosine similarity of returned neighbors
+
+        Returns:
+            One list of (document index, similarity) tuples per query
+        """
+        results = []
+        for chunk in self.query_iter(queries, k=k, min_score=min_score):
+            results.extend(chunk)
+        return results
+
+    def find_duplicates(self, threshold: float = 0.9) -> Iterator[Tuple[int, int, float]]:
+        """
+        Find pairs of indexed documents with similarity above a threshold.
+
+        Each pair is scored once: a document is only compared with the
+        documents indexed after it.
+
+        Args:
+            threshold: Minimum cosine similarity
+
+        Yields:
+            (i, j, similarity) tuples with i < j
+        """
+        normalized = self._normalized
+        for doc in range(self.num_documents):
+            indices, values = normalized.row(doc)
+            scores = self._scores(list(zip(indices, values)), min_doc=doc + 1)
+            for other in sorted(scores):
+                if scores[other] >= threshold:
+                    yield doc, other, scores[other]
+
+    def deduplicate(self, threshold: float = 0.9) -> List[int]:
+        """
+        Select one representative document per group of near-duplicates.
+
+        Args:
+            threshold: Minimum cosine similarity for two documents to be
+                considered duplicates
+
+        Returns:
+            Sorted indices of the documents to keep
+        """
+        parent = list(range(self.num_documents))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j, _ in self.find_duplicates(threshold):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the earliest document of each group
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        return [i for i in range(self.num_documents) if find(i) == i]
@@ -0,0 +1,229 @@
+"""
+Sparse Matrix Container
+
+Provides a compact CSR (compressed sparse row) matrix for the output of the
+feature extractors. Rows are stored in flat ``array`` buffers instead of one
+Python dict per document.
+"""
+
+from array import array
+from operator import mul
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class CSRMatrix:
+    """
+    Compressed sparse row matrix backed by ``array`` buffers.
+
+    Row ``i`` is stored in ``indices[indptr[i]:indptr[i + 1]]`` (feature
+    indices, sorted ascending) and ``data[indptr[i]:indptr[i + 1]]`` (values).
+    """
+
+    def __init__(self,
+                 n_features: int = 0,
+                 dtype: str = 'd',
+                 indptr: Optional[array] = None,
+                 indices: Optional[array] = None,
+                 data: Optional[array] = None):
+        """
+        Initialize the matrix.
+
+        Args:
+            n_features: Number of columns
+            dtype: Array typecode for values ('d' for floats, 'q' for counts)
+            indptr: Row pointer buffer (defaults to an empty matrix)
+            indices: Column index buffer
+            data: Value buffer
+        """
+        self.n_features = n_features
+        self.dtype = dtype
+        self.indptr = indptr if indptr is not None else array('q', [0])
+        self.indices = indices if indices is not None else array('i')
+        self.data = data if data is not None else array(dtype)
+
+        if len(self.indices) != len(self.data):
+            raise ValueError("indices and data must have the same length")
+        if not self.indptr or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr does not match the number of stored values")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Matrix shape as (rows, columns)."""
+        return len(self.indptr) - 1, self.n_features
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored values."""
+        return len(self.data)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __repr__(self) -> str:
+        rows, cols = self.shape
+        return f"CSRMatrix(shape=({rows}, {cols}), nnz={self.nnz}, dtype='{self.dtype}')"
+
+    def append_row(self, row: Sequence[Tuple[int, float]]) -> None:
+        """
+        Append a row given as (index, value) pairs sorted by index.
+
+        Args:
+            row: Sequence of (feature index, value) pairs
+        """
+        if row:
+            indices, values = zip(*row)
+            self.indices.extend(indices)
+            self.data.extend(values)
+        self.indptr.append(len(self.indices))
+
+    def row(self, i: int) -> Tuple[array, array]:
+        """
+        Get the stored indices and values of a row.
+
+        Args:
+            i: Row number
+
+        Returns:
+            Tuple of (indices, values) buffers
+        """
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def getrow(self, i: int) -> Dict[int, float]:
+        """
+        Get a row in the dict format used by ``transform``.
+
+        Args:
+            i: Row number
+
+        Returns:
+            Dictionary mapping feature index to value
+        """
+        indices, values = self.row(i)
+        return dict(zip(indices, values))
+
+    def to_dicts(self) -> List[Dict[int, float]]:
+        """
+        Convert to the list-of-dicts format.
+
+        Returns:
+            List of sparse vectors (dict mapping feature index to value)
+        """
+        indptr, indices, data = self.indptr, self.indices, self.data
+        return [dict(zip(indices[indptr[i]:indptr[i + 1]], data[indptr[i]:indptr[i + 1]]))
+                for i in range(len(indptr) - 1)]
+
+    @classmethod
+    def from_dicts(cls, vectors: Iterable[Dict[int, float]],
+                   n_features: Optional[int] = None, dtype: str = 'd') -> 'CSRMatrix':
+        """
+        Build a matrix from the list-of-dicts format.
+
+        Args:
+            vectors: Sparse vectors (dict mapping feature index to value)
+            n_features: Number of columns (inferred from the data if None)
+            dtype: Array typecode for values
+
+        Returns:
+            CSRMatrix
+        """
+        matrix = cls(n_features=0, dtype=dtype)
+        for vector in vectors:
+            matrix.append_row(sorted(vector.items()))
+
+        if n_features is None:
+            n_features = max(matrix.indices) + 1 if matrix.indices else 0
+        matrix.n_features = n_features
+        return matrix
+
+    @classmethod
+    def vstack(cls, matrices: Sequence['CSRMatrix']) -> 'CSRMatrix':
+        """
+        Stack matrices vertically.
+
+        Args:
+            matrices: Matrices with the same number of columns and dtype
+
+        Returns:
+            CSRMatrix containing the rows of all matrices in order
+        """
+        if not matrices:
+            return cls()
+
+        first = matrices[0]
+        result = cls(n_features=first.n_features, dtype=first.dtype)
+        for matrix in matrices:
+            if matrix.n_features != first.n_features or matrix.dtype != first.dtype:
+                raise ValueError("Matrices must have the same number of columns and dtype")
+            offset = len(result.indices)
+            result.indices.extend(matrix.indices)
+            result.data.extend(matrix.data)
+            result.indptr.extend(ptr + offset for ptr in matrix.indptr[1:])
+        return result
+
+    def dot(self, vectors: Sequence[Sequence[float]]) -> List[List[float]]:
+        """
+        Multiply every row with each of several dense vectors.
+
+        Columns beyond the length of the vectors are ignored.
+
+        Args:
+            vectors: Dense vectors (e.g. one weight array per class)
+
+        Returns:
+            For each row, the dot product with every vector
+        """
+        indptr, indices, data = self.indptr, self.indices, self.data
+        limit = min((len(vector) for vector in vectors), default=0)
+        getters = [vector.__getitem__ for vector in vectors]
+        results = []
+
+        for i in range(len(indptr) - 1):
+            start, end = indptr[i], indptr[i + 1]
+            row_indices = indices[start:end]
+            row_data = data[start:end]
+            if row_indices and max(row_indices) >= limit:
+                pairs = [(idx, value) for idx, value in zip(row_indices, row_data) if idx < limit]
+                row_indices = [idx for idx, _ in pairs]
+                row_data = [value for _, value in pairs]
+            results.append([sum(map(mul, row_data, map(getter, row_indices)))
+                            for getter in getters])
+
+        return results
+
+    def to_numpy(self):
+        """
+        Get the buffers as NumPy arrays without copying.
+
+        Returns:
+            Tuple of (indptr, indices, data) NumPy arrays
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("to_numpy requires NumPy to be installed")
+
+        return (np.frombuffer(self.indptr, dtype=np.int64),
+                np.frombuffer(self.indices, dtype=np.intc),
+                np.frombuffer(self.data, dtype=np.float64 if self.dtype == 'd' else np.int64))
+
+    def to_scipy(self):
+        """
+        Convert to a ``scipy.sparse.csr_matrix``.
+
+        Returns:
+            SciPy CSR matrix sharing the buffers of this matrix
+
+        Raises:
+            ImportError: If SciPy is not installed
+        """
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError:
+            raise ImportError("to_scipy requires SciPy to be installed")
+
+        indptr, indices, data = self.to_numpy()
+        return csr_matrix((data, indices, indptr), shape=self.shape)
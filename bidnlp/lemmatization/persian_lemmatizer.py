@@ -5,9 +5,16 @@ This lemmatizer converts Persian words to their dictionary form (lemma).
 It uses a combination of rule-based approaches and a dictionary of common lemmas.
 """
 
-import re
 from typing import Dict, Set, Optional
 
+# ZWNJ and Arabic diacritics removed, Arabic characters to Persian
+_NORMALIZE_TABLE = {
+    0x200C: None,
+    **dict.fromkeys(range(0x064B, 0x0660)),
+    0x0670: None,
+    **str.maketrans('يكؤإأٱةۀ', 'یکواااهه'),
+}
+
 
 class PersianLemmatizer:
     """
@@ -162,28 +169,9 @@ class PersianLemmatizer:
 
     def normalize(self, word: str) -> str:
         """Normalize Persian text"""
-        # Remove ZWNJ (zero-width non-joiner)
-        word = word.replace('\u200c', '')
-
-        # Remove Arabic diacritics
-        word = re.sub(r'[\u064B-\u065F\u0670]', '', word)
-
-        # Normalize Arabic characters to Persian
-        replacements = {
-            'ي': 'ی',
-            'ك': 'ک',
-            'ؤ': 'و',
-            'إ': 'ا',
-            'أ': 'ا',
-            'ٱ': 'ا',
-            'ة': 'ه',
-            'ۀ': 'ه'
-        }
-
-        for arabic, persian in replacements.items():
-            word = word.replace(arabic, persian)
-
-        return word.strip()
+        # Remove ZWNJ and Arabic diacritics and normalize Arabic characters
+        # to Persian in one pass
+        return word.translate(_NORMALIZE_TABLE).strip()
 
     def _remove_prefix(self, word: str) -> tuple[str, str]:
         """Remove verb prefix and return (prefix, word)"""
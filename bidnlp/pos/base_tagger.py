@@ -198,28 +198,25 @@ class BasePOSTagger(ABC):
         """
         Evaluate tagger performance.
 
+        Tags are compared position by position (up to the shorter sequence)
+        and counted into a streaming confusion matrix, so the predicted tags
+        of all texts are never held in memory at once.
+
         Args:
             texts: List of test texts
             true_tags: List of true tag sequences
 
         Returns:
-            Dictionary with evaluation metrics
+            Dictionary with evaluation metrics, including a per-tag
+            classification report
         """
-        predicted_tags = [self.get_tags(text) for text in texts]
-
-        # Calculate accuracy
-        total = 0
-        correct = 0
-        for pred, true in zip(predicted_tags, true_tags):
-            for p, t in zip(pred, true):
-                total += 1
-                if p == t:
-                    correct += 1
-
-        accuracy = correct / total if total > 0 else 0.0
+        from ..utils import ConfusionMatrix
+        cm = ConfusionMatrix()
+        cm.update_sequences(map(self.get_tags, texts), true_tags)
 
         return {
-            'accuracy': accuracy,
-            'total_tags': total,
-            'correct_tags': correct
+            'accuracy': cm.accuracy(),
+            'total_tags': cm.total,
+            'correct_tags': cm.correct,
+            'classification_report': cm.report()
         }
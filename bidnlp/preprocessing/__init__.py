@@ -1,11 +1,19 @@
 """
 Preprocessing module for Persian text
+
+This module provides text preprocessing tools:
+- PersianNormalizer: Character, ZWNJ and whitespace normalization
+- PersianTextCleaner: URL, email, mention, hashtag, emoji and HTML cleaning
+- PersianNumberNormalizer, PersianDateNormalizer: Digit, number and date normalization
+- PersianPunctuationNormalizer: Punctuation normalization
+- Pipeline: Composable pipeline of the above and the word tokenizer with fused execution
 """
 
 from .normalizer import PersianNormalizer
 from .cleaner import PersianTextCleaner
 from .number_normalizer import PersianNumberNormalizer, PersianDateNormalizer
 from .punctuation import PersianPunctuationNormalizer
+from .pipeline import Pipeline
 
 __all__ = [
     'PersianNormalizer',
@@ -13,4 +21,5 @@ __all__ = [
     'PersianNumberNormalizer',
     'PersianDateNormalizer',
     'PersianPunctuationNormalizer',
+    'Pipeline',
 ]
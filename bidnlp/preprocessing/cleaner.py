@@ -12,7 +12,120 @@ Advanced cleaning functionality for Persian text including:
 """
 
 import re
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Tuple, Union
+
+_URL_PATTERN = (
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+    r'|(?:www\.)[a-zA-Z0-9-]+(?:\.[a-zA-Z]{2,})+'
+)
+_EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+_MENTION_PATTERN = r'@[\w\u0600-\u06FF]+'
+_HASHTAG_PATTERN = r'#[\w\u0600-\u06FF]+'
+_EMOJI_RANGES = (
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA00-\U0001FA6F"  # Chess Symbols
+    "\U00002600-\U000026FF"  # Miscellaneous Symbols
+)
+_EMOJI_PATTERN = "[" + _EMOJI_RANGES + "]+"
+
+# HTML entities decoded by clean_html. '&amp;quot;' and '&amp;#39;' are
+# listed because the replacements used to run in sequence ('&amp;' before
+# '&quot;'), which decoded them twice
+_HTML_ENTITIES = {
+    '&nbsp;': ' ',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&amp;': '&',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&amp;quot;': '"',
+    '&amp;#39;': "'",
+}
+_ENTITY_PATTERN = re.compile(r'&amp;(?:quot;|#39;)?|&(?:nbsp|lt|gt|quot|#39);')
+
+# Whitespace rules of clean_whitespace, except the final strip. Only runs
+# that change are matched, so text with single spaces is not rewritten
+_SPACES_PATTERN = re.compile(r' {2,}')
+_NEWLINES_PATTERN = re.compile(r'\n(?:\n+ *| +)')
+
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+class _OffsetMap:
+    """
+    Original offsets of the characters of a text being rewritten.
+
+    ``starts[i]``/``ends[i]`` are the start/end offsets in the input of
+    character ``i`` of the current text. Characters of a replacement map to
+    the whole span of the text they replace; ``derived[i]`` is True for
+    characters that come from a rule's replacement rather than the input.
+    """
+
+    def __init__(self, length: int):
+        self.starts = list(range(length))
+        self.ends = list(range(1, length + 1))
+        self.derived = [False] * length
+
+    def sub(self, pattern, replace: Callable, text: str, derived: bool = False) -> str:
+        """
+        Substitute like ``pattern.sub`` and update the offsets.
+
+        Args:
+            pattern: Compiled pattern
+            replace: Callback giving the replacement of a match
+            text: Current text
+            derived: Whether the replacements count as derived characters
+
+        Returns:
+            The new text
+        """
+        parts: List[str] = []
+        starts, ends, flags = self.starts, self.ends, self.derived
+        new_starts: List[int] = []
+        new_ends: List[int] = []
+        new_flags: List[bool] = []
+        last = 0
+        for m in pattern.finditer(text):
+            start, end = m.span()
+            replacement = replace(m)
+            parts.append(text[last:start])
+            new_starts.extend(starts[last:start])
+            new_ends.extend(ends[last:start])
+            new_flags.extend(flags[last:start])
+            if replacement:
+                parts.append(replacement)
+                new_starts.extend([starts[start]] * len(replacement))
+                new_ends.extend([ends[end - 1]] * len(replacement))
+                new_flags.extend([derived] * len(replacement))
+            last = end
+
+        if not parts:
+            return text
+        parts.append(text[last:])
+        new_starts.extend(starts[last:])
+        new_ends.extend(ends[last:])
+        new_flags.extend(flags[last:])
+        self.starts, self.ends, self.derived = new_starts, new_ends, new_flags
+        return ''.join(parts)
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """Get the input span of ``text[start:end]``."""
+        return self.starts[start], self.ends[end - 1]
+
+    def is_verbatim(self, start: int, end: int) -> bool:
+        """
+        Check that ``text[start:end]`` is one contiguous piece of the input,
+        up to decoded HTML entities: no derived characters and no gaps left
+        by removed text.
+        """
+        return (True not in self.derived[start:end]
+                and self.ends[start:end - 1] == self.starts[start + 1:end])
 
 
 class PersianTextCleaner:
@@ -20,6 +133,10 @@ class PersianTextCleaner:
     Text cleaner for Persian (Farsi) text.
 
     Provides various cleaning operations to prepare text for NLP tasks.
+
+    With ``return_entities=True``, ``clean`` also returns the matched
+    URLs, emails, mentions, hashtags and emojis with their offsets in the
+    input, so they do not have to be found again with PersianTextValidator.
     """
 
     def __init__(
@@ -72,36 +189,16 @@ class PersianTextCleaner:
         self.replace_emojis_with = replace_emojis_with if not remove_emojis else ''
 
         # Regex patterns
-        self.url_pattern = re.compile(
-            r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-            r'|(?:www\.)[a-zA-Z0-9-]+(?:\.[a-zA-Z]{2,})+'
-        )
-
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        )
-
-        self.mention_pattern = re.compile(r'@[\w\u0600-\u06FF]+')
-        self.hashtag_pattern = re.compile(r'#[\w\u0600-\u06FF]+')
+        self.url_pattern = re.compile(_URL_PATTERN)
+        self.email_pattern = re.compile(_EMAIL_PATTERN)
+        self.mention_pattern = re.compile(_MENTION_PATTERN)
+        self.hashtag_pattern = re.compile(_HASHTAG_PATTERN)
 
         # HTML tag pattern
         self.html_pattern = re.compile(r'<[^>]+>')
 
         # Emoji pattern (comprehensive Unicode ranges)
-        self.emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-            "\U0001FA00-\U0001FA6F"  # Chess Symbols
-            "\U00002600-\U000026FF"  # Miscellaneous Symbols
-            "]+",
-            flags=re.UNICODE
-        )
+        self.emoji_pattern = re.compile(_EMOJI_PATTERN, flags=re.UNICODE)
 
     def clean_urls(self, text: str) -> str:
         """Remove or replace URLs"""
@@ -135,15 +232,12 @@ class PersianTextCleaner:
         """Remove HTML tags"""
         if self.remove_html:
             # First handle common HTML entities
-            text = text.replace('&nbsp;', ' ')
-            text = text.replace('&lt;', '<')
-            text = text.replace('&gt;', '>')
-            text = text.replace('&amp;', '&')
-            text = text.replace('&quot;', '"')
-            text = text.replace('&#39;', "'")
+            if '&' in text:
+                text = _ENTITY_PATTERN.sub(lambda m: _HTML_ENTITIES[m.group()], text)
 
             # Remove HTML tags
-            text = self.html_pattern.sub('', text)
+            if '<' in text:
+                text = self.html_pattern.sub('', text)
 
         return text
 
@@ -157,31 +251,24 @@ class PersianTextCleaner:
     def clean_whitespace(self, text: str) -> str:
         """Clean up extra whitespace"""
         if self.remove_extra_whitespace:
-            # Replace multiple spaces with single space
-            text = re.sub(r' +', ' ', text)
+            # Collapse runs of spaces
+            if '  ' in text:
+                text = _SPACES_PATTERN.sub(' ', text)
 
-            # Replace multiple newlines with single newline
-            text = re.sub(r'\n+', '\n', text)
+            # Collapse runs of newlines and drop the spaces at line starts
+            if '\n' in text:
+                text = _NEWLINES_PATTERN.sub('\n', text)
 
             # Remove leading/trailing whitespace
             text = text.strip()
 
-            # Remove spaces at start of lines
-            text = re.sub(r'\n ', '\n', text)
-
         return text
 
     def lowercase_latin(self, text: str) -> str:
         """Convert English/Latin characters to lowercase"""
         if self.lowercase_english:
             # Only lowercase ASCII characters
-            result = []
-            for char in text:
-                if 'A' <= char <= 'Z':
-                    result.append(char.lower())
-                else:
-                    result.append(char)
-            text = ''.join(result)
+            text = text.translate(_ASCII_LOWER)
 
         return text
 
@@ -274,16 +361,62 @@ class PersianTextCleaner:
         text = re.sub(pattern, replacement, text)
         return text
 
-    def clean(self, text: str) -> str:
+    def _rules(self) -> List[tuple]:
+        """Get (name, pattern, replacement) for the enabled match rules, in order."""
+        rules = []
+        for name, remove, replace_with, pattern in (
+                ('url', self.remove_urls, self.replace_urls_with, self.url_pattern),
+                ('email', self.remove_emails, self.replace_emails_with, self.email_pattern),
+                ('mention', self.remove_mentions, self.replace_mentions_with, self.mention_pattern),
+                ('hashtag', self.remove_hashtags, self.replace_hashtags_with, self.hashtag_pattern),
+                ('emoji', self.remove_emojis, self.replace_emojis_with, self.emoji_pattern)):
+            if remove or replace_with is not None:
+                rules.append((name, pattern, replace_with or ''))
+        return rules
+
+    def _extract_sequential(self, original: str, text: str, offsets: _OffsetMap,
+                            entities: List[tuple]) -> str:
+        """Apply the match rules one after another, recording the matches."""
+        for name, pattern, replacement in self._rules():
+            def replace(m, name=name, replacement=replacement):
+                start, end = offsets.span(*m.span())
+                if offsets.is_verbatim(*m.span()):
+                    match = m.group()
+                else:
+                    # The match only formed because an earlier rule replaced
+                    # or removed text: report the input it covers
+                    match = original[start:end]
+                entities.append((name, match, start, end))
+                return replacement
+
+            text = offsets.sub(pattern, replace, text, derived=True)
+
+        entities.sort(key=lambda entity: (entity[2], entity[3]))
+        return text
+
+    def clean(self, text: str,
+              return_entities: bool = False) -> Union[str, Tuple[str, List[Tuple[str, str, int, int]]]]:
         """
         Apply all configured cleaning operations.
 
         Args:
             text: Input text to clean
+            return_entities: If True, also return the URLs, emails, mentions,
+                hashtags and emojis that were removed or replaced
 
         Returns:
-            Cleaned text
+            Cleaned text, or a (cleaned text, entities) tuple if
+            return_entities is True. Each entity is a (type, text, start,
+            end) tuple: type is 'url', 'email', 'mention', 'hashtag' or
+            'emoji', text is the match (after HTML entity decoding), and
+            start/end are offsets into the input text. A match that only
+            formed because an earlier rule replaced or removed text (e.g. a
+            mention joined up by removing a URL) reports the input text its
+            span covers. Only the enabled rules produce entities.
         """
+        if return_entities:
+            return self._clean_with_entities(text)
+
         if not text:
             return text
 
@@ -299,14 +432,33 @@ class PersianTextCleaner:
 
         return text
 
-    def batch_clean(self, texts: List[str]) -> List[str]:
+    def _clean_with_entities(self, text: str) -> Tuple[str, List[Tuple[str, str, int, int]]]:
+        """Clean text and collect the matched entities with original offsets."""
+        entities: List[tuple] = []
+        if not text:
+            return text, entities
+
+        original = text
+        offsets = _OffsetMap(len(text))
+        if self.remove_html and ('&' in text or '<' in text):
+            text = offsets.sub(_ENTITY_PATTERN, lambda m: _HTML_ENTITIES[m.group()], text)
+            text = offsets.sub(self.html_pattern, lambda m: '', text)
+        cleaned = self._extract_sequential(original, text, offsets, entities)
+
+        text = self.lowercase_latin(cleaned)
+        text = self.clean_whitespace(text)
+        return text, entities
+
+    def batch_clean(self, texts: List[str], return_entities: bool = False) -> List:
         """
         Clean multiple texts.
 
         Args:
             texts: List of texts to clean
+            return_entities: If True, return (cleaned text, entities) tuples
+                (see ``clean``)
 
         Returns:
             List of cleaned texts
         """
-        return [self.clean(text) for text in texts]
+        return [self.clean(text, return_entities) for text in texts]
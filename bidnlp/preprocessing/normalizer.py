@@ -11,7 +11,17 @@ Comprehensive normalization for Persian text including:
 
 import re
 import unicodedata
-from typing import Optional
+from typing import Dict, Optional
+
+# Settings the fused character table depends on
+_TABLE_ATTRIBUTES = frozenset((
+    'normalize_arabic', 'fix_arabic_numbers', 'remove_diacritics', 'remove_kashida',
+    'normalize_zwnj', 'normalize_spacing', 'arabic_to_persian', 'arabic_numbers',
+    'diacritics', 'invisible_chars', 'space_chars', 'kashida',
+))
+# Mapping dicts the table is built from, compared on use to catch in-place edits
+_TABLE_MAPPINGS = ('arabic_to_persian', 'arabic_numbers', 'space_chars')
+_STALE = object()
 
 
 class PersianNormalizer:
@@ -170,6 +180,10 @@ class PersianNormalizer:
         for space_char, replacement in self.space_chars.items():
             text = text.replace(space_char, replacement)
 
+        return self._collapse_whitespace(text)
+
+    def _collapse_whitespace(self, text: str) -> str:
+        """Collapse repeated spaces and newlines and fix spacing around punctuation"""
         # Normalize multiple spaces to single space
         text = re.sub(r' +', ' ', text)
 
@@ -212,6 +226,54 @@ class PersianNormalizer:
 
         return ''.join(c for c in text if c not in invisible)
 
+    def char_table(self) -> Dict[int, str]:
+        """
+        Get one ``str.translate`` table doing all enabled character-level steps.
+
+        The table fuses the Arabic character and digit mappings, the removal
+        of diacritics, kashida and invisible characters and the mapping of
+        space characters, so ``normalize`` maps characters in a single pass.
+        It is rebuilt when a setting is reassigned or a mapping dict such as
+        ``arabic_to_persian`` is edited in place.
+
+        Returns:
+            Dict from code point to replacement string ('' deletes)
+        """
+        table = self.__dict__.get('_char_table', _STALE)
+        mappings = tuple(getattr(self, name) for name in _TABLE_MAPPINGS)
+        if table is _STALE or mappings != self._table_mappings:
+            self._table_mappings = tuple(dict(mapping) for mapping in mappings)
+            table = self._char_table = self._build_char_table()
+        return table
+
+    def _build_char_table(self) -> Dict[int, str]:
+        """Compose the enabled character-level steps in their normalize order."""
+        table = {}
+        if self.normalize_arabic:
+            table.update(self.arabic_to_persian)
+        if self.fix_arabic_numbers:
+            table.update(self.arabic_numbers)
+        deleted = ''
+        if self.remove_diacritics:
+            deleted += self.diacritics
+        if self.remove_kashida:
+            deleted += self.kashida
+        deleted += self.invisible_chars.replace('\u200c', '') if self.normalize_zwnj else self.invisible_chars
+        # Removing a character also removes it where an earlier mapping produced it
+        table = {char: ''.join(c for c in value if c not in deleted) for char, value in table.items()}
+        for char in deleted:
+            table.setdefault(char, '')
+        if self.normalize_spacing:
+            for space_char, replacement in self.space_chars.items():
+                table.setdefault(space_char, replacement)
+        return {ord(char): value for char, value in table.items() if value != char}
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in _TABLE_ATTRIBUTES:
+            # Settings changed: rebuild the character table on next use
+            self.__dict__['_char_table'] = _STALE
+
     def apply_unicode_normalization(self, text: str) -> str:
         """Apply Unicode normalization"""
         if self.unicode_form:
@@ -239,26 +301,18 @@ class PersianNormalizer:
         # Apply Unicode normalization first
         text = self.apply_unicode_normalization(text)
 
-        # Character normalization
-        text = self.normalize_characters(text)
-
-        # Number normalization
-        text = self.normalize_numbers(text)
-
-        # Remove diacritics
-        text = self.remove_diacritic_marks(text)
-
-        # Remove kashida
-        text = self.remove_kashida_char(text)
-
-        # Remove invisible characters
-        text = self.remove_invisible_characters(text)
+        # Character, number, diacritic, kashida, invisible character and
+        # space character normalization in one pass. Mapping the space
+        # characters before the ZWNJ step is safe since they are all
+        # whitespace to its regex either way.
+        text = text.translate(self.char_table())
 
         # ZWNJ normalization
         text = self.normalize_zwnj_usage(text)
 
         # Whitespace normalization
-        text = self.normalize_whitespace(text)
+        if self.normalize_spacing:
+            text = self._collapse_whitespace(text)
 
         # Final cleanup
         text = text.strip()
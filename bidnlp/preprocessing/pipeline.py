@@ -0,0 +1,350 @@
+"""
+Persian Preprocessing Pipeline
+
+Composes the preprocessing components from a declarative config:
+- Stages by name with keyword arguments for their component
+- Consecutive duplicate stages dropped
+- Character-level mappings of all stages fused into translate tables
+- Optional per-stage timing
+"""
+
+import time
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .cleaner import PersianTextCleaner
+from .normalizer import PersianNormalizer
+from .number_normalizer import PersianNumberNormalizer
+from .punctuation import PersianPunctuationNormalizer
+from ..tokenization.word_tokenizer import PersianWordTokenizer
+
+StageSpec = Union[str, Sequence]
+
+_ZWNJ = '\u200c'
+
+
+class _Step:
+    """
+    One step of a pipeline's execution plan.
+
+    A step is either a ``str.translate`` table or a call. For calls, the
+    planner needs to know which characters a translate entry may be moved
+    across it:
+
+    - literals: characters the call matches or treats specially (None: any)
+    - classes: character predicates its patterns use, e.g. ``str.isspace``
+      for ``\\s`` and ``str.isdecimal`` for ``\\d``
+    - introduces: characters the call can insert (None: any)
+    """
+
+    __slots__ = ('stage', 'name', 'func', 'table', 'literals', 'classes', 'introduces')
+
+    def __init__(self, stage: str, name: str, func: Optional[Callable] = None,
+                 table: Optional[Dict[int, str]] = None, literals: Optional[str] = None,
+                 classes: Tuple[Callable, ...] = (), introduces: Optional[str] = None):
+        self.stage = stage
+        self.name = name
+        self.func = func
+        self.table = table
+        self.literals = literals
+        self.classes = classes
+        self.introduces = introduces
+
+    @classmethod
+    def translate(cls, stage: str, table: dict) -> '_Step':
+        """Create a translate step, with the table values normalized to strings."""
+        table = {
+            char: '' if value is None else chr(value) if isinstance(value, int) else value
+            for char, value in table.items()
+        }
+        return cls(stage, 'translate', table={char: value for char, value in table.items()
+                                              if value != chr(char)})
+
+    def commutes(self, char: str, replacement: str) -> bool:
+        """Check whether mapping ``char`` to ``replacement`` before this call gives the same result as after it."""
+        if self.literals is None or self.introduces is None:
+            return False
+        if char in self.literals or replacement in self.literals or char in self.introduces:
+            return False
+        return all(test(char) == test(replacement) for test in self.classes)
+
+
+def _compose(first: Dict[int, str], second: Dict[int, str]) -> Dict[int, str]:
+    """Compose two translate tables into one that applies ``first`` then ``second``."""
+    table = {char: value.translate(second) for char, value in first.items()}
+    for char, value in second.items():
+        table.setdefault(char, value)
+    return {char: value for char, value in table.items() if value != chr(char)}
+
+
+def _clean_steps(stage: str, **kwargs) -> List[_Step]:
+    cleaner = PersianTextCleaner(**kwargs)
+    return [_Step(stage, 'clean', cleaner.clean)]
+
+
+def _normalize_steps(stage: str, **kwargs) -> List[_Step]:
+    normalizer = PersianNormalizer(**kwargs)
+    steps = []
+    if normalizer.unicode_form:
+        steps.append(_Step(stage, 'unicode', normalizer.apply_unicode_normalization))
+    steps.append(_Step.translate(stage, normalizer.char_table()))
+    if normalizer.normalize_zwnj:
+        steps.append(_Step(stage, 'zwnj', normalizer.normalize_zwnj_usage,
+                           literals='مینب' + _ZWNJ, classes=(str.isspace,), introduces=_ZWNJ))
+    if normalizer.normalize_spacing:
+        steps.append(_Step(stage, 'whitespace', normalizer._collapse_whitespace,
+                           literals=' \n،؛؟!.,:;?', classes=(str.isspace, str.isdecimal),
+                           introduces=' \n'))
+    steps.append(_Step(stage, 'strip', str.strip, literals='', classes=(str.isspace,),
+                       introduces=''))
+    return steps
+
+
+def _punctuation_steps(stage: str, **kwargs) -> List[_Step]:
+    punctuation = PersianPunctuationNormalizer(**kwargs)
+    introduces = (''.join(punctuation.persian_to_latin) + ''.join(punctuation.persian_to_latin.values())
+                  + punctuation.persian_open_quote + punctuation.persian_close_quote
+                  + punctuation.latin_open_quote + punctuation.latin_close_quote + '…-— ')
+    return [_Step(stage, 'punctuation', punctuation.normalize, introduces=introduces)]
+
+
+def _digits_steps(stage: str, target: str = 'english') -> List[_Step]:
+    numbers = PersianNumberNormalizer()
+    if target == 'english':
+        table = _compose(_Step.translate(stage, numbers.persian_to_english).table,
+                         _Step.translate(stage, numbers.arabic_to_english).table)
+    elif target == 'persian':
+        table = _compose(_Step.translate(stage, numbers.english_to_persian).table,
+                         _Step.translate(stage, numbers.arabic_to_persian_nums).table)
+    else:
+        raise ValueError(f"Unknown digit target: {target!r} (expected 'english' or 'persian')")
+    return [_Step.translate(stage, table)]
+
+
+def _tokenize_steps(stage: str, **kwargs) -> List[_Step]:
+    tokenizer = PersianWordTokenizer(**kwargs)
+    steps = [
+        _Step.translate(stage, tokenizer.char_table()),
+        _Step(stage, 'punctuation', tokenizer._separate_punctuation,
+              literals=tokenizer.persian_punctuation + '!?. ',
+              classes=(str.isspace, str.isdecimal), introduces=' '),
+    ]
+    if tokenizer.normalize_zwnj:
+        steps.append(_Step(stage, 'zwnj', tokenizer.handle_zwnj, literals=_ZWNJ, introduces=' '))
+    steps.append(_Step(stage, 'tokenize', tokenizer._tokenize_normalized))
+    return steps
+
+
+# Stage name -> builder of its steps from the stage's keyword arguments
+_STAGES = {
+    'clean': _clean_steps,
+    'normalize': _normalize_steps,
+    'punctuation': _punctuation_steps,
+    'digits': _digits_steps,
+    'tokenize': _tokenize_steps,
+}
+
+
+class Pipeline:
+    """
+    Composable preprocessing pipeline for Persian text.
+
+    Stages are given by name, optionally with keyword arguments for their
+    component:
+
+    - 'clean': PersianTextCleaner.clean
+    - 'normalize': PersianNormalizer.normalize
+    - 'punctuation': PersianPunctuationNormalizer.normalize
+    - 'digits': PersianNumberNormalizer.normalize_digits (``target``
+      'english' or 'persian')
+    - 'tokenize': PersianWordTokenizer.tokenize, must be the last stage
+
+    The output is the same as calling the components by hand in order, but
+    the pipeline runs a fused plan:
+
+    - character mappings a later stage repeats are dropped once an earlier
+      mapping removed those characters, e.g. the tokenizer's Arabic to
+      Persian mapping after 'normalize'. A stage left with nothing to do,
+      such as a repeated 'digits', is dropped and listed in ``dropped``
+    - character mappings are moved across steps that treat both characters
+      alike and fused into one ``str.translate`` table, e.g. 'digits' is
+      applied with the table of 'normalize'
+
+    Example:
+        >>> pipeline = Pipeline(['clean', 'normalize', ('digits', {'target': 'english'}), 'tokenize'])
+        >>> pipeline('كتاب ۱۲ صفحه')
+        ['کتاب', '12', 'صفحه']
+    """
+
+    def __init__(self, stages: Sequence[StageSpec], timed: bool = False):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Stage names or (name, kwargs) pairs, in order
+            timed: If True, accumulate the time spent in each stage in
+                ``timings``. Time in a fused translate table is credited to
+                the stage that owns it
+
+        Raises:
+            ValueError: If a stage is unknown or malformed, or 'tokenize'
+                is not the last stage
+        """
+        self.timed = timed
+        self.stages = []
+        self.tokenizes = False
+
+        steps = []
+        counts = {}
+        for spec in stages:
+            name, kwargs = self._parse_spec(spec)
+            if self.tokenizes:
+                raise ValueError("'tokenize' must be the last stage")
+
+            counts[name] = counts.get(name, 0) + 1
+            label = name if counts[name] == 1 else f'{name}_{counts[name]}'
+            try:
+                steps.extend(_STAGES[name](label, **kwargs))
+            except TypeError as e:
+                raise ValueError(f"Invalid arguments for stage {name!r}: {e}") from e
+            self.stages.append(label)
+            self.tokenizes = name == 'tokenize'
+
+        self._plan, used = self._fuse(steps)
+        self.dropped = [stage for stage in self.stages if stage not in used]
+        self._funcs = [
+            methodcaller('translate', step.table) if step.table is not None else step.func
+            for step in self._plan
+        ]
+        self.timings = dict.fromkeys(self.stages, 0.0)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'Pipeline':
+        """
+        Create a pipeline from a config dict, e.g. loaded from JSON.
+
+        Args:
+            config: Dict with a 'stages' list and an optional 'timed' flag
+
+        Returns:
+            Pipeline instance
+        """
+        return cls(config['stages'], timed=config.get('timed', False))
+
+    @staticmethod
+    def _parse_spec(spec: StageSpec) -> Tuple[str, Dict[str, Any]]:
+        """Split a stage spec into its name and keyword arguments."""
+        if isinstance(spec, str):
+            name, kwargs = spec, {}
+        elif isinstance(spec, (list, tuple)) and len(spec) == 2 and isinstance(spec[1], dict):
+            name, kwargs = spec[0], dict(spec[1])
+        else:
+            raise ValueError(f"Invalid stage spec: {spec!r} (expected a name or (name, kwargs))")
+        if name not in _STAGES:
+            raise ValueError(f"Unknown stage: {name!r} (expected one of {sorted(_STAGES)})")
+        return name, kwargs
+
+    @staticmethod
+    def _fuse(steps: List[_Step]) -> Tuple[List[_Step], set]:
+        """
+        Build the execution plan: drop redundant character mappings and fuse
+        the rest into as few translate tables as possible.
+
+        Args:
+            steps: Steps of all stages, in order
+
+        Returns:
+            Tuple of (fused list of steps, labels of the stages with work left)
+        """
+        plan = []
+        used = set()
+        # Characters that cannot be in the text at the current step
+        absent = set()
+        # Index in plan of the last translate table
+        last = None
+        for step in steps:
+            if step.table is None:
+                if step.introduces is None:
+                    absent.clear()
+                else:
+                    absent.difference_update(map(ord, step.introduces))
+                plan.append(step)
+                used.add(step.stage)
+                continue
+
+            table = {char: value for char, value in step.table.items() if char not in absent}
+            if table:
+                used.add(step.stage)
+            produced = {ord(c) for value in table.values() for c in value}
+            absent = (absent | set(table)) - produced
+
+            if last is not None and last < len(plan) - 1:
+                between = plan[last + 1:]
+                hoisted = {
+                    char: value for char, value in table.items()
+                    if len(value) == 1 and ord(value) not in table
+                    and all(other.commutes(chr(char), value) for other in between)
+                }
+                if hoisted:
+                    plan[last] = _Step(plan[last].stage, 'translate',
+                                       table=_compose(plan[last].table, hoisted))
+                    table = {char: value for char, value in table.items() if char not in hoisted}
+
+            if not table:
+                continue
+            if last == len(plan) - 1:
+                plan[last] = _Step(plan[last].stage, 'translate',
+                                   table=_compose(plan[last].table, table))
+            else:
+                plan.append(_Step(step.stage, 'translate', table=table))
+                last = len(plan) - 1
+        return plan, used
+
+    @property
+    def plan(self) -> List[Tuple[str, str]]:
+        """Get the fused execution plan as (stage, step) pairs."""
+        return [(step.stage, step.name) for step in self._plan]
+
+    def run(self, text: str) -> Union[str, List[str]]:
+        """
+        Run the pipeline on a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Processed text, or the list of tokens if the last stage is
+            'tokenize'
+        """
+        if not text:
+            return [] if self.tokenizes else text
+
+        if self.timed:
+            timings = self.timings
+            for step, func in zip(self._plan, self._funcs):
+                start = time.perf_counter()
+                text = func(text)
+                timings[step.stage] += time.perf_counter() - start
+            return text
+
+        for func in self._funcs:
+            text = func(text)
+        return text
+
+    __call__ = run
+
+    def batch_run(self, texts: List[str]) -> List[Union[str, List[str]]]:
+        """
+        Run the pipeline on multiple texts.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of outputs
+        """
+        return [self.run(text) for text in texts]
+
+    def reset_timings(self) -> None:
+        """Reset the accumulated per-stage timings."""
+        self.timings = dict.fromkeys(self.stages, 0.0)
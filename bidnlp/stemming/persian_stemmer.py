@@ -5,7 +5,13 @@ This stemmer removes common Persian suffixes to extract the root/stem of words.
 It handles plural forms, verb conjugations, possessive pronouns, and other affixes.
 """
 
-import re
+# Invisible characters and Arabic diacritics removed, Arabic characters to Persian
+_NORMALIZE_TABLE = {
+    **dict.fromkeys(map(ord, '\u200c\u200b\u200d')),
+    **dict.fromkeys(range(0x064B, 0x0660)),
+    0x0670: None,
+    **str.maketrans('يكؤإأٱة', 'یکواااه'),
+}
 
 
 class PersianStemmer:
@@ -103,29 +109,9 @@ class PersianStemmer:
 
     def normalize(self, word):
         """Normalize Persian text"""
-        # Remove ZWNJ (zero-width non-joiner) and other invisible characters
-        word = word.replace('\u200c', '')  # ZWNJ
-        word = word.replace('\u200b', '')  # Zero-width space
-        word = word.replace('\u200d', '')  # Zero-width joiner
-
-        # Remove Arabic diacritics
-        word = re.sub(r'[\u064B-\u065F\u0670]', '', word)
-
-        # Normalize Arabic characters to Persian
-        replacements = {
-            'ي': 'ی',
-            'ك': 'ک',
-            'ؤ': 'و',
-            'إ': 'ا',
-            'أ': 'ا',
-            'ٱ': 'ا',
-            'ة': 'ه'
-        }
-
-        for arabic, persian in replacements.items():
-            word = word.replace(arabic, persian)
-
-        return word.strip()
+        # Remove ZWNJ, zero-width space and joiner and Arabic diacritics and
+        # normalize Arabic characters to Persian in one pass
+        return word.translate(_NORMALIZE_TABLE).strip()
 
     def remove_suffix(self, word, suffixes):
         """Remove suffix from word if it exists"""
@@ -12,6 +12,16 @@ Handles the complexities of Persian word tokenization including:
 import re
 from typing import List, Tuple
 
+# Space characters to a regular space, Arabic characters to Persian and
+# Arabic diacritics removed
+_CHAR_TABLE = {
+    **dict.fromkeys(map(ord, '\u00A0\u202F\u205F\u3000'), ' '),
+    **dict.fromkeys(range(0x2000, 0x2010), ' '),
+    **str.maketrans('يكؤإأٱةۀ', 'یکواااهه'),
+    **dict.fromkeys(range(0x064B, 0x0660)),
+    0x0670: None,
+}
+
 
 class PersianWordTokenizer:
     """
@@ -49,33 +59,24 @@ class PersianWordTokenizer:
             'مان', 'تان', 'شان', 'ی', 'گر', 'گری'
         ]
 
+    def char_table(self) -> dict:
+        """Get the ``str.translate`` table of the character-level normalization"""
+        return _CHAR_TABLE
+
     def normalize(self, text: str) -> str:
         """Normalize Persian text"""
         if not text:
             return text
 
-        # Normalize different types of spaces to regular space
-        text = re.sub(r'[\u00A0\u2000-\u200F\u202F\u205F\u3000]', ' ', text)
-
-        # Keep ZWNJ for now, we'll handle it specially
-        # Normalize Arabic characters to Persian
-        replacements = {
-            'ي': 'ی',
-            'ك': 'ک',
-            'ؤ': 'و',
-            'إ': 'ا',
-            'أ': 'ا',
-            'ٱ': 'ا',
-            'ة': 'ه',
-            'ۀ': 'ه'
-        }
+        # Normalize different types of spaces to regular space, Arabic
+        # characters to Persian and remove Arabic diacritics in one pass.
+        # ZWNJ is kept for now, we'll handle it specially
+        text = text.translate(_CHAR_TABLE)
 
-        for arabic, persian in replacements.items():
-            text = text.replace(arabic, persian)
-
-        # Remove Arabic diacritics
-        text = re.sub(r'[\u064B-\u065F\u0670]', '', text)
+        return self._separate_punctuation(text)
 
+    def _separate_punctuation(self, text: str) -> str:
+        """Put spaces around punctuation marks and collapse repeated spaces"""
         # Add space before punctuation marks for better tokenization
         # This helps separate punctuation from words
         # But be careful with periods in decimal numbers
@@ -125,10 +126,13 @@ class PersianWordTokenizer:
             return []
 
         # Normalize the text
-        original_text = text
         text = self.normalize(text)
         text = self.handle_zwnj(text)
 
+        return self._tokenize_normalized(text, return_spans)
+
+    def _tokenize_normalized(self, text: str, return_spans: bool = False) -> List[str]:
+        """Split already normalized text into tokens"""
         tokens = []
         current_pos = 0
 
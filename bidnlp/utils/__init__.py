@@ -7,13 +7,16 @@ This module provides various utilities for Persian text processing:
 - PersianStopWords: Stop words management
 - PersianTextValidator: Text validation utilities
 - PersianTextMetrics: Evaluation metrics
+- ConfusionMatrix: Streaming confusion matrix and classification report
+- ProfileRegistry: Entry point call statistics (see bidnlp.utils.profiling)
 """
 
 from .characters import PersianCharacters
 from .statistics import PersianTextStatistics
 from .stopwords import PersianStopWords
 from .validators import PersianTextValidator
-from .metrics import PersianTextMetrics
+from .metrics import PersianTextMetrics, ConfusionMatrix
+from .profiling import ProfileRegistry
 
 __all__ = [
     'PersianCharacters',
@@ -21,4 +24,6 @@ __all__ = [
     'PersianStopWords',
     'PersianTextValidator',
     'PersianTextMetrics',
+    'ConfusionMatrix',
+    'ProfileRegistry',
 ]
@@ -4,7 +4,9 @@ Persian Text Metrics and Evaluation
 Provides metrics for evaluating Persian text processing results.
 """
 
-from typing import List, Set, Tuple, Optional
+from collections import Counter
+from itertools import chain
+from typing import Dict, Hashable, Iterable, List, Set, Tuple, Optional
 
 
 class PersianTextMetrics:
@@ -306,22 +308,9 @@ class PersianTextMetrics:
         if len(predicted) != len(actual):
             raise ValueError("Predicted and actual lists must have the same length")
 
-        if labels is None:
-            labels = sorted(set(predicted) | set(actual))
-
-        # Initialize matrix
-        matrix = {label: {l: 0 for l in labels} for label in labels}
-
-        # Fill matrix
-        for p, a in zip(predicted, actual):
-            if p in labels and a in labels:
-                matrix[a][p] += 1
-
-        return {
-            'matrix': matrix,
-            'labels': labels,
-            'total': len(predicted)
-        }
+        cm = ConfusionMatrix(labels)
+        cm.update(predicted, actual)
+        return cm.to_dict()
 
     @staticmethod
     def classification_report(predicted: List, actual: List, labels: Optional[List] = None) -> dict:
@@ -339,34 +328,186 @@ class PersianTextMetrics:
         if len(predicted) != len(actual):
             raise ValueError("Predicted and actual lists must have the same length")
 
-        if labels is None:
-            labels = sorted(set(predicted) | set(actual))
+        cm = ConfusionMatrix(labels)
+        cm.update(predicted, actual)
+        return cm.report()
 
-        report = {}
 
-        for label in labels:
-            # Get sets for this label
-            pred_set = set(i for i, p in enumerate(predicted) if p == label)
-            actual_set = set(i for i, a in enumerate(actual) if a == label)
+class ConfusionMatrix:
+    """
+    Streaming confusion matrix.
+
+    Each ``update`` counts the (actual, predicted) pairs of a chunk in one
+    pass, so only the counts of distinct pairs are kept, not the labels
+    themselves. Per-label precision, recall and F1 are derived from the pair
+    counts, so a report costs time proportional to the number of distinct
+    pairs rather than labels x predictions.
+    """
+
+    def __init__(self, labels: Optional[List] = None):
+        """
+        Initialize an empty confusion matrix.
+
+        Args:
+            labels: Labels to report (optional). Defaults to all labels seen,
+                sorted. Pairs with other labels still count towards the
+                totals and the precision/recall denominators.
+        """
+        self._labels = list(labels) if labels is not None else None
+        self._pairs: Counter = Counter()
+        self.total = 0
+
+    def update(self, predicted: Iterable[Hashable], actual: Iterable[Hashable]) -> 'ConfusionMatrix':
+        """
+        Count a chunk of predictions.
+
+        Args:
+            predicted: Predicted labels
+            actual: Actual labels (same length as predicted)
+
+        Returns:
+            self
+        """
+        if not isinstance(predicted, (list, tuple)):
+            predicted = list(predicted)
+        if not isinstance(actual, (list, tuple)):
+            actual = list(actual)
+        if len(predicted) != len(actual):
+            raise ValueError("Predicted and actual lists must have the same length")
+
+        self._pairs.update(zip(actual, predicted))
+        self.total += len(actual)
+        return self
+
+    def update_sequences(self,
+                         predicted: Iterable[Iterable[Hashable]],
+                         actual: Iterable[Iterable[Hashable]]) -> 'ConfusionMatrix':
+        """
+        Count aligned label sequences, e.g. the tags of each sentence.
+
+        Sequences of different lengths are compared up to the shorter one.
 
-            p = PersianTextMetrics.precision(pred_set, actual_set)
-            r = PersianTextMetrics.recall(pred_set, actual_set)
-            f1 = PersianTextMetrics.f1_score(pred_set, actual_set)
+        Args:
+            predicted: Predicted label sequences
+            actual: Actual label sequences
+
+        Returns:
+            self
+        """
+        pairs = Counter(chain.from_iterable(map(zip, actual, predicted)))
+        self._pairs.update(pairs)
+        self.total += sum(pairs.values())
+        return self
+
+    def merge(self, other: 'ConfusionMatrix') -> 'ConfusionMatrix':
+        """
+        Add the counts of another confusion matrix (e.g. from a worker).
+
+        Args:
+            other: ConfusionMatrix
+
+        Returns:
+            self
+        """
+        self._pairs.update(other._pairs)
+        self.total += other.total
+        return self
+
+    @property
+    def labels(self) -> List:
+        """Reported labels."""
+        if self._labels is not None:
+            return self._labels
+        seen = set()
+        for a, p in self._pairs:
+            seen.add(a)
+            seen.add(p)
+        return sorted(seen)
+
+    @property
+    def correct(self) -> int:
+        """Number of predictions equal to the actual label."""
+        return sum(count for (a, p), count in self._pairs.items() if a == p)
+
+    def accuracy(self) -> float:
+        """
+        Get the fraction of correct predictions.
+
+        Returns:
+            Accuracy (0.0 when nothing was counted)
+        """
+        return self.correct / self.total if self.total else 0.0
+
+    def counts(self) -> Dict[Hashable, Tuple[int, int, int]]:
+        """
+        Get per-label counts.
+
+        Returns:
+            Dictionary mapping each label to (true positives, predicted
+            count, actual count)
+        """
+        true_pos: Counter = Counter()
+        pred_count: Counter = Counter()
+        actual_count: Counter = Counter()
+        for (a, p), count in self._pairs.items():
+            pred_count[p] += count
+            actual_count[a] += count
+            if a == p:
+                true_pos[a] += count
+        return {label: (true_pos[label], pred_count[label], actual_count[label])
+                for label in self.labels}
+
+    def matrix(self) -> Dict[Hashable, Dict[Hashable, int]]:
+        """
+        Get the matrix as nested dicts.
+
+        Returns:
+            Dictionary mapping actual label -> predicted label -> count
+        """
+        labels = self.labels
+        matrix = {label: {l: 0 for l in labels} for label in labels}
+        for (a, p), count in self._pairs.items():
+            row = matrix.get(a)
+            if row is not None and p in row:
+                row[p] += count
+        return matrix
+
+    def to_dict(self) -> dict:
+        """
+        Get the matrix in the format of ``PersianTextMetrics.confusion_matrix``.
+
+        Returns:
+            Dictionary with confusion matrix data
+        """
+        return {
+            'matrix': self.matrix(),
+            'labels': self.labels,
+            'total': self.total
+        }
+
+    def report(self) -> dict:
+        """
+        Get the report of ``PersianTextMetrics.classification_report``.
+
+        Returns:
+            Dictionary with metrics for each label
+        """
+        report = {}
+        for label, (tp, n_pred, n_actual) in self.counts().items():
+            p = tp / n_pred if n_pred else 0.0
+            r = tp / n_actual if n_actual else 0.0
+            f1 = 2 * (p * r) / (p + r) if p + r else 0.0
 
             report[label] = {
                 'precision': round(p, 4),
                 'recall': round(r, 4),
                 'f1_score': round(f1, 4),
-                'support': len(actual_set)
+                'support': n_actual
             }
 
-        # Add overall metrics
-        all_pred = set(range(len(predicted)))
-        all_actual = set(range(len(actual)))
-
         report['overall'] = {
-            'accuracy': round(PersianTextMetrics.accuracy(predicted, actual), 4),
-            'total': len(actual)
+            'accuracy': round(self.accuracy(), 4),
+            'total': self.total
         }
 
         return report
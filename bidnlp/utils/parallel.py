@@ -0,0 +1,111 @@
+"""
+Parallel Chunk Processing
+
+Helpers for running a function over chunks of a large input on a process
+pool. Read-only state (a fitted model) is sent to each worker once, when the
+worker starts, instead of with every chunk. On Linux the workers are forked,
+so the state is inherited without pickling at all.
+"""
+
+import multiprocessing
+import os
+import sys
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+# State installed in each worker process by _init_worker
+_WORKER_STATE: Any = None
+
+
+def _init_worker(state: Any) -> None:
+    """Install the shared state in a worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = state
+
+
+def _run_chunk(func: Callable[[Any, List], Any], chunk: List) -> Any:
+    """Apply func to a chunk using the worker's shared state."""
+    return func(_WORKER_STATE, chunk)
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Resolve the number of worker processes.
+
+    Args:
+        n_jobs: Number of processes; None or 1 for serial, -1 for all CPUs
+
+    Returns:
+        Number of processes to use (at least 1)
+    """
+    if n_jobs is None or n_jobs == 1:
+        return 1
+    cpu_count = os.cpu_count() or 1
+    if n_jobs < 0:
+        return max(1, cpu_count + 1 + n_jobs)
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+    return n_jobs
+
+
+def iter_chunks(items: Iterable, chunksize: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most ``chunksize`` items.
+
+    Args:
+        items: Input iterable
+        chunksize: Maximum chunk length
+
+    Yields:
+        Consecutive chunks
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(func: Callable[[Any, List], Any],
+               state: Any,
+               items: Iterable,
+               n_jobs: Optional[int] = 1,
+               chunksize: int = 1000) -> Iterator[Any]:
+    """
+    Apply ``func(state, chunk)`` to consecutive chunks of items.
+
+    Results are yielded in input order. With ``n_jobs`` other than 1 the
+    chunks are processed on a process pool; ``func`` must then be a
+    module-level function and ``state`` must be picklable on platforms
+    that do not fork.
+
+    Args:
+        func: Function taking (state, chunk)
+        state: Read-only state shared by all chunks
+        items: Input iterable
+        n_jobs: Number of processes (-1 for all CPUs)
+        chunksize: Number of items per chunk
+
+    Yields:
+        Result of func for each chunk
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    chunks = iter_chunks(items, chunksize)
+
+    if n_jobs == 1:
+        for chunk in chunks:
+            yield func(state, chunk)
+        return
+
+    if sys.platform.startswith('linux'):
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+
+    with context.Pool(n_jobs, initializer=_init_worker, initargs=(state,)) as pool:
+        yield from pool.imap(partial(_run_chunk, func), chunks)
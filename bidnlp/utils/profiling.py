@@ -0,0 +1,395 @@
+"""
+Profiling of bidnlp Entry Points
+
+Opt-in instrumentation of the public entry points across preprocessing,
+tokenization, stemming, lemmatization, POS tagging and classification.
+Per entry point it records the call count, total and percentile latency and
+the size of the input (``len`` of the first argument).
+
+Nothing is instrumented until profiling is enabled: ``enable`` installs
+timing wrappers on the entry point methods and ``disable`` puts the original
+functions back, so there is no overhead at all while profiling is off.
+Methods are wrapped on their class, so bound methods taken before profiling
+was enabled (e.g. the stage functions of a built Pipeline) are not recorded.
+Latencies are inclusive: a classifier's ``predict`` includes the time of the
+``normalize`` call it makes.
+
+Example:
+    >>> from bidnlp.stemming import PersianStemmer
+    >>> from bidnlp.utils import profiling
+    >>> stemmer = PersianStemmer()
+    >>> with profiling.profile() as registry:
+    ...     stemmer.stem('کتابها')
+    >>> registry.to_dict()['PersianStemmer.stem']['count']
+    1
+"""
+
+import bisect
+import functools
+import importlib
+import time
+from collections.abc import Sized
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Instrumented methods by module and class
+_ENTRY_POINTS: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ('bidnlp.preprocessing.normalizer', 'PersianNormalizer', ('normalize', 'batch_normalize')),
+    ('bidnlp.preprocessing.cleaner', 'PersianTextCleaner', ('clean', 'batch_clean')),
+    ('bidnlp.preprocessing.punctuation', 'PersianPunctuationNormalizer', ('normalize',)),
+    ('bidnlp.preprocessing.number_normalizer', 'PersianNumberNormalizer',
+     ('normalize_digits', 'convert_words_to_numbers')),
+    ('bidnlp.preprocessing.pipeline', 'Pipeline', ('run', 'batch_run')),
+    ('bidnlp.tokenization.word_tokenizer', 'PersianWordTokenizer', ('tokenize',)),
+    ('bidnlp.tokenization.sentence_tokenizer', 'PersianSentenceTokenizer', ('tokenize',)),
+    ('bidnlp.tokenization.subword_tokenizer', 'PersianCharacterTokenizer', ('tokenize',)),
+    ('bidnlp.tokenization.subword_tokenizer', 'PersianMorphemeTokenizer', ('tokenize',)),
+    ('bidnlp.tokenization.subword_tokenizer', 'PersianSyllableTokenizer', ('tokenize',)),
+    ('bidnlp.stemming.persian_stemmer', 'PersianStemmer', ('stem', 'stem_sentence')),
+    ('bidnlp.lemmatization.persian_lemmatizer', 'PersianLemmatizer', ('lemmatize', 'lemmatize_sentence')),
+    ('bidnlp.pos.base_tagger', 'BasePOSTagger', ('tag_batch', 'evaluate')),
+    ('bidnlp.pos.hmm_tagger', 'HMMPOSTagger', ('train', 'tag', '_viterbi')),
+    ('bidnlp.pos.rule_based_tagger', 'RuleBasedPOSTagger', ('tag',)),
+    ('bidnlp.classification.base_classifier', 'BaseTextClassifier', ('evaluate',)),
+    ('bidnlp.classification.naive_bayes', 'NaiveBayesClassifier',
+     ('train', 'partial_fit', 'predict', 'predict_batch', 'predict_proba', 'predict_proba_batch')),
+    ('bidnlp.classification.linear', 'LinearClassifier',
+     ('train', 'partial_fit', 'predict', 'predict_batch', 'predict_proba', 'predict_proba_batch')),
+    ('bidnlp.classification.keyword_classifier', 'KeywordClassifier',
+     ('train', 'classify', 'predict', 'predict_batch', 'predict_all_batch')),
+    ('bidnlp.classification.sentiment_analyzer', 'PersianSentimentAnalyzer',
+     ('train', 'analyze', 'analyze_batch', 'predict')),
+    ('bidnlp.classification.feature_extraction', 'BagOfWords', ('fit', 'transform')),
+    ('bidnlp.classification.feature_extraction', 'TfidfVectorizer', ('fit', 'transform')),
+    ('bidnlp.classification.feature_extraction', 'NgramExtractor', ('fit', 'transform')),
+    ('bidnlp.classification.feature_extraction', 'HashingVectorizer', ('transform',)),
+    ('bidnlp.classification.analyzer', 'PersianAnalyzer', ('__call__',)),
+    ('bidnlp.classification.similarity', 'SimilaritySearch', ('fit', 'query')),
+    ('bidnlp.classification.minhash', 'MinHash', ('signature', 'signatures')),
+]
+
+# Upper bounds (seconds) of the latency histogram buckets: 1us to 10s
+LATENCY_BUCKETS: Tuple[float, ...] = tuple(
+    base * 10.0 ** exponent for exponent in range(-6, 1) for base in (1.0, 2.5, 5.0)
+) + (10.0,)
+
+# Registry being recorded into while profiling is enabled
+_active: Optional['ProfileRegistry'] = None
+# (class, attribute, original value or None if inherited) of installed wrappers
+_installed: List[Tuple[type, str, Any]] = []
+
+
+class _CallStats:
+    """Latency histogram and input sizes of one entry point."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets', 'sized', 'input_total', 'input_max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        # One count per bucket, plus the overflow bucket
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sized = 0
+        self.input_total = 0
+        self.input_max = 0
+
+    def record(self, seconds: float, size: Optional[int]) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        if size is not None:
+            self.sized += 1
+            self.input_total += size
+            if size > self.input_max:
+                self.input_max = size
+
+    def merge(self, other: '_CallStats') -> None:
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.sized += other.sized
+        self.input_total += other.input_total
+        self.input_max = max(self.input_max, other.input_max)
+
+    def percentile(self, q: float) -> float:
+        """Estimate a latency percentile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = LATENCY_BUCKETS[i - 1] if i else 0.0
+                high = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max
+                low, high = max(low, self.min), min(high, self.max)
+                return low + (high - low) * max(rank - seen, 0.0) / n
+            seen += n
+        return self.max
+
+
+class ProfileRegistry:
+    """
+    Per entry point call statistics.
+
+    Latencies are kept in a fixed histogram (``LATENCY_BUCKETS``), so memory
+    does not grow with the number of calls and percentiles are estimates
+    within a bucket. Updates are not locked; counts from threads running the
+    same entry point concurrently may be slightly off.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._stats: Dict[str, _CallStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._stats
+
+    def record(self, name: str, seconds: float, size: Optional[int] = None) -> None:
+        """
+        Record one call.
+
+        Args:
+            name: Entry point name
+            seconds: Latency of the call
+            size: Size of the call's input, or None if unknown
+        """
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _CallStats()
+        stats.record(seconds, size)
+
+    @contextmanager
+    def timer(self, name: str, size: Optional[int] = None) -> Iterator[None]:
+        """
+        Record the time spent in a ``with`` block, e.g. around user code.
+
+        Args:
+            name: Name to record under
+            size: Size of the block's input, or None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, size)
+
+    def merge(self, other: 'ProfileRegistry') -> None:
+        """
+        Add the statistics of another registry, e.g. from a worker process.
+
+        Args:
+            other: Registry to merge in
+        """
+        for name, stats in other._stats.items():
+            if name not in self._stats:
+                self._stats[name] = _CallStats()
+            self._stats[name].merge(stats)
+
+    def reset(self) -> None:
+        """Remove all recorded statistics."""
+        self._stats = {}
+
+    def to_dict(self, percentiles: Tuple[float, ...] = (50, 90, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        Export the statistics as plain dicts.
+
+        Args:
+            percentiles: Latency percentiles to include, as 'p50' etc.
+
+        Returns:
+            Dict from entry point name to its count, total, mean, min and
+            max latency in seconds, latency percentiles and input sizes
+        """
+        result = {}
+        for name in sorted(self._stats):
+            stats = self._stats[name]
+            entry = {
+                'count': stats.count,
+                'total_seconds': stats.total,
+                'mean_seconds': stats.total / stats.count if stats.count else 0.0,
+                'min_seconds': stats.min if stats.count else 0.0,
+                'max_seconds': stats.max,
+            }
+            for q in percentiles:
+                entry[f'p{q:g}_seconds'] = stats.percentile(q)
+            entry['input_total'] = stats.input_total
+            entry['input_mean'] = stats.input_total / stats.sized if stats.sized else 0.0
+            entry['input_max'] = stats.input_max
+            result[name] = entry
+        return result
+
+    def to_prometheus(self, prefix: str = 'bidnlp') -> str:
+        """
+        Export the statistics in the Prometheus text exposition format.
+
+        Latencies are exported as a histogram and input sizes as a counter
+        and a gauge, labelled by entry point.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text
+        """
+        names = sorted(self._stats)
+        lines = [
+            f'# HELP {prefix}_latency_seconds Latency of bidnlp entry points.',
+            f'# TYPE {prefix}_latency_seconds histogram',
+        ]
+        for name in names:
+            stats = self._stats[name]
+            label = _escape_label(name)
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += n
+                lines.append(f'{prefix}_latency_seconds_bucket{{entry_point="{label}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{prefix}_latency_seconds_bucket{{entry_point="{label}",le="+Inf"}} {stats.count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{entry_point="{label}"}} {stats.total!r}')
+            lines.append(f'{prefix}_latency_seconds_count{{entry_point="{label}"}} {stats.count}')
+
+        for metric, kind, help_text, value in (
+                ('input_size_total', 'counter', 'Total input size (len of the first argument).',
+                 lambda stats: stats.input_total),
+                ('input_size_max', 'gauge', 'Largest input size seen.',
+                 lambda stats: stats.input_max)):
+            lines.append(f'# HELP {prefix}_{metric} {help_text}')
+            lines.append(f'# TYPE {prefix}_{metric} {kind}')
+            for name in names:
+                lines.append(f'{prefix}_{metric}{{entry_point="{_escape_label(name)}"}} {value(self._stats[name])}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _input_size(args: tuple) -> Optional[int]:
+    """Get the size of a method call's first argument after self, if it has one."""
+    if len(args) > 1 and isinstance(args[1], Sized):
+        return len(args[1])
+    return None
+
+
+def _instrument(func: Callable, name: str) -> Callable:
+    """Wrap a method to record its calls into the active registry."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        registry = _active
+        if registry is None:
+            # Bound before profiling was disabled
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.record(name, time.perf_counter() - start, _input_size(args))
+    return wrapper
+
+
+def register_entry_point(module: str, cls: str, *methods: str) -> None:
+    """
+    Add methods to instrument, e.g. of a user-defined classifier.
+
+    Takes effect the next time profiling is enabled.
+
+    Args:
+        module: Module path of the class
+        cls: Class name
+        methods: Method names
+    """
+    _ENTRY_POINTS.append((module, cls, methods))
+
+
+def _install() -> None:
+    """Install the timing wrappers on all entry points."""
+    for module_name, class_name, methods in _ENTRY_POINTS:
+        owner = getattr(importlib.import_module(module_name), class_name)
+        for method in methods:
+            func = getattr(owner, method)
+            wrapper = _instrument(func, f'{class_name}.{method}')
+            # Aliases such as ``__call__ = run`` are the same function
+            attributes = [attr for attr, value in vars(owner).items() if value is func] or [method]
+            for attr in attributes:
+                _installed.append((owner, attr, owner.__dict__.get(attr)))
+                setattr(owner, attr, wrapper)
+
+
+def _uninstall() -> None:
+    """Restore the original entry point functions."""
+    while _installed:
+        owner, attr, original = _installed.pop()
+        if original is None:
+            delattr(owner, attr)
+        else:
+            setattr(owner, attr, original)
+
+
+def enable(registry: Optional[ProfileRegistry] = None) -> ProfileRegistry:
+    """
+    Start recording entry point calls.
+
+    Args:
+        registry: Registry to record into; the default registry if None
+
+    Returns:
+        The registry being recorded into
+    """
+    global _active
+    if not _installed:
+        _install()
+    _active = registry if registry is not None else _DEFAULT_REGISTRY
+    return _active
+
+
+def disable() -> None:
+    """Stop recording and remove the timing wrappers."""
+    global _active
+    _active = None
+    _uninstall()
+
+
+def is_enabled() -> bool:
+    """Check whether profiling is enabled."""
+    return _active is not None
+
+
+def get_registry() -> ProfileRegistry:
+    """Get the default registry, which ``enable()`` records into."""
+    return _DEFAULT_REGISTRY
+
+
+@contextmanager
+def profile(registry: Optional[ProfileRegistry] = None) -> Iterator[ProfileRegistry]:
+    """
+    Record entry point calls within a ``with`` block.
+
+    Args:
+        registry: Registry to record into; a new one if None
+
+    Yields:
+        The registry being recorded into
+    """
+    previous = _active
+    registry = enable(registry if registry is not None else ProfileRegistry())
+    try:
+        yield registry
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+_DEFAULT_REGISTRY = ProfileRegistry()
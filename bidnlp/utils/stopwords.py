@@ -5,58 +5,100 @@ Provides Persian stop words list and utilities.
 """
 
 import os
-from typing import Set, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Set, List, Optional, Tuple, Union
 
 
 class PersianStopWords:
-    """Persian stop words management."""
+    """
+    Persian stop words management.
 
-    # Load default stopwords from file
+    The default list is loaded once per process into a shared frozenset.
+    Instances start from that frozenset and only copy it into a private set
+    when they are modified, so creating a ``PersianStopWords()`` is cheap.
+    """
+
+    # Shared default set, loaded from the generated ``stopwords_data`` module
     _DEFAULT_STOPWORDS = None
+    # Parsed custom files: absolute path -> ((mtime_ns, size), frozenset)
+    _FILE_CACHE: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+
+    @classmethod
+    def _load_default_stopwords(cls) -> FrozenSet[str]:
+        """Load the default stopwords shipped with the package."""
+        if cls._DEFAULT_STOPWORDS is None:
+            from .stopwords_data import STOPWORDS
+            cls._DEFAULT_STOPWORDS = STOPWORDS
+        return cls._DEFAULT_STOPWORDS
 
     @classmethod
-    def _load_default_stopwords(cls) -> Set[str]:
-        """Load default stopwords from stopwords.txt file."""
-        if cls._DEFAULT_STOPWORDS is not None:
-            return cls._DEFAULT_STOPWORDS
-
-        # Get the path to stopwords.txt in the project root
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        stopwords_path = os.path.join(project_root, 'stopwords.txt')
-
-        stopwords = set()
-        if os.path.exists(stopwords_path):
-            with open(stopwords_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    word = line.strip()
-                    if word:  # Skip empty lines
-                        stopwords.add(word)
-
-        cls._DEFAULT_STOPWORDS = stopwords
-        return stopwords
+    def load_file(cls, path: str) -> FrozenSet[str]:
+        """
+        Load a stop word list file (one word per line).
+
+        Parsed files are cached per process and re-read only when their
+        modification time or size changes.
+
+        Args:
+            path: Path to a UTF-8 text file
+
+        Returns:
+            Frozenset of stop words
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._FILE_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        words = read_stopwords_file(path)
+        cls._FILE_CACHE[path] = (key, words)
+        return words
 
     @property
-    def DEFAULT_STOPWORDS(self) -> Set[str]:
+    def DEFAULT_STOPWORDS(self) -> FrozenSet[str]:
         """Get default stopwords."""
         return self._load_default_stopwords()
 
     def __init__(self, custom_stopwords: Optional[Set[str]] = None,
-                 include_defaults: bool = True):
+                 include_defaults: bool = True,
+                 stopwords_file: Optional[str] = None):
         """
         Initialize stop words manager.
 
         Args:
             custom_stopwords: Additional custom stop words
             include_defaults: Whether to include default stop words
+            stopwords_file: Additional stop word list file (see ``load_file``)
         """
-        self.stopwords = set()
-
         if include_defaults:
-            self.stopwords.update(self.DEFAULT_STOPWORDS)
+            # Shared until the first modification
+            self._words = self._load_default_stopwords()
+        else:
+            self._words = frozenset()
+
+        if stopwords_file is not None:
+            file_words = self.load_file(stopwords_file)
+            self._words = self._words | file_words if self._words else file_words
 
         if custom_stopwords:
-            self.stopwords.update(custom_stopwords)
+            self._words = self._words | frozenset(custom_stopwords)
+
+    @property
+    def stopwords(self) -> Set[str]:
+        """The stop word set of this instance (mutable)."""
+        return self._mutable_words()
+
+    @stopwords.setter
+    def stopwords(self, words: Set[str]) -> None:
+        self._words = set(words)
+
+    def _mutable_words(self) -> Set[str]:
+        """Get a private, mutable stop word set, copying the shared one if needed."""
+        if isinstance(self._words, frozenset):
+            self._words = set(self._words)
+        return self._words
 
     def is_stopword(self, word: str) -> bool:
         """
@@ -68,7 +110,7 @@ class PersianStopWords:
         Returns:
             True if word is a stop word
         """
-        return word.strip() in self.stopwords
+        return word.strip() in self._words
 
     def remove_stopwords(self, text: str) -> str:
         """
@@ -80,9 +122,8 @@ class PersianStopWords:
         Returns:
             Text with stop words removed
         """
-        words = text.split()
-        filtered_words = [word for word in words if not self.is_stopword(word)]
-        return ' '.join(filtered_words)
+        words = self._words
+        return ' '.join([word for word in text.split() if word not in words])
 
     def filter_stopwords(self, words: List[str]) -> List[str]:
         """
@@ -94,7 +135,49 @@ class PersianStopWords:
         Returns:
             List with stop words removed
         """
-        return [word for word in words if not self.is_stopword(word)]
+        stopwords = self._words
+        return [word for word in words if word.strip() not in stopwords]
+
+    def filter_tokens_batch(self, token_lists: Iterable[List[str]]) -> List[List[str]]:
+        """
+        Filter stop words from several token lists.
+
+        Tokens are matched as they are (without stripping), which suits the
+        output of a tokenizer.
+
+        Args:
+            token_lists: Iterable of token lists
+
+        Returns:
+            List of token lists with stop words removed
+        """
+        stopwords = self._words
+        return [[token for token in tokens if token not in stopwords]
+                for tokens in token_lists]
+
+    def analyze(self, text: Union[str, List[str]]) -> Dict[str, Any]:
+        """
+        Filter stop words and count them in one pass.
+
+        Args:
+            text: Input text (split on whitespace) or list of tokens
+
+        Returns:
+            Dictionary with the remaining 'tokens', 'stopword_count',
+            'total_words' and 'stopword_ratio'
+        """
+        tokens = text.split() if isinstance(text, str) else text
+        stopwords = self._words
+        filtered = [token for token in tokens if token not in stopwords]
+        total = len(tokens)
+        count = total - len(filtered)
+
+        return {
+            'tokens': filtered,
+            'stopword_count': count,
+            'total_words': total,
+            'stopword_ratio': count / total if total else 0.0,
+        }
 
     def add_stopword(self, word: str) -> None:
         """
@@ -103,7 +186,7 @@ class PersianStopWords:
         Args:
             word: Stop word to add
         """
-        self.stopwords.add(word.strip())
+        self._mutable_words().add(word.strip())
 
     def add_stopwords(self, words: List[str]) -> None:
         """
@@ -112,7 +195,7 @@ class PersianStopWords:
         Args:
             words: List of stop words to add
         """
-        self.stopwords.update(word.strip() for word in words)
+        self._mutable_words().update(word.strip() for word in words)
 
     def remove_stopword(self, word: str) -> None:
         """
@@ -121,7 +204,7 @@ class PersianStopWords:
         Args:
             word: Word to remove
         """
-        self.stopwords.discard(word.strip())
+        self._mutable_words().discard(word.strip())
 
     def remove_stopwords_from_list(self, words: List[str]) -> None:
         """
@@ -130,8 +213,9 @@ class PersianStopWords:
         Args:
             words: List of words to remove
         """
+        stopwords = self._mutable_words()
         for word in words:
-            self.stopwords.discard(word.strip())
+            stopwords.discard(word.strip())
 
     def get_stopwords(self) -> Set[str]:
         """
@@ -140,7 +224,7 @@ class PersianStopWords:
         Returns:
             Set of stop words
         """
-        return self.stopwords.copy()
+        return set(self._words)
 
     def get_stopwords_list(self) -> List[str]:
         """
@@ -149,7 +233,7 @@ class PersianStopWords:
         Returns:
             Sorted list of stop words
         """
-        return sorted(self.stopwords)
+        return sorted(self._words)
 
     def count_stopwords(self, text: str) -> int:
         """
@@ -161,8 +245,8 @@ class PersianStopWords:
         Returns:
             Number of stop words
         """
-        words = text.split()
-        return sum(1 for word in words if self.is_stopword(word))
+        stopwords = self._words
+        return sum(1 for word in text.split() if word in stopwords)
 
     def stopword_ratio(self, text: str) -> float:
         """
@@ -174,20 +258,15 @@ class PersianStopWords:
         Returns:
             Stop word ratio (0.0-1.0)
         """
-        words = text.split()
-        if not words:
-            return 0.0
-
-        stopword_count = self.count_stopwords(text)
-        return stopword_count / len(words)
+        return self.analyze(text)['stopword_ratio']
 
     def reset_to_defaults(self) -> None:
         """Reset stop words to default list."""
-        self.stopwords = self._load_default_stopwords().copy()
+        self._words = self._load_default_stopwords()
 
     def clear(self) -> None:
         """Clear all stop words."""
-        self.stopwords.clear()
+        self._words = set()
 
     @classmethod
     def get_default_stopwords(cls) -> Set[str]:
@@ -197,7 +276,17 @@ class PersianStopWords:
         Returns:
             Set of default stop words
         """
-        return cls._load_default_stopwords().copy()
+        return set(cls._load_default_stopwords())
+
+    @classmethod
+    def get_shared_stopwords(cls) -> FrozenSet[str]:
+        """
+        Get the shared, immutable default stop word set (without copying).
+
+        Returns:
+            Frozenset of default stop words
+        """
+        return cls._load_default_stopwords()
 
     @classmethod
     def get_default_stopwords_list(cls) -> List[str]:
@@ -208,3 +297,48 @@ class PersianStopWords:
             Sorted list of default stop words
         """
         return sorted(cls._load_default_stopwords())
+
+
+def read_stopwords_file(path: str) -> FrozenSet[str]:
+    """
+    Parse a stop word list file.
+
+    Args:
+        path: Path to a UTF-8 text file with one word per line
+
+    Returns:
+        Frozenset of the stripped, non-empty lines
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return frozenset(word for word in (line.strip() for line in f) if word)
+
+
+def write_stopwords_module(source: str, target: str) -> int:
+    """
+    Generate the ``stopwords_data`` module from a stop word list file.
+
+    Args:
+        source: Path to the stop word list (e.g. the project's stopwords.txt)
+        target: Path of the module to write
+
+    Returns:
+        Number of stop words written
+    """
+    words = sorted(read_stopwords_file(source))
+    lines = [
+        '"""',
+        'Default Persian stop words.',
+        '',
+        'Generated from the project\'s stopwords.txt by',
+        '``bidnlp.utils.stopwords.write_stopwords_module``; do not edit by hand.',
+        '"""',
+        '',
+        'STOPWORDS = frozenset((',
+    ]
+    lines.extend(f'    {word!r},' for word in words)
+    lines.append('))')
+
+    with open(target, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return len(words)
+
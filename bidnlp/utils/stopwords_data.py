@@ -0,0 +1,2803 @@
+"""
+Default Persian stop words.
+
+Generated from the project's stopwords.txt by
+``bidnlp.utils.stopwords.write_stopwords_module``; do not edit by hand.
+"""
+
+STOPWORDS = frozenset((
+    '!',
+    '"',
+    '#',
+    '$',
+    '%',
+    '&',
+    "'",
+    '(',
+    ')',
+    '*',
+    '+',
+    ',',
+    '-',
+    '.',
+    '...',
+    '....',
+    '/',
+    '0',
+    '1',
+    '2',
+    '3',
+    '4',
+    '5',
+    '6',
+    '7',
+    '8',
+    '9',
+    ':',
+    '<',
+    '=',
+    '>',
+    '@',
+    '[',
+    '\\',
+    ']',
+    '^',
+    '_',
+    '`',
+    'a',
+    'b',
+    'c',
+    'd',
+    'e',
+    'f',
+    'g',
+    'h',
+    'i',
+    'j',
+    'k',
+    'l',
+    'm',
+    'n',
+    'o',
+    'p',
+    'q',
+    'r',
+    's',
+    't',
+    'u',
+    'v',
+    'w',
+    'x',
+    'y',
+    'z',
+    '{',
+    '|',
+    '}',
+    '~',
+    '«',
+    '»',
+    '،',
+    '؛',
+    '؟',
+    'ء',
+    'آاو و و و',
+    'آباد',
+    'آخ',
+    'آخر',
+    'آخرها',
+    'آخه',
+    'آدمهاست',
+    'آرام',
+    'آرام آرام',
+    'آره',
+    'آری',
+    'آزادانه',
+    'آسان',
+    'آسانی',
+    'آسيب پذيرند',
+    'آسیب',
+    'آسیب پذیرند',
+    'آشكارا',
+    'آشنايند',
+    'آشنایند',
+    'آشکارا',
+    'آقا',
+    'آقای',
+    'آقایان',
+    'آمد',
+    'آمدن',
+    'آمده',
+    'آمرانه',
+    'آن',
+    'آن ها',
+    'آن گاه',
+    'آنان',
+    'آناني',
+    'آنانی',
+    'آنجا',
+    'آنرا',
+    'آنطور',
+    'آنقدر',
+    'آنكه',
+    'آنها',
+    'آنهاست',
+    'آنچنان',
+    'آنچنان كه',
+    'آنچنان که',
+    'آنچه',
+    'آنکه',
+    'آنگاه',
+    'آن\u200cها',
+    'آهان',
+    'آهاي',
+    'آهای',
+    'آور',
+    'آورد',
+    'آوردن',
+    'آورده',
+    'آوه',
+    'آيا',
+    'آيد',
+    'آی',
+    'آیا',
+    'آید',
+    'آیند',
+    'ا',
+    'ابدا',
+    'ابلهانه',
+    'ات',
+    'اتفاقا',
+    'اثر',
+    'اثرِ',
+    'اجراست',
+    'احتراما',
+    'احتمالا',
+    'احياناً',
+    'احیانا',
+    'احیاناً',
+    'اخ',
+    'اختصارا',
+    'اخر',
+    'اخرها',
+    'اخه',
+    'اخيراً',
+    'اخیر',
+    'اخیرا',
+    'اخیراً',
+    'اراسته',
+    'ارام',
+    'ارایه',
+    'ارنه',
+    'اره',
+    'اری',
+    'از',
+    'از آن پس',
+    'از بس که',
+    'از جمله',
+    'ازادانه',
+    'ازان',
+    'ازانجا',
+    'ازانجاكه',
+    'ازاين رو',
+    'ازاین',
+    'ازاین رو',
+    'ازاینرو',
+    'ازبه',
+    'ازجمله',
+    'ازروی',
+    'ازسر',
+    'ازش',
+    'ازقبیل',
+    'ازلحاظ',
+    'ازنظر',
+    'ازو',
+    'ازیك',
+    'اس',
+    'اساس',
+    'اساسا',
+    'اساساً',
+    'اسان',
+    'اسانتر',
+    'اسانی',
+    'است',
+    'استفاد',
+    'استفاده',
+    'اسلامي اند',
+    'اسلامی اند',
+    'اش',
+    'اشان',
+    'اشتباها',
+    'اشد',
+    'اشفته',
+    'اشكار',
+    'اشكارا',
+    'اشكارتر',
+    'اشنایند',
+    'اشند',
+    'اشکارا',
+    'اشیم',
+    'اصطلاجا',
+    'اصطلاحا',
+    'اصلا',
+    'اصلاً',
+    'اصولا',
+    'اصولاً',
+    'اطلاعند',
+    'اعلام',
+    'اغلب',
+    'افتاد',
+    'افتادن',
+    'افزود',
+    'افسوس',
+    'افقی',
+    'اقل',
+    'اقلا',
+    'اقليت',
+    'اقلیت',
+    'اكتسابا',
+    'اكثر',
+    'اكثرا',
+    'اكثراً',
+    'اكثريت',
+    'اكثریت',
+    'اكنون',
+    'الا',
+    'الاسف',
+    'الان',
+    'الایِ',
+    'البته',
+    'البتّه',
+    'الته',
+    'التّه',
+    'الزاما',
+    'الظاهر',
+    'المقدور',
+    'الهي',
+    'الهی',
+    'الي',
+    'الی',
+    'ام',
+    'اما',
+    'امان',
+    'امرانه',
+    'امروز',
+    'امروزه',
+    'امسال',
+    'امشب',
+    'امور',
+    'امورات',
+    'اميدوارم',
+    'اميدوارند',
+    'اميدواريم',
+    'امیدوارم',
+    'امیدوارند',
+    'امیدواریم',
+    'ان',
+    'ان شاأالله',
+    'انان',
+    'انانی',
+    'انتها',
+    'انجام',
+    'اند',
+    'اندك',
+    'اندكي',
+    'اندكی',
+    'اندکی',
+    'انرا',
+    'انشاالله',
+    'انشالا',
+    'انصافا',
+    'انطور',
+    'انقدر',
+    'انكس',
+    'انكه',
+    'انم',
+    'انها',
+    'انهاست',
+    'انوقت',
+    'انچنان',
+    'انچه',
+    'انکه',
+    'انگار',
+    'انگاه',
+    'انگه',
+    'انگونه',
+    'اه',
+    'اهان',
+    'اهای',
+    'او',
+    'اور',
+    'اورد',
+    'اوردن',
+    'اوست',
+    'اول',
+    'اولا',
+    'اولاً',
+    'اولش',
+    'اولین',
+    'اومد',
+    'اومده',
+    'اون',
+    'اونا',
+    'اونایی',
+    'اونجا',
+    'اونجور',
+    'اونجوری',
+    'اونجوری که',
+    'اونهمه',
+    'اوه',
+    'اویی',
+    'اي',
+    'ايشان',
+    'ايم',
+    'اين',
+    'اين جوري',
+    'اين قدر',
+    'اين گونه',
+    'اينان',
+    'اينجا',
+    'اينجاست',
+    'اينكه',
+    'اينها',
+    'اينهاست',
+    'اينو',
+    'اکثر',
+    'اکثرا',
+    'اکثراً',
+    'اکثریت',
+    'اکنون',
+    'اگاهانه',
+    'اگر',
+    'اگر چه',
+    'اگرنه',
+    'اگرچه',
+    'اگه',
+    'ای',
+    'ایا',
+    'اید',
+    'ایشان',
+    'ایم',
+    'این',
+    'این جوری',
+    'این دفعه',
+    'این قدر',
+    'این گونه',
+    'اینا',
+    'اینان',
+    'اینجا',
+    'اینجاست',
+    'اینجور',
+    'اینجوری',
+    'ایند',
+    'اینرو',
+    'اینست',
+    'اینطور',
+    'اینطوری',
+    'اینقدر',
+    'اینك',
+    'اینكه',
+    'اینم',
+    'اینه',
+    'اینها',
+    'اینهاست',
+    'اینهمه',
+    'اینو',
+    'اینچنین',
+    'اینک',
+    'اینکه',
+    'اینگونه',
+    'این\u200cها',
+    'ب',
+    'با',
+    'بااطمینان',
+    'باانكه',
+    'بااين حال',
+    'بااين وجود',
+    'بااین',
+    'بااین حال',
+    'بااین وجود',
+    'بااینكه',
+    'باتوجه',
+    'باد',
+    'بار',
+    'بارة',
+    'باره',
+    'بارها',
+    'بارهاوبارها',
+    'بارهٌ',
+    'باز',
+    'باز هم',
+    'بازاندیشانه',
+    'بازم',
+    'بازهم',
+    'بازي كنان',
+    'بازيگوشانه',
+    'بازی',
+    'بازی کنان',
+    'بازیگوشانه',
+    'باستثنای',
+    'باش',
+    'باشد',
+    'باشم',
+    'باشند',
+    'باشه',
+    'باشيم',
+    'باشی',
+    'باشید',
+    'باشیم',
+    'باعلاقه',
+    'بالا',
+    'بالاتر',
+    'بالاخره',
+    'بالاخص',
+    'بالاست',
+    'بالاي',
+    'بالای',
+    'بالایِ',
+    'بالضرور',
+    'بالطبع',
+    'بالعكس',
+    'بالعکس',
+    'بالقوه',
+    'بالله',
+    'بالنتیجه',
+    'بالنسبه',
+    'باهم',
+    'باوجود',
+    'باوجودانكه',
+    'باوجوداینكه',
+    'باوجودي كه',
+    'باوجودی',
+    'باوجودی که',
+    'باوجودیكه',
+    'باورند',
+    'بايد',
+    'باید',
+    'بایستی',
+    'ببینم',
+    'ببینید',
+    'بتازگی',
+    'بتدريج',
+    'بتدریج',
+    'بتمامی',
+    'بتوان',
+    'بتواند',
+    'بتوانی',
+    'بتوانیم',
+    'بجا',
+    'بجای',
+    'بجز',
+    'بخاطر',
+    'بخاطراینكه',
+    'بخردانه',
+    'بخش',
+    'بخشه',
+    'بخشی',
+    'بخصوص',
+    'بخواه',
+    'بخواهد',
+    'بخواهم',
+    'بخواهند',
+    'بخواهی',
+    'بخواهید',
+    'بخواهیم',
+    'بخوبي',
+    'بخوبی',
+    'بد',
+    'بد جور',
+    'بدان',
+    'بدانجا',
+    'بدانها',
+    'بدانید',
+    'بدبینانه',
+    'بدجور',
+    'بدخواهانه',
+    'بدرستی',
+    'بدرشتی',
+    'بدلخواه',
+    'بدم',
+    'بده',
+    'بدهید',
+    'بدون',
+    'بدين',
+    'بدين ترتيب',
+    'بدينجا',
+    'بدید',
+    'بدیم',
+    'بدین',
+    'بدین ترتیب',
+    'بدینجا',
+    'بدینسان',
+    'بر',
+    'برآن',
+    'برآنند',
+    'برا',
+    'برابر',
+    'برابرِ',
+    'براثر',
+    'براحتی',
+    'براساس',
+    'براستی',
+    'بران',
+    'برانند',
+    'برانهاست',
+    'براي',
+    'برايت',
+    'برايش',
+    'برايشان',
+    'برايم',
+    'برايمان',
+    'برای',
+    'برایت',
+    'برایش',
+    'برایشان',
+    'برایم',
+    'برایمان',
+    'برایِ',
+    'برحسب',
+    'برخلاف',
+    'برخوردار',
+    'برخوردارند',
+    'برخي',
+    'برخی',
+    'برداري',
+    'برداری',
+    'برداشتن',
+    'بردن',
+    'برروی',
+    'برعكس',
+    'برعکس',
+    'برغم',
+    'برم',
+    'برمی',
+    'برن',
+    'برنامه',
+    'برنامه سازهاست',
+    'برنمی',
+    'بره',
+    'برو',
+    'بروز',
+    'بروشني',
+    'بروشنی',
+    'برپا',
+    'بری',
+    'برید',
+    'بریزید',
+    'بریم',
+    'بزرگ',
+    'بزعم',
+    'بزنید',
+    'بزودی',
+    'بس',
+    'بسا',
+    'بسادگي',
+    'بسادگی',
+    'بسته',
+    'بسختي',
+    'بسختی',
+    'بسرعت',
+    'بسهولت',
+    'بسوي',
+    'بسوی',
+    'بسي',
+    'بسيار',
+    'بسياري',
+    'بسی',
+    'بسیار',
+    'بسیاری',
+    'بشان',
+    'بشدت',
+    'بشم',
+    'بشن',
+    'بشه',
+    'بشوند',
+    'بشی',
+    'بشید',
+    'بشیم',
+    'بشین',
+    'بصورت',
+    'بطبع',
+    'بطور',
+    'بطوركلی',
+    'بطوري كه',
+    'بطوری',
+    'بطوری که',
+    'بطوریكه',
+    'بعد',
+    'بعد از اين كه',
+    'بعد از این که',
+    'بعدا',
+    'بعداز',
+    'بعدازان',
+    'بعدازاین',
+    'بعدازظهر',
+    'بعداً',
+    'بعدها',
+    'بعدی',
+    'بعری',
+    'بعضا',
+    'بعضي',
+    'بعضي شان',
+    'بعضي ها',
+    'بعضيهايشان',
+    'بعضی',
+    'بعضی شان',
+    'بعضیشان',
+    'بعضیها',
+    'بعضیهاشان',
+    'بعضیهایشان',
+    'بعضی\u200cها',
+    'بعلاوه',
+    'بعيد',
+    'بعید',
+    'بفهمي نفهمي',
+    'بفهمی',
+    'بفهمی نفهمی',
+    'بقدری',
+    'بكار',
+    'بكرات',
+    'بلادرنگ',
+    'بلافاصله',
+    'بلكه',
+    'بله',
+    'بلکه',
+    'بلی',
+    'بماند',
+    'بمراتب',
+    'بموجب',
+    'بموقع',
+    'بنابراين',
+    'بنابراین',
+    'بنابرین',
+    'بنابه',
+    'بناچار',
+    'بندرت',
+    'بندي',
+    'بندی',
+    'بنی',
+    'به',
+    'به آساني',
+    'به آسانی',
+    'به تازگي',
+    'به تازگی',
+    'به تدريج',
+    'به تدریج',
+    'به تمامي',
+    'به تمامی',
+    'به جاي',
+    'به جای',
+    'به جز',
+    'به خوبي',
+    'به خوبی',
+    'به درشتي',
+    'به درشتی',
+    'به دلخواه',
+    'به راستي',
+    'به راستی',
+    'به رغم',
+    'به روشني',
+    'به روشنی',
+    'به زودي',
+    'به زودی',
+    'به سادگي',
+    'به سادگی',
+    'به سرعت',
+    'به شان',
+    'به شدت',
+    'به طور',
+    'به طور كلي',
+    'به طور کلی',
+    'به طوري كه',
+    'به طوری که',
+    'به علاوه',
+    'به قدري',
+    'به قدری',
+    'به كرات',
+    'به مراتب',
+    'به ناچار',
+    'به هرحال',
+    'به هيچ وجه',
+    'به هیچ وجه',
+    'به وضوح',
+    'به ويژه',
+    'به ویژه',
+    'به کرات',
+    'به گرمي',
+    'به گرمی',
+    'بهت',
+    'بهتر',
+    'بهترين',
+    'بهترین',
+    'بهتون',
+    'بهرحال',
+    'بهش',
+    'بهشون',
+    'بهم',
+    'بهیچ',
+    'بوجود',
+    'بود',
+    'بودم',
+    'بودن',
+    'بودند',
+    'بوده',
+    'بودی',
+    'بودید',
+    'بودیم',
+    'بوضوح',
+    'بويژه',
+    'بویژه',
+    'بي',
+    'بي آنكه',
+    'بي اطلاعند',
+    'بي ترديد',
+    'بي تفاوتند',
+    'بي نيازمندانه',
+    'بي هدف',
+    'بيرون',
+    'بيست',
+    'بيش',
+    'بيشتر',
+    'بيشتري',
+    'بين',
+    'بيگمان',
+    'بپا',
+    'بکار',
+    'بکن',
+    'بکند',
+    'بکنم',
+    'بکنند',
+    'بکنی',
+    'بکنید',
+    'بکنیم',
+    'بگذاریم',
+    'بگرمی',
+    'بگم',
+    'بگه',
+    'بگو',
+    'بگوید',
+    'بگویم',
+    'بگویند',
+    'بگویی',
+    'بگویید',
+    'بگوییم',
+    'بگی',
+    'بگیر',
+    'بگیرد',
+    'بگیرم',
+    'بگیرند',
+    'بگیری',
+    'بگیرید',
+    'بگیریم',
+    'بگین',
+    'بی',
+    'بی آنکه',
+    'بی اطلاعند',
+    'بی تردید',
+    'بی تفاوتند',
+    'بی نیازمندانه',
+    'بی هدف',
+    'بیا',
+    'بیاب',
+    'بیابد',
+    'بیابم',
+    'بیابند',
+    'بیابی',
+    'بیابید',
+    'بیابیم',
+    'بیاد',
+    'بیاریم',
+    'بیام',
+    'بیاور',
+    'بیاورد',
+    'بیاورم',
+    'بیاورند',
+    'بیاوری',
+    'بیاورید',
+    'بیاوریم',
+    'بیاید',
+    'بیایم',
+    'بیایند',
+    'بیایی',
+    'بیایید',
+    'بیاییم',
+    'بیرون',
+    'بیرونِ',
+    'بیست',
+    'بیش',
+    'بیشتر',
+    'بیشتری',
+    'بیفته',
+    'بین',
+    'بینابین',
+    'بینمان',
+    'بیهوده',
+    'بیگمان',
+    'ت',
+    'تا',
+    'تاانجا',
+    'تاانجاكه',
+    'تاانكه',
+    'تااینجا',
+    'تااینكه',
+    'تابه',
+    'تاجاییكه',
+    'تاحدودی',
+    'تاحدی',
+    'تازه',
+    'تازگی',
+    'تاكنون',
+    'تان',
+    'تاوقتی',
+    'تاوقتیكه',
+    'تاکنون',
+    'تحت',
+    'تحريم هاست',
+    'تحریم',
+    'تحریم هاست',
+    'تحقیق',
+    'تدریج',
+    'تدریجا',
+    'تدریجی',
+    'تر',
+    'تر  براساس',
+    'تر براساس',
+    'ترتیب',
+    'ترجیحا',
+    'تردید',
+    'ترند',
+    'ترين',
+    'تری',
+    'تریلیارد',
+    'تریلیون',
+    'ترین',
+    'تصريحاً',
+    'تصریحا',
+    'تصریحاً',
+    'تعداد',
+    'تعدادي',
+    'تعدادی',
+    'تعمدا',
+    'تفاوت',
+    'تفاوتند',
+    'تفننی',
+    'تقريبا',
+    'تقريباً',
+    'تقریبا',
+    'تقریباً',
+    'تك',
+    'تك تك',
+    'تلويحاً',
+    'تلویحا',
+    'تلویحاً',
+    'تمام',
+    'تمام قد',
+    'تماما',
+    'تمامشان',
+    'تمامي',
+    'تمامی',
+    'تند',
+    'تند تند',
+    'تنها',
+    'تنهایی',
+    'تنگاتنگ',
+    'ته',
+    'تو',
+    'توؤماً',
+    'توان',
+    'تواند',
+    'توانست',
+    'توانستم',
+    'توانستن',
+    'توانستند',
+    'توانسته',
+    'توانستی',
+    'توانستیم',
+    'توانم',
+    'توانند',
+    'توانی',
+    'توانید',
+    'توانیم',
+    'توسط',
+    'تولِ',
+    'تون',
+    'تونست',
+    'تووما',
+    'توي',
+    'توی',
+    'تویِ',
+    'تویی',
+    'تک',
+    'تک تک',
+    'تی',
+    'ث',
+    'ثالثا',
+    'ثالثاً',
+    'ثانياً',
+    'ثانی',
+    'ثانیا',
+    'ثانیاً',
+    'ج',
+    'جا',
+    'جاي',
+    'جايي',
+    'جای',
+    'جایی',
+    'جبرگرایانه',
+    'جدا',
+    'جدااز',
+    'جداازهم',
+    'جداً',
+    'جداگانه',
+    'جديد',
+    'جديدا',
+    'جدی',
+    'جدید',
+    'جدیدا',
+    'جرمزاست',
+    'جريان',
+    'جریان',
+    'جز',
+    'جزجز',
+    'جسورانه',
+    'جلو',
+    'جلوتر',
+    'جلوي',
+    'جلوگيري',
+    'جلوگیری',
+    'جلوی',
+    'جلویری',
+    'جلویِ',
+    'جمع',
+    'جمع اند',
+    'جمعا',
+    'جمعي',
+    'جمعی',
+    'جمله',
+    'جنابعالي',
+    'جنابعالی',
+    'جناح',
+    'جنس',
+    'جنس اند',
+    'جهت',
+    'جور',
+    'جوری',
+    'ح',
+    'حاشا',
+    'حاشاوكلا',
+    'حاشيه اي',
+    'حاشیه',
+    'حاشیه\u200cای',
+    'حاضر',
+    'حاضرم',
+    'حاكيست',
+    'حاكیست',
+    'حال',
+    'حالا',
+    'حالكه',
+    'حالی',
+    'حاکیست',
+    'حتما',
+    'حتماً',
+    'حتي',
+    'حتی',
+    'حداقل',
+    'حداكثر',
+    'حداکثر',
+    'حدود',
+    'حدودا',
+    'حدودِ',
+    'حرف',
+    'حسابگرانه',
+    'حسابی',
+    'حسب',
+    'حضرتعالي',
+    'حضرتعالی',
+    'حق',
+    'حقيرانه',
+    'حقیرانه',
+    'حقیقتا',
+    'حكما',
+    'حكماً',
+    'حكیمانه',
+    'حول',
+    'حکماً',
+    'خ',
+    'خارج',
+    'خارجِ',
+    'خاست',
+    'خالص',
+    'خالصانه',
+    'خالی',
+    'خام',
+    'خامسا',
+    'خب',
+    'خداحافظ',
+    'خداروشکر',
+    'خداست',
+    'خداگونه',
+    'خدمات',
+    'خردمندانه',
+    'خسته',
+    'خسته اي',
+    'خسته\u200cای',
+    'خشمگین',
+    'خصمانه',
+    'خصوصا',
+    'خصوصاً',
+    'خلاصه',
+    'خلاقانه',
+    'خو',
+    'خواست',
+    'خواستم',
+    'خواستن',
+    'خواستند',
+    'خواسته',
+    'خواستی',
+    'خواستید',
+    'خواستیم',
+    'خواه',
+    'خواهد',
+    'خواهش',
+    'خواهم',
+    'خواهند',
+    'خواهيم',
+    'خواهی',
+    'خواهید',
+    'خواهیم',
+    'خواهیمكرد',
+    'خوب',
+    'خوبتر',
+    'خوبست',
+    'خوبی',
+    'خوتهد',
+    'خود',
+    'خود به خود',
+    'خوداند',
+    'خوداگاهانه',
+    'خودبه',
+    'خودبه خودي',
+    'خودبه خودی',
+    'خودت',
+    'خودتان',
+    'خودتو',
+    'خودرا',
+    'خودش',
+    'خودشان',
+    'خودشون',
+    'خودم',
+    'خودمان',
+    'خودمختارانه',
+    'خودمو',
+    'خودنمایانه',
+    'خودی',
+    'خوردن',
+    'خوش',
+    'خوشبختانه',
+    'خوشبینانه',
+    'خوشحال',
+    'خويش',
+    'خويشتنم',
+    'خوگیرانه',
+    'خویش',
+    'خویشتن',
+    'خویشتنم',
+    'خير',
+    'خيره',
+    'خيلي',
+    'خیاه',
+    'خیر',
+    'خیره',
+    'خیلی',
+    'د',
+    'دا',
+    'داام',
+    'دااما',
+    'داخل',
+    'داد',
+    'دادم',
+    'دادن',
+    'دادند',
+    'داده',
+    'دادی',
+    'دادید',
+    'دادیم',
+    'دار',
+    'دارا',
+    'داراست',
+    'دارای',
+    'دارد',
+    'دارم',
+    'دارن',
+    'دارند',
+    'داره',
+    'داريم',
+    'داری',
+    'دارید',
+    'داریم',
+    'داشت',
+    'داشتم',
+    'داشتن',
+    'داشتند',
+    'داشته',
+    'داشتی',
+    'داشتید',
+    'داشتیم',
+    'دامم',
+    'دانست',
+    'دانند',
+    'داوطلبانه',
+    'دایم',
+    'دایما',
+    'دخترانه',
+    'در',
+    'در آینده',
+    'در باره',
+    'در بارهٌ',
+    'در ثاني',
+    'در ثانی',
+    'در كل',
+    'در كنار',
+    'در مجموع',
+    'در نهايت',
+    'در نهایت',
+    'در واقع',
+    'در کل',
+    'در کنار',
+    'دراثر',
+    'دراره',
+    'درازا',
+    'درازای',
+    'دران',
+    'دراين ميان',
+    'دراین',
+    'دراین میان',
+    'درباب',
+    'درباره',
+    'دربدر',
+    'دربر',
+    'دربرابر',
+    'دربه',
+    'درتخت',
+    'درثانی',
+    'درحال',
+    'درحالي كه',
+    'درحاليكه',
+    'درحالی',
+    'درحالی که',
+    'درحالیكه',
+    'درحالیکه',
+    'دردكشان',
+    'درراستای',
+    'درست',
+    'درست و حسابي',
+    'درست و حسابی',
+    'درسته',
+    'درشت',
+    'درشتی',
+    'درصورتي كه',
+    'درصورتی',
+    'درصورتی که',
+    'درصورتیكه',
+    'درطی',
+    'درعين حال',
+    'درعین',
+    'درعین حال',
+    'دركل',
+    'دركنار',
+    'درمجموع',
+    'درمقابل',
+    'درمورد',
+    'درمیان',
+    'درنتیجه',
+    'درنهایت',
+    'درهر',
+    'درهرحال',
+    'درهرصورت',
+    'درواقع',
+    'درون',
+    'دريغ',
+    'دريغا',
+    'درپی',
+    'دریغ',
+    'دریغا',
+    'درین',
+    'دسته',
+    'دسته دسته',
+    'دشمنيم',
+    'دشمنیم',
+    'دشوار',
+    'دشوارتر',
+    'دفعه',
+    'دقيقا',
+    'دقیق',
+    'دقیقا',
+    'دلخواه',
+    'دلخوش',
+    'دلشاد',
+    'دم',
+    'دنالِ',
+    'دنبال',
+    'دنبالِ',
+    'ده',
+    'دهد',
+    'دهم',
+    'دهند',
+    'دهی',
+    'دهید',
+    'دهیم',
+    'دو',
+    'دو روزه',
+    'دوباره',
+    'دوباره\u200cای',
+    'دوتا',
+    'دوتادوتا',
+    'دور',
+    'دوراز',
+    'دورتر',
+    'دوساله',
+    'دوستانه',
+    'دوم',
+    'دون',
+    'دونستن',
+    'دونید',
+    'دوهزاری',
+    'ديده',
+    'دير',
+    'ديرت',
+    'ديرم',
+    'ديروز',
+    'ديشب',
+    'ديوانه اي',
+    'ديوي',
+    'ديگر',
+    'ديگران',
+    'ديگري',
+    'ديگه',
+    'دچار',
+    'دگربار',
+    'دگرباره',
+    'دگرگون',
+    'دی',
+    'دیدم',
+    'دیده',
+    'دیر',
+    'دیران',
+    'دیرت',
+    'دیرم',
+    'دیروز',
+    'دیروزبه',
+    'دیری',
+    'دیشب',
+    'دیوانه',
+    'دیوانه\u200cای',
+    'دیوی',
+    'دیگر',
+    'دیگران',
+    'دیگرتا',
+    'دیگری',
+    'دیگه',
+    'ذ',
+    'ذاتا',
+    'ذاتاً',
+    'ذاری',
+    'ذاشته',
+    'ذالك',
+    'ذلک',
+    'ذیل',
+    'ذیلا',
+    'ر',
+    'را',
+    'رااز',
+    'رابسیار',
+    'رابه',
+    'راجع',
+    'راجع به',
+    'راحت',
+    'راحتر',
+    'رادر',
+    'رارِ',
+    'راسا',
+    'راساس',
+    'راست',
+    'راستا',
+    'راستي',
+    'راستی',
+    'راه',
+    'رای',
+    'رایِ',
+    'رخوردار',
+    'رخی',
+    'رداری',
+    'ردد',
+    'رسما',
+    'رسید',
+    'رسیده',
+    'رشته',
+    'رغم',
+    'رفت',
+    'رفتارهاست',
+    'رفتن',
+    'رفته',
+    'رفته\u200cام',
+    'رنجند',
+    'رندانه',
+    'ره',
+    'رهگشاست',
+    'رو',
+    'رواست',
+    'روب',
+    'روبرو',
+    'روبروست',
+    'روبه',
+    'روز',
+    'روز به روز',
+    'روزانه',
+    'روزبروز',
+    'روزمره',
+    'روزه',
+    'روزه اي',
+    'روزه ايم',
+    'روزه ایم',
+    'روزه ست',
+    'روزه م',
+    'روزهاي',
+    'روزهای',
+    'روزه\u200cای',
+    'روش',
+    'روشن',
+    'روشنی',
+    'روم',
+    'روهی',
+    'روى',
+    'روي',
+    'رويش',
+    'روی',
+    'رویش',
+    'رویم',
+    'رویِ',
+    'ريزي',
+    'ریاكارانه',
+    'ریز',
+    'ریزان',
+    'ریزی',
+    'ز',
+    'زد',
+    'زدم',
+    'زدن',
+    'زده',
+    'زشت',
+    'زشتكارانند',
+    'زشتکارانند',
+    'زمان',
+    'زمانی',
+    'زمینه',
+    'زنند',
+    'زهي',
+    'زهی',
+    'زو',
+    'زود',
+    'زودتر',
+    'زودی',
+    'زياد',
+    'زياده',
+    'زير',
+    'زيرا',
+    'زيرچشمي',
+    'زیاد',
+    'زیادتر',
+    'زیاده',
+    'زیبا',
+    'زیباتر',
+    'زیر',
+    'زیرا',
+    'زیراكه',
+    'زیركانه',
+    'زیرند',
+    'زیرِ',
+    'زیرچشمی',
+    'زین',
+    'س',
+    'سابق',
+    'سابقا',
+    'ساختن',
+    'ساخته',
+    'ساخته\u200cام',
+    'ساده',
+    'ساده اند',
+    'سادگی',
+    'سازان',
+    'سازهاست',
+    'سازي',
+    'سازگارانه',
+    'سازی',
+    'ساق',
+    'ساكنند',
+    'سال',
+    'سالانه',
+    'سالته',
+    'سالم',
+    'سالم تر',
+    'سالم\u200cتر',
+    'ساله',
+    'سالهاست',
+    'سالیانه',
+    'ساکنند',
+    'سایر',
+    'سایران',
+    'سایرین',
+    'ست',
+    'سخت',
+    'سختتر',
+    'سخته',
+    'سر',
+    'سراسر',
+    'سرانجام',
+    'سراپا',
+    'سرعت',
+    'سري',
+    'سريع',
+    'سريعاً',
+    'سری',
+    'سریع',
+    'سریعا',
+    'سریعاً',
+    'سریِ',
+    'سعي',
+    'سعی',
+    'سمت',
+    'سمتِ',
+    'سنگدلانه',
+    'سنگین',
+    'سه',
+    'سه باره',
+    'سهوا',
+    'سهواً',
+    'سوم',
+    'سوي',
+    'سوی',
+    'سویِ',
+    'سياه چاله هاست',
+    'سيخ',
+    'سپس',
+    'سی',
+    'سیار',
+    'سیاری',
+    'سیاه',
+    'سیاه چاله هاست',
+    'سیخ',
+    'ش',
+    'شاأالله',
+    'شااالله',
+    'شاد',
+    'شادتر',
+    'شادمان',
+    'شاكله',
+    'شان',
+    'شاهدند',
+    'شاهديم',
+    'شاهدیم',
+    'شايد',
+    'شاید',
+    'شب',
+    'شبانه',
+    'شبهاست',
+    'شتابان',
+    'شتابزده',
+    'شجاعانه',
+    'شخصا',
+    'شخصاً',
+    'شد',
+    'شدت',
+    'شدم',
+    'شدن',
+    'شدند',
+    'شده',
+    'شده\u200cاند',
+    'شديدا',
+    'شديداً',
+    'شدگان',
+    'شدی',
+    'شدید',
+    'شدیدا',
+    'شدیداً',
+    'شدیم',
+    'شرط',
+    'شش',
+    'شش  نداشته',
+    'شش نداشته',
+    'شصت',
+    'شصتم',
+    'شم',
+    'شما',
+    'شماري',
+    'شماری',
+    'شماست',
+    'شمايند',
+    'شمایند',
+    'شناسي',
+    'شناسی',
+    'شناسید',
+    'شه',
+    'شو',
+    'شود',
+    'شوراست',
+    'شوقم',
+    'شوم',
+    'شون',
+    'شوند',
+    'شونده',
+    'شوی',
+    'شوید',
+    'شویم',
+    'شيرين',
+    'شيرينه',
+    'شيك',
+    'شی',
+    'شیرین',
+    'شیرینه',
+    'شیك',
+    'شیم',
+    'شیک',
+    'ص',
+    'صادقانه',
+    'صاف',
+    'صبح',
+    'صد',
+    'صدالبته',
+    'صددرصد',
+    'صدم',
+    'صدمین',
+    'صراحتا',
+    'صرفا',
+    'صرفاً',
+    'صريحاً',
+    'صریح',
+    'صریحا',
+    'صریحاً',
+    'صریحتر',
+    'صمیمانه',
+    'صندوق',
+    'صندوق هاست',
+    'صورت',
+    'ض',
+    'ضد',
+    'ضدِّ',
+    'ضدِّ',
+    'ضرورتا',
+    'ضعیف',
+    'ضعیفتر',
+    'ضمن',
+    'ضمنا',
+    'ضمناً',
+    'ط',
+    'طبعا',
+    'طبعاً',
+    'طبقِ',
+    'طبيعتا',
+    'طبیعتا',
+    'طرف',
+    'طريق',
+    'طریق',
+    'طقِ',
+    'طلبكارانه',
+    'طلبکارانه',
+    'طور',
+    'طوری',
+    'طي',
+    'طی',
+    'ظ',
+    'ظاهرا',
+    'ظاهراً',
+    'ظهر',
+    'ع',
+    'عاجزانه',
+    'عادلانه',
+    'عاقبت',
+    'عاقلانه',
+    'عالمانه',
+    'عالی',
+    'عبارتند',
+    'عج',
+    'عجب',
+    'عجولانه',
+    'عدم',
+    'عرفاني',
+    'عرفانی',
+    'عری',
+    'عزیز',
+    'عضی',
+    'عقب',
+    'عقبتر',
+    'عقبِ',
+    'عقِ',
+    'علارغم',
+    'علاقه مند',
+    'علاوه',
+    'علاوه بر',
+    'علاوه بر آن',
+    'علاوه برآن',
+    'علت',
+    'علنا',
+    'علناً',
+    'علي الظاهر',
+    'علي رغم',
+    'عليه',
+    'علّتِ',
+    'علی',
+    'علی الظاهر',
+    'علی رغم',
+    'علیرغم',
+    'علیه',
+    'عمدا',
+    'عمداً',
+    'عمدتا',
+    'عمدتاً',
+    'عمده',
+    'عمدی',
+    'عمل',
+    'عملا',
+    'عملاً',
+    'عملي اند',
+    'عملگرایانه',
+    'عملی',
+    'عملی اند',
+    'عموم',
+    'عموما',
+    'عموماً',
+    'عمیقا',
+    'عن',
+    'عنقريب',
+    'عنقریب',
+    'عنوان',
+    'عنوانِ',
+    'عه',
+    'عيناً',
+    'عینا',
+    'عیناً',
+    'غ',
+    'غالبا',
+    'غزالان',
+    'غير',
+    'غيرقانوني',
+    'غیر',
+    'غیراز',
+    'غیرازان',
+    'غیرازاین',
+    'غیرتصادفی',
+    'غیرطبیعی',
+    'غیرعمدی',
+    'غیرقانونی',
+    'غیریكسان',
+    'ـ',
+    'ف',
+    'فاقد',
+    'فبها',
+    'فر',
+    'فراتر',
+    'فراتراز',
+    'فراوان',
+    'فردا',
+    'فرماید',
+    'فعالانه',
+    'فعلا',
+    'فعلاً',
+    'فقط',
+    'فكر',
+    'فلان',
+    'فلذا',
+    'فناورانه',
+    'فهرستوار',
+    'فورا',
+    'فوری',
+    'فوق',
+    'فکر',
+    'فی',
+    'ق',
+    'قاالند',
+    'قابل',
+    'قاطبه',
+    'قاطعانه',
+    'قاعدتا',
+    'قاعدتاً',
+    'قال',
+    'قانونا',
+    'قانوناً',
+    'قبل',
+    'قبلا',
+    'قبلاً',
+    'قبلند',
+    'قد',
+    'قدر',
+    'قدرمسلم',
+    'قدري',
+    'قدری',
+    'قرار',
+    'قراردادن',
+    'قریب',
+    'قصدِ',
+    'قضاياست',
+    'قضایاست',
+    'قطعا',
+    'قطعاً',
+    'قل',
+    'قیلا',
+    'ك',
+    'كارافرینانه',
+    'كاربرمدارانه',
+    'كارند',
+    'كاش',
+    'كاشكي',
+    'كاشكی',
+    'كاملا',
+    'كاملاً',
+    'كاملتر',
+    'كان',
+    'كاین',
+    'كجا',
+    'كجاست',
+    'كدام',
+    'كدامند',
+    'كدامیك',
+    'كرات',
+    'كرد',
+    'كردم',
+    'كردن',
+    'كردند',
+    'كرده',
+    'كردید',
+    'كردیم',
+    'كز',
+    'كزین',
+    'كس',
+    'كسانی',
+    'كسي',
+    'كسی',
+    'كشیدن',
+    'كل',
+    'كلا',
+    'كلي',
+    'كليشه هاست',
+    'كليه',
+    'كلی',
+    'كلیشه',
+    'كم',
+    'كم كم',
+    'كمابیش',
+    'كماكان',
+    'كمتر',
+    'كمتره',
+    'كمي',
+    'كمی',
+    'كنار',
+    'كنارش',
+    'كنارِ',
+    'كنان',
+    'كنايه اي',
+    'كنایه',
+    'كند',
+    'كنم',
+    'كنن',
+    'كنند',
+    'كننده',
+    'كنه',
+    'كنيد',
+    'كنيم',
+    'كنی',
+    'كنید',
+    'كنیم',
+    'كه',
+    'كودكانه',
+    'كوركورانه',
+    'كي',
+    'كَی',
+    'كی',
+    'كیست',
+    'ل',
+    'لا',
+    'لااقل',
+    'لاجرم',
+    'لب',
+    'لذا',
+    'لزوما',
+    'لزوماً',
+    'لطفا',
+    'لطفاً',
+    'لكه',
+    'له',
+    'ليكن',
+    'لکه',
+    'لی',
+    'لیكن',
+    'لیکن',
+    'م',
+    'ما',
+    'ما رو',
+    'مات',
+    'مادام',
+    'مادامي',
+    'مادامی',
+    'مادامیكه',
+    'مارو',
+    'ماست',
+    'ماشینوار',
+    'ماقبل',
+    'مالا',
+    'مالامال',
+    'مامان',
+    'مامان مامان گويان',
+    'مامان مامان گویان',
+    'مان',
+    'مانند',
+    'مانندِ',
+    'ماه',
+    'ماهرانه',
+    'ماهیتا',
+    'مایی',
+    'مبادا',
+    'متؤسفانه',
+    'متاسفانه',
+    'متعاقبا',
+    'متفاوتند',
+    'متفكرانه',
+    'متقابلا',
+    'متوالی',
+    'متوسفانه',
+    'مثابه',
+    'مثل',
+    'مثل اینکه',
+    'مثلا',
+    'مثلِ',
+    'مجانی',
+    'مجبورند',
+    'مجددا',
+    'مجدداً',
+    'مجرمانه',
+    'مجموع',
+    'مجموعا',
+    'مجموعاً',
+    'محتاجند',
+    'محتاط',
+    'محتاطانه',
+    'محض رضای خدا',
+    'محكم',
+    'محكم تر',
+    'محکم',
+    'محکم\u200cتر',
+    'مخالفند',
+    'مختصر',
+    'مختصرا',
+    'مختلف',
+    'مخصوصا',
+    'مخصوصاً',
+    'مدام',
+    'مداوم',
+    'مدبر',
+    'مدبرانه',
+    'مدت',
+    'مدتهاست',
+    'مدتی',
+    'مدّتی',
+    'مذهبي اند',
+    'مذهبی',
+    'مذهبی اند',
+    'مر',
+    'مرا',
+    'مراتب',
+    'مرتب',
+    'مرتبا',
+    'مردانه',
+    'مردم',
+    'مردم اند',
+    'مرسی',
+    'مستحضريد',
+    'مستحضرید',
+    'مستعد',
+    'مستقلا',
+    'مستقيما',
+    'مستقیم',
+    'مستقیما',
+    'مستمر',
+    'مستمرا',
+    'مستند',
+    'مسلم',
+    'مسلما',
+    'مسیولانه',
+    'مشت',
+    'مشتركا',
+    'مشتركاً',
+    'مشترکاً',
+    'مشخص',
+    'مشغول',
+    'مشغولند',
+    'مشكل',
+    'مشكلتر',
+    'مطلق',
+    'مطلقا',
+    'مطمانا',
+    'مطمانم',
+    'مطمنا',
+    'مطمینا',
+    'مع',
+    'مع الاسف',
+    'مع ذلك',
+    'مع ذلک',
+    'معتقدم',
+    'معتقدند',
+    'معتقديم',
+    'معتقدیم',
+    'معدود',
+    'معذوريم',
+    'معذوریم',
+    'معلق',
+    'معلومه',
+    'معمولا',
+    'معمولاً',
+    'معمولي',
+    'معمولی',
+    'مغرضانه',
+    'مغلوب',
+    'مفيدند',
+    'مفیدند',
+    'مقابل',
+    'مقال',
+    'مقدار',
+    'مقصر',
+    'مقصرند',
+    'مقصري',
+    'مقصری',
+    'مقلوب',
+    'مكرر',
+    'مكررا',
+    'مكرراً',
+    'ملزم',
+    'ملیارد',
+    'ملیون',
+    'مميزيهاست',
+    'ممکن',
+    'ممیزیهاست',
+    'من',
+    'منتهي',
+    'منتهی',
+    'منحصر',
+    'منحصرا',
+    'منحصربفرد',
+    'مند',
+    'منصفانه',
+    'منطقا',
+    'منطقي',
+    'منطقی',
+    'منم',
+    'منو',
+    'مني',
+    'منی',
+    'مهمتره',
+    'مواجهند',
+    'موارد',
+    'موجب',
+    'موجودند',
+    'موخر',
+    'مورد',
+    'موضوع',
+    'موقتا',
+    'موقعیكه',
+    'مون',
+    'مي',
+    'ميان',
+    'ميزان',
+    'ميليارد',
+    'ميليون',
+    'مکرر',
+    'مکرراً',
+    'مگر',
+    'مگر آن كه',
+    'مگر آن که',
+    'مگر اين كه',
+    'مگر این که',
+    'مگرانكه',
+    'مگراینكه',
+    'مگه',
+    'مگو',
+    'می',
+    'می خوانم',
+    'می خوانید',
+    'می شود',
+    'میاد',
+    'میان',
+    'میباشد',
+    'میتونه',
+    'میخواد',
+    'میخواستن',
+    'میخوانم',
+    'میخوانید',
+    'میخواهند',
+    'میخوای',
+    'میخونم',
+    'میخونید',
+    'میداد',
+    'میدم',
+    'میدن',
+    'میده',
+    'میدهد',
+    'میدهم',
+    'میدهیم',
+    'میرم',
+    'میرن',
+    'میره',
+    'میروم',
+    'میزان',
+    'میشد',
+    'میشم',
+    'میشه',
+    'میشود',
+    'میشوند',
+    'میفرستم',
+    'میفرستی',
+    'میفرستین',
+    'میكند',
+    'میكنم',
+    'میكنن',
+    'میكنند',
+    'میكنه',
+    'میكنیم',
+    'میلیارد',
+    'میلیون',
+    'مینوشند',
+    'میکرد',
+    'میکند',
+    'میکنم',
+    'میکنن',
+    'میکنند',
+    'میکنه',
+    'میکنی',
+    'میکنید',
+    'میکنیم',
+    'میگردد',
+    'میگم',
+    'میگن',
+    'میگه',
+    'میگی',
+    'میگیره',
+    'می\u200cآید',
+    'می\u200cباشد',
+    'می\u200cباشند',
+    'می\u200cتوان',
+    'می\u200cتواند',
+    'می\u200cتوانند',
+    'می\u200cخواهیم',
+    'می\u200cداند',
+    'می\u200cدهد',
+    'می\u200cرسد',
+    'می\u200cرود',
+    'می\u200cشد',
+    'می\u200cشود',
+    'می\u200cشوند',
+    'می\u200cفرماید',
+    'می\u200cکند',
+    'می\u200cکنم',
+    'می\u200cکنند',
+    'می\u200cکنیم',
+    'ن',
+    'نا',
+    'نااميد',
+    'ناامید',
+    'نااگاهانه',
+    'ناتوان',
+    'ناخواسته',
+    'ناخوانده',
+    'نادیده',
+    'ناراضي اند',
+    'ناراضی',
+    'ناراضی اند',
+    'ناراین',
+    'ناسازگارانه',
+    'ناشناخته',
+    'ناشي',
+    'ناشی',
+    'ناكام',
+    'نام',
+    'ناهشیار',
+    'ناپذیر',
+    'ناچار',
+    'ناگاه',
+    'ناگزير',
+    'ناگزیر',
+    'ناگهان',
+    'ناگهانی',
+    'ناید',
+    'نباش',
+    'نبايد',
+    'نباید',
+    'نبش',
+    'نبود',
+    'نتیجتا',
+    'نحوه',
+    'نخست',
+    'نخستين',
+    'نخستین',
+    'نخواهد',
+    'نخواهم',
+    'نخواهند',
+    'نخواهی',
+    'نخواهید',
+    'نخواهیم',
+    'نخودي',
+    'نخودی',
+    'نداد',
+    'ندارد',
+    'ندارم',
+    'ندارند',
+    'نداره',
+    'نداری',
+    'ندارید',
+    'نداریم',
+    'نداشت',
+    'نداشتم',
+    'نداشتند',
+    'نداشته',
+    'نداشتی',
+    'نداشتید',
+    'نداشتیم',
+    'ندرت',
+    'ندرتا',
+    'ندی',
+    'ندیدی',
+    'نرم',
+    'نرمی',
+    'نره',
+    'نریم',
+    'نزد',
+    'نزديك',
+    'نزدِ',
+    'نزدیك',
+    'نزدیكتر',
+    'نزدیكِ',
+    'نزدیم',
+    'نزدیک',
+    'نزدیکِ',
+    'نسبت',
+    'نسبتا',
+    'نشان',
+    'نشده',
+    'نشه',
+    'نشون',
+    'نظرا',
+    'نظربه',
+    'نظير',
+    'نظیر',
+    'نفر',
+    'نفرند',
+    'نفهمی',
+    'نقادانه',
+    'نكرده',
+    'نكنند',
+    'نكنه',
+    'نمايد',
+    'نماید',
+    'نمایش',
+    'نموده',
+    'نمي',
+    'نمی',
+    'نمیاورم',
+    'نمیبرد',
+    'نمیتونه',
+    'نمیروم',
+    'نمیشه',
+    'نمیكنن',
+    'نمیكنند',
+    'نمیمونید',
+    'نمیگیرند',
+    'نمی\u200cشود',
+    'نمی\u200cکند',
+    'نه',
+    'نه تنها',
+    'نهان',
+    'نهايتا',
+    'نهايتاً',
+    'نهایت',
+    'نهایتا',
+    'نهایتاً',
+    'نواورانه',
+    'نود',
+    'نودم',
+    'نودمین',
+    'نوشت',
+    'نوع',
+    'نوعا',
+    'نوعاً',
+    'نوعي',
+    'نوعی',
+    'نومید',
+    'نيازمندند',
+    'نيز',
+    'نيست',
+    'نيمي',
+    'نکردن',
+    'نکرده',
+    'نکن',
+    'نکند',
+    'نکنم',
+    'نکنند',
+    'نکنی',
+    'نکنید',
+    'نکنیم',
+    'نگاه',
+    'نگو',
+    'نیازمندانه',
+    'نیازمندند',
+    'نیز',
+    'نیست',
+    'نیستم',
+    'نیستند',
+    'نیستیم',
+    'نیك',
+    'نیم',
+    'نیمی',
+    'ه',
+    'ها',
+    'هاست',
+    'هاش',
+    'هام رو',
+    'هامو',
+    'هان',
+    'هانتا',
+    'هاي',
+    'هايي',
+    'های',
+    'هایت',
+    'هایی',
+    'هبچ',
+    'هترین',
+    'هدف',
+    'هر',
+    'هر از گاهي',
+    'هر از گاهی',
+    'هر چند',
+    'هر چند كه',
+    'هر چند که',
+    'هر چه',
+    'هرازچندگاهی',
+    'هرانچه',
+    'هرجا',
+    'هرحال',
+    'هرز',
+    'هرزچندگاهی',
+    'هرساله',
+    'هرقدر',
+    'هركدام',
+    'هركس',
+    'هركسی',
+    'هركه',
+    'هروقت',
+    'هرچقدر',
+    'هرچند',
+    'هرچه',
+    'هرکس',
+    'هرکی',
+    'هرگاه',
+    'هرگز',
+    'هرگونه',
+    'هزار',
+    'هزارها',
+    'هست',
+    'هستا',
+    'هستش',
+    'هستم',
+    'هستن',
+    'هستند',
+    'هستيم',
+    'هستی',
+    'هستید',
+    'هستیم',
+    'هسن',
+    'هشان',
+    'هشتاد',
+    'هشتادم',
+    'هشیارانه',
+    'هفت',
+    'هفتاد',
+    'هق',
+    'هق هق كنان',
+    'هق هق کنان',
+    'هم',
+    'هم اكنون',
+    'هم اينك',
+    'هم اکنون',
+    'هم اینک',
+    'همان',
+    'همان طور كه',
+    'همان طور که',
+    'همان گونه كه',
+    'همان گونه که',
+    'همانا',
+    'همانطور',
+    'همانطوركه',
+    'همانطوری',
+    'همانطوریكه',
+    'همانقدر',
+    'همانند',
+    'همانها',
+    'همانی',
+    'هماهنگتر',
+    'همخوان',
+    'همدلانه',
+    'همديگر',
+    'همدیگر',
+    'همزمان',
+    'همسو',
+    'همسوبا',
+    'همكارانه',
+    'هممون',
+    'همنوا',
+    'همه',
+    'همه اش',
+    'همه روزه',
+    'همه ساله',
+    'همه شان',
+    'همه مون',
+    'همهٌ',
+    'همه\u200cاش',
+    'همه\u200cمون',
+    'همواره',
+    'همون',
+    'هميشه',
+    'همين',
+    'همين كه',
+    'همچنان',
+    'همچنان كه',
+    'همچنان که',
+    'همچنانكه',
+    'همچنين',
+    'همچنین',
+    'همچون',
+    'همچين',
+    'همچین',
+    'همگام',
+    'همگان',
+    'همگي',
+    'همگی',
+    'همی',
+    'همیشه',
+    'همیشگی',
+    'همین',
+    'همین که',
+    'همینطور',
+    'همینطوركه',
+    'همینطوری',
+    'همینطوریكه',
+    'همینكه',
+    'هنام',
+    'هنامِ',
+    'هنامی',
+    'هنوز',
+    'هنگام',
+    'هنگامي كه',
+    'هنگامِ',
+    'هنگامی',
+    'هنگامی که',
+    'هنگامیكه',
+    'هوشمندانه',
+    'هوشیارانه',
+    'هوي',
+    'هوی',
+    'هي',
+    'هيچ',
+    'هيچ گاه',
+    'هيچكدام',
+    'هيچكس',
+    'هيچي',
+    'هيچگاه',
+    'هيچگونه',
+    'هی',
+    'هیچ',
+    'هیچ جور',
+    'هیچ گاه',
+    'هیچجور',
+    'هیچكدام',
+    'هیچكس',
+    'هیچوقت',
+    'هیچکدام',
+    'هیچکس',
+    'هیچگاه',
+    'هیچگونه',
+    'هیچی',
+    'هیچیك',
+    'هیچ\u200cجور',
+    'و',
+    'و لا غير',
+    'و لا غیر',
+    'وابسته',
+    'وابسته اند',
+    'وارد',
+    'واسش',
+    'واسه',
+    'واضح',
+    'واضحتر',
+    'واقع',
+    'واقعا',
+    'واقعاً',
+    'واقعي',
+    'واقعی',
+    'واقفند',
+    'واما',
+    'واي',
+    'وای',
+    'وبرای',
+    'وجدانا',
+    'وجه',
+    'وجود',
+    'وجودیكه',
+    'وحشت',
+    'وحشت زده',
+    'ود',
+    'ودن',
+    'ودند',
+    'وده',
+    'ور',
+    'ورا',
+    'ورای',
+    'وزو',
+    'وسطِ',
+    'وضع',
+    'وضوح',
+    'وقتي',
+    'وقتي كه',
+    'وقتی',
+    'وقتی که',
+    'وقتیكه',
+    'وقتیکه',
+    'ولي',
+    'ولی',
+    'ولیكن',
+    'ونن',
+    'وهمین',
+    'وي',
+    'ويا',
+    'وگر',
+    'وگرد',
+    'وگرنه',
+    'وگو',
+    'وی',
+    'ویا',
+    'وید',
+    'ویند',
+    'ویژه',
+    'ي',
+    'يا',
+    'يابد',
+    'يارب',
+    'يعني',
+    'يقيناً',
+    'يك',
+    'يك جوري',
+    'يك كم',
+    'يك كمي',
+    'يكديگر',
+    'يكريز',
+    'يكسال',
+    'يكي',
+    'يواش يواش',
+    'ً',
+    'ٌ',
+    'ٍ',
+    'َ',
+    'ُ',
+    'ِ',
+    'ّ',
+    'ّه',
+    'ْ',
+    'ٔ',
+    '٪',
+    'ٰ',
+    'پ',
+    'پارسال',
+    'پارسايانه',
+    'پارسایانه',
+    'پاره',
+    'پاره اي',
+    'پاره\u200cای',
+    'پاعینِ',
+    'پايين ترند',
+    'پایین',
+    'پایین ترند',
+    'پدرانه',
+    'پدرپی',
+    'پديده هاست',
+    'پدیده',
+    'پذیر',
+    'پذیرند',
+    'پراز',
+    'پرسان',
+    'پروردگارا',
+    'پريروز',
+    'پریروز',
+    'پس',
+    'پس از',
+    'پس فردا',
+    'پشت',
+    'پشتوانه',
+    'پشتوانه اند',
+    'پشيموني',
+    'پشیمونی',
+    'پنج',
+    'پنجاه',
+    'پنهان',
+    'په',
+    'پهن',
+    'پهن شده',
+    'پي',
+    'پي درپي',
+    'پيداست',
+    'پيرامون',
+    'پيش',
+    'پيوسته',
+    'پی',
+    'پی درپی',
+    'پیامبرانه',
+    'پیدا',
+    'پیداست',
+    'پیدرپی',
+    'پیرامون',
+    'پیش',
+    'پیشاپیش',
+    'پیشتر',
+    'پیششون',
+    'پیشِ',
+    'پیوسته',
+    'پیگیر',
+    'چ',
+    'چارده',
+    'چاله',
+    'چاپلوسانه',
+    'چت',
+    'چته',
+    'چرا',
+    'چرا كه',
+    'چرا که',
+    'چراكه',
+    'چشم',
+    'چشم بسته',
+    'چطور',
+    'چقدر',
+    'چكار',
+    'چنان',
+    'چنانكه',
+    'چنانچه',
+    'چنانکه',
+    'چند',
+    'چند روزه',
+    'چندان',
+    'چندانی',
+    'چندروزه',
+    'چندماهه',
+    'چندمین',
+    'چنده',
+    'چندين',
+    'چندین',
+    'چنين',
+    'چنین',
+    'چه',
+    'چه بسا',
+    'چه طور',
+    'چهار',
+    'چهارهزار',
+    'چهل',
+    'چو',
+    'چون',
+    'چونه',
+    'چي',
+    'چيزهاست',
+    'چيزي',
+    'چيزيست',
+    'چيست',
+    'چيه',
+    'چکار',
+    'چگونه',
+    'چی',
+    'چیز',
+    'چیزهاست',
+    'چیزی',
+    'چیزیست',
+    'چیست',
+    'چیه',
+    'ژ',
+    'ک',
+    'کا',
+    'کار',
+    'کارند',
+    'کاش',
+    'کاشکی',
+    'کامل',
+    'کاملا',
+    'کاملاً',
+    'کتبا',
+    'کجا',
+    'کجاست',
+    'کدام',
+    'کرات',
+    'کرد',
+    'کردم',
+    'کردن',
+    'کردند',
+    'کرده',
+    'کردی',
+    'کردید',
+    'کردیم',
+    'کردین',
+    'کس',
+    'کسانی',
+    'کسی',
+    'کل',
+    'کلا',
+    'کلی',
+    'کلیه',
+    'کم',
+    'کم کم',
+    'کماکان',
+    'کمتر',
+    'کمتره',
+    'کمتری',
+    'کمک',
+    'کمی',
+    'کن',
+    'کنار',
+    'کنارش',
+    'کنارِ',
+    'کنان',
+    'کنایه\u200cای',
+    'کند',
+    'کنم',
+    'کنن',
+    'کنند',
+    'کننده',
+    'کنه',
+    'کنون',
+    'کنونی',
+    'کنی',
+    'کنید',
+    'کنیم',
+    'که',
+    'کو',
+    'کَی',
+    'کی',
+    'گ',
+    'گاه',
+    'گاهي',
+    'گاهی',
+    'گذاران',
+    'گذاري',
+    'گذاری',
+    'گذاشتن',
+    'گذاشته',
+    'گذاشتیم',
+    'گذشته',
+    'گر',
+    'گردد',
+    'گردند',
+    'گردید',
+    'گرفت',
+    'گرفتارند',
+    'گرفتم',
+    'گرفتن',
+    'گرفتند',
+    'گرفته',
+    'گرفتی',
+    'گرفتید',
+    'گرفتیم',
+    'گرمی',
+    'گرنه',
+    'گروهي',
+    'گروهی',
+    'گرچه',
+    'گفت',
+    'گفتم',
+    'گفتن',
+    'گفتند',
+    'گفته',
+    'گفتی',
+    'گفتید',
+    'گفتیم',
+    'گمان',
+    'گه',
+    'گهگاه',
+    'گهگاهی',
+    'گو',
+    'گونه',
+    'گويد',
+    'گويند',
+    'گويي',
+    'گوی',
+    'گویا',
+    'گویان',
+    'گوید',
+    'گویم',
+    'گویند',
+    'گویی',
+    'گویید',
+    'گوییم',
+    'گيرد',
+    'گيري',
+    'گیر',
+    'گیرد',
+    'گیرم',
+    'گیرند',
+    'گیری',
+    'گیرید',
+    'گیریم',
+    'ی',
+    'یا',
+    'یااز',
+    'یاانكه',
+    'یااینكه',
+    'یاب',
+    'یابد',
+    'یابم',
+    'یابند',
+    'یابی',
+    'یابید',
+    'یابیم',
+    'یاد',
+    'یارب',
+    'یافت',
+    'یافتم',
+    'یافتن',
+    'یافته',
+    'یافتی',
+    'یافتید',
+    'یافتیم',
+    'یرد',
+    'یرونِ',
+    'یری',
+    'یست',
+    'یش',
+    'یشتر',
+    'یشتری',
+    'یعنی',
+    'یقینا',
+    'یقیناً',
+    'یك',
+    'یكایك',
+    'یكبار',
+    'یكباره',
+    'یكجا',
+    'یكجانبه',
+    'یكجور',
+    'یكجوری',
+    'یكدم',
+    'یكدیر',
+    'یكدیگر',
+    'یكریز',
+    'یكزمان',
+    'یكسال',
+    'یكسره',
+    'یكسری',
+    'یكطرفه',
+    'یكنواخت',
+    'یكپارچه',
+    'یكی',
+    'یه',
+    'یو',
+    'یواش',
+    'یواش یواش',
+    'یک',
+    'یک جوری',
+    'یک چیزی',
+    'یک کم',
+    'یک کمی',
+    'یکدیگر',
+    'یکریز',
+    'یکسال',
+    'یکهزار',
+    'یکی',
+    '۰',
+    '۱',
+    '۲',
+    '۳',
+    '۴',
+    '۵',
+    '۶',
+    '۷',
+    '۸',
+    '۹',
+    '…',
+    '﷼',
+))
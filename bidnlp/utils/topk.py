@@ -0,0 +1,119 @@
+"""
+Bounded Top-K Counting
+
+Provides a Space-Saving counter that tracks the most frequent items of a
+stream in a fixed amount of memory.
+"""
+
+import heapq
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+class SpaceSavingCounter:
+    """
+    Approximate frequency counter with bounded memory (Space-Saving).
+
+    At most ``capacity`` items are tracked. When a new item arrives and the
+    counter is full, the item with the smallest count is replaced and the new
+    item inherits that count (plus its own). Counts are therefore upper bounds:
+    the true count of an item lies in ``[count - error, count]``. Any item
+    whose true count exceeds ``total / capacity`` is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Initialize the counter.
+
+        Args:
+            capacity: Maximum number of tracked items
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # One (count, item) entry per tracked item; the count may be stale
+        # (lower than the current count) and is refreshed on eviction
+        self._heap: List[Tuple[int, Hashable]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._counts
+
+    def __getitem__(self, item: Hashable) -> int:
+        return self._counts.get(item, 0)
+
+    def _evict(self) -> int:
+        """Remove the item with the smallest count and return its count."""
+        heap, counts = self._heap, self._counts
+        while True:
+            count, item = heap[0]
+            current = counts[item]
+            if current == count:
+                heapq.heappop(heap)
+                del counts[item]
+                del self._errors[item]
+                return count
+            heapq.heapreplace(heap, (current, item))
+
+    def update(self, item: Hashable, count: int = 1) -> None:
+        """
+        Count an occurrence of an item.
+
+        Args:
+            item: Item to count
+            count: Number of occurrences
+        """
+        self.total += count
+        counts = self._counts
+
+        if item in counts:
+            counts[item] += count
+            return
+
+        error = 0
+        if len(counts) >= self.capacity:
+            error = self._evict()
+
+        counts[item] = error + count
+        self._errors[item] = error
+        heapq.heappush(self._heap, (error + count, item))
+
+    def update_many(self, items: Iterable[Hashable]) -> None:
+        """
+        Count one occurrence of each item.
+
+        Args:
+            items: Items to count
+        """
+        for item in items:
+            self.update(item)
+
+    def error(self, item: Hashable) -> int:
+        """
+        Get the maximum overestimation of an item's count.
+
+        Args:
+            item: Tracked item
+
+        Returns:
+            Error bound (0 if the count is exact or the item is not tracked)
+        """
+        return self._errors.get(item, 0)
+
+    def most_common(self, n: int = None) -> List[Tuple[Hashable, int]]:
+        """
+        Get the items with the highest counts.
+
+        Args:
+            n: Number of items to return (all tracked items if None)
+
+        Returns:
+            List of (item, count) tuples sorted by decreasing count
+        """
+        items = sorted(self._counts.items(), key=lambda x: x[1], reverse=True)
+        return items if n is None else items[:n]
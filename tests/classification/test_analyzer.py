@@ -0,0 +1,95 @@
+"""
+Tests for the Persian analyzer pipeline
+"""
+
+from bidnlp.classification import (
+    PersianAnalyzer, BagOfWords, TfidfVectorizer, NgramExtractor
+)
+from bidnlp.stemming import PersianStemmer
+
+
+class TestPersianAnalyzer:
+    """Test cases for PersianAnalyzer."""
+
+    def test_normalizes_and_tokenizes(self):
+        """Test normalization and tokenization in one call."""
+        analyzer = PersianAnalyzer()
+        tokens = analyzer("كتاب، خوب!")
+
+        assert 'کتاب' in tokens
+        assert '،' in tokens
+
+    def test_whitespace_tokenization(self):
+        """Test whitespace split when tokenization is disabled."""
+        analyzer = PersianAnalyzer(normalize=False, tokenize=False)
+        assert analyzer("سلام  دنیا") == ['سلام', 'دنیا']
+
+    def test_remove_stopwords(self):
+        """Test stop word removal."""
+        analyzer = PersianAnalyzer(remove_stopwords=True)
+        tokens = analyzer("من به دانشگاه")
+
+        assert 'دانشگاه' in tokens
+        assert 'به' not in tokens
+
+    def test_custom_stopwords(self):
+        """Test a custom stop word set."""
+        analyzer = PersianAnalyzer(remove_stopwords=True, stopwords={'دانشگاه'})
+        assert analyzer("من به دانشگاه") == ['من', 'به']
+
+    def test_stemming(self):
+        """Test stemming of tokens."""
+        analyzer = PersianAnalyzer(normalize=False, stem=True)
+        stemmer = PersianStemmer()
+
+        assert analyzer("کتابها") == [stemmer.stem('کتابها')]
+
+    def test_cache(self):
+        """Test that token analysis is cached per distinct token."""
+        analyzer = PersianAnalyzer(normalize=False, tokenize=False, stem=True, cache_size=1)
+        analyzer("کتابها کتابها دفترها")
+
+        assert list(analyzer._cache) == ['کتابها']
+
+        analyzer.clear_cache()
+        assert not analyzer._cache
+
+
+class TestExtractorAnalyzer:
+    """Test cases for feature extractors with an analyzer."""
+
+    def test_bag_of_words_with_analyzer(self):
+        """Test that BagOfWords uses the analyzer tokens."""
+        docs = ["كتاب خوب", "کتاب بد"]
+
+        bow = BagOfWords(analyzer=PersianAnalyzer())
+        bow.fit(docs)
+
+        # Arabic kaf is normalized, so both spellings share one feature
+        assert bow.document_frequency['کتاب'] == 2
+
+    def test_tfidf_with_stemming(self):
+        """Test TF-IDF over stemmed tokens."""
+        docs = ["کتابها خوب است", "کتاب بد است"]
+        analyzer = PersianAnalyzer(normalize=False, stem=True, remove_stopwords=True)
+
+        tfidf = TfidfVectorizer(analyzer=analyzer)
+        tfidf.fit(docs)
+
+        stem = PersianStemmer().stem('کتاب')
+        assert stem in tfidf.vocabulary
+        assert 'است' not in tfidf.vocabulary
+
+    def test_ngrams_with_analyzer(self):
+        """Test n-grams over analyzer tokens."""
+        ngram = NgramExtractor(n=2, analyzer=lambda doc: doc.split('|'))
+        ngram.fit(["من|به|دانشگاه"])
+
+        assert 'من به' in ngram.get_feature_names()
+
+    def test_parallel_transform_with_analyzer(self):
+        """Test that the analyzer reaches worker processes."""
+        docs = ["كتاب خوب", "کتاب بد"] * 3
+        bow = BagOfWords(analyzer=PersianAnalyzer()).fit(docs)
+
+        assert bow.transform(docs, n_jobs=2, chunksize=2) == bow.transform(docs)
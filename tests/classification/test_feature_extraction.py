@@ -2,8 +2,16 @@
 Tests for feature extraction
 """
 
+import math
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
-from bidnlp.classification import BagOfWords, TfidfVectorizer, NgramExtractor
+from bidnlp.classification import (
+    BagOfWords, TfidfVectorizer, NgramExtractor, HashingVectorizer
+)
 
 
 class TestBagOfWords:
@@ -73,6 +81,25 @@ class TestBagOfWords:
         salam_idx = vocab['سلام']
         assert vectors[0][salam_idx] == 2
 
+    def test_max_features_keeps_most_frequent(self):
+        """Test that max features keeps the most frequent words in order."""
+        docs = ["الف ب ب ج ج ج", "د ج ب"]
+
+        bow = BagOfWords(max_features=2)
+        bow.fit(docs)
+
+        assert bow.get_feature_names() == ['ج', 'ب']
+
+    def test_fit_from_generator(self):
+        """Test fitting from a single-pass generator."""
+        docs = ["سلام دنیا", "سلام ایران"]
+
+        bow = BagOfWords()
+        bow.fit(doc for doc in docs)
+
+        assert bow.document_frequency['سلام'] == 2
+        assert bow.document_frequency['دنیا'] == 1
+
     def test_unfitted_transform(self):
         """Test transform before fit raises error."""
         bow = BagOfWords()
@@ -112,6 +139,94 @@ class TestTfidfVectorizer:
         # دنیا and ایران appear in 1 doc each, should have higher IDF
         assert tfidf.idf['سلام'] < tfidf.idf['دنیا']
 
+    def test_fit_from_generator(self):
+        """Test fitting from a single-pass generator."""
+        docs = ["سلام دنیا", "سلام ایران", "دنیا"]
+
+        tfidf = TfidfVectorizer()
+        tfidf.fit(doc for doc in docs)
+
+        assert tfidf.num_documents == 3
+        assert abs(tfidf.idf['سلام'] - (math.log(3 / 2) + 1)) < 1e-12
+        assert abs(tfidf.idf['ایران'] - (math.log(3) + 1)) < 1e-12
+
+    def test_partial_fit_matches_fit(self):
+        """Test that partial_fit over batches equals a single fit."""
+        docs = ["سلام دنیا", "سلام ایران", "دنیا زیباست", "ایران زیباست"]
+
+        full = TfidfVectorizer().fit(docs)
+
+        streamed = TfidfVectorizer()
+        streamed.partial_fit(iter(docs[:2]))
+        streamed.partial_fit(doc for doc in docs[2:])
+
+        assert streamed.num_documents == 4
+        assert streamed.transform(docs) == full.transform(docs)
+        assert streamed.idf == full.idf
+
+    def test_partial_fit_finalizes_on_demand(self):
+        """Test that new words are picked up after further partial_fit calls."""
+        tfidf = TfidfVectorizer()
+        tfidf.partial_fit(["سلام دنیا"])
+        tfidf.transform(["سلام"])
+        assert 'ایران' not in tfidf.vocabulary
+
+        tfidf.partial_fit(["سلام ایران"])
+        tfidf.transform(["سلام"])
+        assert 'ایران' in tfidf.vocabulary
+        assert tfidf.idf['سلام'] < tfidf.idf['ایران']
+
+    def test_fit_drops_counts(self):
+        """Test that fit keeps only the fitted state."""
+        docs = [f"سلام کلمه{i} دنیا" for i in range(2000)]
+
+        tfidf = TfidfVectorizer(max_features=2).fit(docs)
+        assert tfidf._term_counts is None and tfidf._doc_freq is None
+        assert len(pickle.dumps(tfidf)) < 1000
+
+        streamed = TfidfVectorizer(max_features=2)
+        streamed.partial_fit(docs).finalize()
+        assert len(streamed._term_counts) == 2002
+        streamed.finalize(keep_counts=False)
+        assert streamed._term_counts is None
+        assert streamed.idf == tfidf.idf
+
+    def test_partial_fit_after_fit(self):
+        """Test that partial_fit refuses to update a vectorizer fitted without counts."""
+        tfidf = TfidfVectorizer().fit(["سلام دنیا", "سلام ایران"])
+        vocabulary = dict(tfidf.vocabulary)
+
+        with pytest.raises(ValueError):
+            tfidf.partial_fit(["دنیا زیباست"])
+        assert tfidf.vocabulary == vocabulary
+
+        with pytest.raises(ValueError):
+            tfidf.fitted_copy().partial_fit(["دنیا زیباست"])
+
+        tfidf.fit(["دنیا زیباست"])
+        assert set(tfidf.vocabulary) == {"دنیا", "زیباست"}
+
+    def test_transform_iter_dict(self):
+        """Test lazy per-document transform."""
+        docs = ["سلام دنیا", "سلام ایران", "دنیا زیباست"]
+
+        tfidf = TfidfVectorizer().fit(docs)
+        vectors = tfidf.transform_iter(doc for doc in docs)
+
+        assert not isinstance(vectors, list)
+        assert list(vectors) == tfidf.transform(docs)
+
+    def test_transform_iter_csr_chunks(self):
+        """Test lazy chunked CSR transform."""
+        docs = ["سلام دنیا", "سلام ایران", "دنیا زیباست", "سلام", "ایران"]
+
+        tfidf = TfidfVectorizer().fit(docs)
+        chunks = list(tfidf.transform_iter(iter(docs), output='csr', chunksize=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        merged = [vector for chunk in chunks for vector in chunk.to_dicts()]
+        assert merged == tfidf.transform(docs)
+
     def test_normalization(self):
         """Test L2 normalization."""
         docs = ["سلام دنیا"]
@@ -212,6 +327,71 @@ class TestNgramExtractor:
         vocab = ngram.get_feature_names()
         assert len(vocab) == 0
 
+    def test_ngram_range(self):
+        """Test extracting several orders in one pass."""
+        docs = ["من به دانشگاه"]
+
+        ngram = NgramExtractor(ngram_range=(1, 3))
+        ngram.fit(docs)
+
+        assert sorted(ngram.get_feature_names()) == sorted([
+            'من', 'به', 'دانشگاه',
+            'من به', 'به دانشگاه',
+            'من به دانشگاه',
+        ])
+
+    def test_ngram_range_matches_single_orders(self):
+        """Test that a range equals the union of single-order extractors."""
+        docs = ["من به دانشگاه می روم", "من به خانه می روم"]
+
+        fused = NgramExtractor(ngram_range=(2, 3)).fit(docs)
+        separate = set(NgramExtractor(n=2).fit(docs).get_feature_names())
+        separate |= set(NgramExtractor(n=3).fit(docs).get_feature_names())
+
+        assert set(fused.get_feature_names()) == separate
+
+    def test_tuple_keys(self):
+        """Test tuple n-gram keys."""
+        docs = ["من به دانشگاه"]
+
+        ngram = NgramExtractor(n=2, ngram_type='tuple')
+        vectors = ngram.fit_transform(docs)
+
+        assert ('من', 'به') in ngram.vocabulary
+        assert vectors[0][ngram.vocabulary[('به', 'دانشگاه')]] == 1
+
+    def test_id_keys(self):
+        """Test integer-id n-gram keys."""
+        docs = ["من به دانشگاه", "من به خانه"]
+
+        ngram = NgramExtractor(n=2, ngram_type='id')
+        ngram.fit(docs)
+
+        man, be = ngram.token_vocabulary['من'], ngram.token_vocabulary['به']
+        assert (man, be) in ngram.vocabulary
+        assert ('من', 'به') in ngram.get_feature_names()
+
+        # Unseen words do not create new ids during transform
+        vector = ngram.transform(["من به مدرسه"])[0]
+        assert vector == {ngram.vocabulary[(man, be)]: 1}
+        assert 'مدرسه' not in ngram.token_vocabulary
+
+    def test_min_df(self):
+        """Test minimum document frequency for n-grams."""
+        docs = ["من به دانشگاه", "من به خانه"]
+
+        ngram = NgramExtractor(n=2, min_df=2)
+        ngram.fit(docs)
+
+        assert ngram.get_feature_names() == ['من به']
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            NgramExtractor(ngram_range=(3, 2))
+        with pytest.raises(ValueError):
+            NgramExtractor(ngram_type='list')
+
     def test_unfitted_transform(self):
         """Test transform before fit raises error."""
         ngram = NgramExtractor(n=2)
@@ -230,3 +410,161 @@ class TestNgramExtractor:
 
         assert len(vectors) == 1
         assert ngram._is_fitted
+
+
+class TestHashingVectorizer:
+    """Test cases for HashingVectorizer."""
+
+    def test_no_fit_required(self):
+        """Test transform without fit."""
+        hv = HashingVectorizer(n_features=64)
+        vectors = hv.transform(["سلام دنیا", "سلام"])
+
+        assert len(vectors) == 2
+        assert all(0 <= idx < 64 for vector in vectors for idx in vector)
+
+    def test_same_word_same_bucket(self):
+        """Test that a word always maps to the same bucket."""
+        hv = HashingVectorizer(n_features=1024, norm=None, alternate_sign=False)
+        first = hv.transform(["سلام"])[0]
+        second = hv.transform(["سلام سلام"])[0]
+
+        assert list(first) == list(second)
+        assert list(second.values()) == [2.0]
+
+    def test_l2_normalization(self):
+        """Test L2 normalization."""
+        hv = HashingVectorizer(n_features=2 ** 18)
+        vector = hv.transform(["سلام دنیا زیبا"])[0]
+
+        assert abs(sum(v * v for v in vector.values()) - 1.0) < 1e-9
+
+    def test_ngram_range(self):
+        """Test hashing of unigrams and bigrams together."""
+        hv = HashingVectorizer(n_features=2 ** 20, ngram_range=(1, 2), norm=None,
+                               alternate_sign=False)
+        vector = hv.transform(["من به دانشگاه"])[0]
+
+        # 3 unigrams + 2 bigrams (no collisions expected in 2**20 buckets)
+        assert sum(vector.values()) == 5
+
+    def test_csr_output(self):
+        """Test CSR output shape."""
+        hv = HashingVectorizer(n_features=32)
+        matrix = hv.transform(["سلام دنیا", "ایران"], output='csr')
+
+        assert matrix.shape == (2, 32)
+        assert matrix.to_dicts() == hv.transform(["سلام دنیا", "ایران"])
+
+    def test_stable_across_processes(self):
+        """Test that hashing does not depend on the interpreter's hash seed."""
+        code = (
+            "from bidnlp.classification import HashingVectorizer;"
+            "print(sorted(HashingVectorizer(n_features=1000).transform(['سلام دنیا'])[0]))"
+        )
+        outputs = {
+            subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                           env=dict(os.environ, PYTHONHASHSEED=seed,
+                                    PYTHONPATH=os.pathsep.join(sys.path)),
+                           check=True).stdout
+            for seed in ('1', '2')
+        }
+        assert len(outputs) == 1
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            HashingVectorizer(n_features=0)
+        with pytest.raises(ValueError):
+            HashingVectorizer(ngram_range=(2, 1))
+        with pytest.raises(ValueError):
+            HashingVectorizer(norm='l1')
+
+
+class TestSparseOutput:
+    """Test cases for CSR output of the feature extractors."""
+
+    docs = [
+        "سلام دنیا سلام",
+        "سلام ایران",
+        "دنیا زیباست",
+        "",
+    ]
+
+    @pytest.mark.parametrize("extractor", [
+        BagOfWords(),
+        TfidfVectorizer(),
+        NgramExtractor(n=2),
+    ])
+    def test_csr_matches_dict_output(self, extractor):
+        """Test that CSR output converts back to the dict output."""
+        extractor.fit(self.docs)
+        dicts = extractor.transform(self.docs)
+        matrix = extractor.transform(self.docs, output='csr')
+
+        assert matrix.shape == (len(self.docs), len(extractor.vocabulary))
+        assert matrix.to_dicts() == dicts
+
+    def test_csr_row_indices_sorted(self):
+        """Test that CSR rows store sorted feature indices."""
+        bow = BagOfWords()
+        matrix = bow.fit_transform(self.docs, output='csr')
+
+        for i in range(len(matrix)):
+            indices, _ = matrix.row(i)
+            assert list(indices) == sorted(indices)
+
+    def test_csr_counts_dtype(self):
+        """Test that count extractors keep integer values."""
+        bow = BagOfWords()
+        matrix = bow.fit_transform(self.docs, output='csr')
+
+        salam_idx = bow.vocabulary['سلام']
+        assert matrix.getrow(0)[salam_idx] == 2
+        assert matrix.dtype == 'q'
+
+    def test_unknown_output(self):
+        """Test that an unknown output format raises error."""
+        bow = BagOfWords()
+        bow.fit(self.docs)
+
+        with pytest.raises(ValueError):
+            bow.transform(self.docs, output='dense')
+
+
+class TestParallelTransform:
+    """Test cases for multi-process transform."""
+
+    docs = [
+        "سلام دنیا سلام",
+        "سلام ایران",
+        "دنیا زیباست",
+        "من به دانشگاه می روم",
+        "",
+    ] * 5
+
+    @pytest.mark.parametrize("extractor", [
+        BagOfWords(),
+        TfidfVectorizer(),
+        NgramExtractor(n=2),
+    ])
+    def test_parallel_matches_serial(self, extractor):
+        """Test that n_jobs > 1 gives the same vectors as a serial run."""
+        extractor.fit(self.docs)
+
+        serial = extractor.transform(self.docs, output='csr')
+        parallel = extractor.transform(self.docs, output='csr', n_jobs=2, chunksize=3)
+
+        assert parallel.shape == serial.shape
+        assert list(parallel.indptr) == list(serial.indptr)
+        assert list(parallel.indices) == list(serial.indices)
+        assert list(parallel.data) == list(serial.data)
+        assert (extractor.transform(self.docs, n_jobs=2, chunksize=4)
+                == extractor.transform(self.docs))
+
+    def test_parallel_empty_input(self):
+        """Test parallel transform of no documents."""
+        bow = BagOfWords().fit(self.docs)
+        matrix = bow.transform([], output='csr', n_jobs=2)
+
+        assert matrix.shape == (0, len(bow.vocabulary))
@@ -167,3 +167,188 @@ class TestKeywordClassifier:
         """Test classification before training/adding categories."""
         with pytest.raises(ValueError):
             self.classifier.predict("test")
+
+    def test_multi_word_keyword(self):
+        """Test that multi-word keywords match as phrases."""
+        self.classifier.add_category('فناوری', {'هوش مصنوعی'})
+        self.classifier.add_category('ورزش', {'فوتبال'})
+
+        result = self.classifier.classify("پیشرفت هوش مصنوعی در ایران")
+        assert result['category'] == 'فناوری'
+        assert result['matched_keywords']['فناوری'] == ['هوش مصنوعی']
+
+        result = self.classifier.classify("هوش انسان مصنوعی نیست")
+        assert result['category'] == 'unknown'
+
+    def test_zwnj_keyword_variants(self):
+        """Test that ZWNJ-joined and space-separated spellings both match."""
+        self.classifier.add_category('فناوری', {'نرم‌افزار'})
+
+        assert self.classifier.predict("نرم‌افزار جدید") == 'فناوری'
+        assert self.classifier.predict("نرم افزار جدید") == 'فناوری'
+
+    def test_keyword_does_not_match_inside_word(self):
+        """Test that keywords only match whole words."""
+        self.classifier.add_category('فرهنگ', {'کتاب'})
+
+        assert self.classifier.predict("کتاب‌ها") == 'unknown'
+        assert self.classifier.predict("کتابخانه") == 'unknown'
+
+    def test_add_keyword_after_classify(self):
+        """Test that keywords added after classification are matched."""
+        self.classifier.add_category('ورزش', {'فوتبال'})
+        assert self.classifier.predict("والیبال") == 'unknown'
+
+        self.classifier.add_keyword_to_category('ورزش', 'والیبال')
+        assert self.classifier.predict("والیبال") == 'ورزش'
+
+        self.classifier.add_keyword_to_category('سیاست', 'دولت')
+        assert self.classifier.predict("دولت") == 'سیاست'
+
+    def test_category_changes_after_classify(self):
+        """Test that replaced and removed categories are not matched."""
+        self.classifier.add_category('ورزش', {'فوتبال'})
+        self.classifier.add_category('سیاست', {'دولت'})
+        assert self.classifier.predict("فوتبال") == 'ورزش'
+
+        self.classifier.add_category('ورزش', {'والیبال'})
+        assert self.classifier.predict("فوتبال") == 'unknown'
+
+        self.classifier.remove_category('سیاست')
+        result = self.classifier.classify("دولت")
+        assert result['category'] == 'unknown'
+        assert 'سیاست' not in result['scores']
+
+        self.classifier.categories = {'فرهنگ': {'کتاب'}}
+        assert self.classifier.predict("کتاب") == 'فرهنگ'
+
+    def test_categories_edited_in_place(self):
+        """Test that in-place edits to the categories are matched."""
+        self.classifier.add_category('ورزش', {'فوتبال'})
+        assert self.classifier.predict("بازی تنیس") == 'unknown'
+
+        self.classifier.categories['ورزش'].add('تنیس')
+        assert self.classifier.predict("بازی تنیس") == 'ورزش'
+
+        self.classifier.categories['غذا'] = {'پیتزا'}
+        assert self.classifier.predict("پیتزا") == 'غذا'
+
+        self.classifier.get_category_keywords('غذا').add('کباب')
+        assert self.classifier.predict_batch(["کباب", "تنیس"]) == ['غذا', 'ورزش']
+
+        # Incremental additions still work after an in-place edit
+        self.classifier.categories['ورزش'].discard('فوتبال')
+        self.classifier.add_keyword_to_category('ورزش', 'والیبال')
+        assert self.classifier.predict("فوتبال") == 'unknown'
+        assert self.classifier.predict("والیبال") == 'ورزش'
+
+    def test_repeated_keyword_counted_once(self):
+        """Test that scores count distinct keywords."""
+        self.classifier.add_category('ورزش', {'فوتبال', 'تیم'})
+
+        result = self.classifier.classify("فوتبال فوتبال فوتبال تیم")
+        assert result['scores']['ورزش'] == 2
+
+    def test_batch_methods_match_single(self):
+        """Test that batch methods agree with the single-text methods."""
+        self.classifier.add_category('ورزش', {'فوتبال', 'تیم', 'بازیکن'})
+        self.classifier.add_category('تکنولوژی', {'کامپیوتر', 'نرم‌افزار'})
+        self.classifier.add_category('سیاست', {'دولت'})
+        texts = ["بازیکن تیم فوتبال", "کامپیوتر و نرم‌افزار", "کتاب", "دولت و تیم"]
+
+        assert self.classifier.classify_batch(texts) == [self.classifier.classify(t) for t in texts]
+        assert self.classifier.predict_batch(texts) == [self.classifier.predict(t) for t in texts]
+        assert self.classifier.predict_proba_batch(texts) == \
+            [self.classifier.predict_proba(t) for t in texts]
+        assert self.classifier.predict_top_k_batch(texts, k=2) == \
+            [self.classifier.predict_top_k(t, k=2) for t in texts]
+
+    def test_predict_all_batch_scores_once(self):
+        """Test the combined batch prediction and that it scans each text once."""
+        self.classifier.add_category('ورزش', {'فوتبال', 'تیم'})
+        self.classifier.add_category('سیاست', {'دولت'})
+        texts = ["تیم فوتبال", "دولت و تیم", "کتاب"]
+        self.classifier.predict("فوتبال")
+
+        calls = []
+        preprocess = self.classifier.preprocess
+        self.classifier.preprocess = lambda text: calls.append(text) or preprocess(text)
+        results = self.classifier.predict_all_batch(texts, k=1)
+
+        assert len(calls) == len(texts)
+        assert [label for label, _, _ in results] == self.classifier.predict_batch(texts)
+        assert [proba for _, proba, _ in results] == self.classifier.predict_proba_batch(texts)
+        assert [top for _, _, top in results] == self.classifier.predict_top_k_batch(texts, k=1)
+        assert results[2][0] == 'unknown'
+
+    def test_keyword_shared_by_categories(self):
+        """Test that a keyword in several categories scores each of them."""
+        self.classifier.add_category('اقتصاد', {'بازار', 'بورس'})
+        self.classifier.add_category('تجارت', {'بازار'})
+
+        result = self.classifier.classify("بازار بورس")
+        assert result['scores'] == {'اقتصاد': 2, 'تجارت': 1}
+        assert result['matched_keywords']['تجارت'] == ['بازار']
+        assert result['category'] == 'اقتصاد'
+
+    def test_predict_proba_no_matches(self):
+        """Test uniform probabilities when nothing matches."""
+        self.classifier.add_category('ورزش', {'فوتبال'})
+        self.classifier.add_category('سیاست', {'دولت'})
+
+        assert self.classifier.predict_proba_batch(["کتاب"]) == [{'ورزش': 0.5, 'سیاست': 0.5}]
+
+    def test_train_keeps_top_keywords(self):
+        """Test that train keeps the num_keywords most frequent words."""
+        classifier = KeywordClassifier(num_keywords=2)
+        classifier.train(["فوتبال فوتبال بازیکن داور", "فوتبال بازیکن"], ['ورزش', 'ورزش'])
+
+        assert classifier.get_category_keywords('ورزش') == {'فوتبال', 'بازیکن'}
+
+    def test_partial_fit_stream(self):
+        """Test learning keywords from a stream of (text, label) pairs."""
+        stream = iter([
+            ("فوتبال بازی جذابی است", 'ورزش'),
+            ("تیم ملی فوتبال برد", 'ورزش'),
+            ("کامپیوتر ابزار مفیدی است", 'تکنولوژی'),
+        ])
+        self.classifier.partial_fit(stream)
+
+        assert self.classifier.is_trained()
+        assert 'فوتبال' in self.classifier.get_category_keywords('ورزش')
+        assert self.classifier.predict("فوتبال") == 'ورزش'
+        assert self.classifier.predict("کامپیوتر") == 'تکنولوژی'
+
+    def test_partial_fit_matches_train(self):
+        """Test that partial_fit in chunks finds the same keywords as train."""
+        texts = ["فوتبال بازی جذابی است", "تیم ملی فوتبال برد",
+                 "کامپیوتر ابزار مفیدی است", "نرم‌افزار جدید کامپیوتر"]
+        labels = ['ورزش', 'ورزش', 'تکنولوژی', 'تکنولوژی']
+
+        trained = KeywordClassifier()
+        trained.train(texts, labels)
+
+        streamed = KeywordClassifier()
+        pairs = list(zip(texts, labels))
+        streamed.partial_fit(pairs[:2])
+        streamed.partial_fit(pairs[2:])
+
+        assert streamed.categories == trained.categories
+
+    def test_partial_fit_after_train(self):
+        """Test that partial_fit continues from the trained counts."""
+        classifier = KeywordClassifier(num_keywords=1)
+        classifier.train(["فوتبال فوتبال والیبال"], ['ورزش'])
+        assert classifier.get_category_keywords('ورزش') == {'فوتبال'}
+
+        classifier.partial_fit([("والیبال والیبال", 'ورزش')])
+        assert classifier.get_category_keywords('ورزش') == {'والیبال'}
+
+    def test_partial_fit_bounded_memory(self):
+        """Test that the per-category counter never exceeds its capacity."""
+        classifier = KeywordClassifier(counter_capacity=5, num_keywords=3)
+        classifier.partial_fit((f"کلمه{i} فوتبال", 'ورزش') for i in range(100))
+
+        assert len(classifier._word_counters['ورزش']) == 5
+        assert 'فوتبال' in classifier.get_category_keywords('ورزش')
+        assert classifier.predict("فوتبال") == 'ورزش'
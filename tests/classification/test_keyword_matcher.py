@@ -0,0 +1,79 @@
+"""
+Tests for the Aho-Corasick keyword matcher
+"""
+
+from bidnlp.classification import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher."""
+
+    def test_single_words(self):
+        """Test matching single-word keywords."""
+        matcher = KeywordMatcher()
+        matcher.add('فوتبال', 'sport')
+        matcher.add('دولت', 'politics')
+
+        assert matcher.find_all('دولت و فوتبال') == [(0, 1, 'politics'), (2, 3, 'sport')]
+
+    def test_overlapping_phrases(self):
+        """Test that overlapping and nested phrases are all reported."""
+        matcher = KeywordMatcher()
+        matcher.add('a b c', 'abc')
+        matcher.add('b c', 'bc')
+        matcher.add('c', 'c')
+        matcher.add('c d', 'cd')
+
+        assert matcher.find_all('x a b c d') == [
+            (1, 4, 'abc'), (2, 4, 'bc'), (3, 4, 'c'), (3, 5, 'cd')]
+
+    def test_failure_links(self):
+        """Test matching after a partial phrase match fails."""
+        matcher = KeywordMatcher()
+        matcher.add('a b a c', 'long')
+        matcher.add('a b', 'short')
+
+        assert matcher.find_all('a b a b a c') == [
+            (0, 2, 'short'), (2, 4, 'short'), (2, 6, 'long')]
+
+    def test_zwnj_equivalence(self):
+        """Test that ZWNJ and spaces are interchangeable."""
+        matcher = KeywordMatcher()
+        matcher.add('نرم افزار', 'software')
+
+        assert matcher.find_all('نرم‌افزار') == [(0, 1, 'software')]
+        assert matcher.find_all('این نرم افزار') == [(1, 3, 'software')]
+
+    def test_whole_word_alignment(self):
+        """Test that matches must start and end at word boundaries."""
+        matcher = KeywordMatcher()
+        matcher.add('کتاب', 'book')
+        matcher.add('ها', 'suffix')
+
+        assert matcher.find_all('کتاب‌ها') == []
+        assert matcher.find_all('کتاب ها') == [(0, 1, 'book'), (1, 2, 'suffix')]
+
+    def test_multiple_values(self):
+        """Test a keyword registered with several values."""
+        matcher = KeywordMatcher()
+        matcher.add('بازار', 'economy')
+        matcher.add('بازار', 'business')
+
+        assert [value for _, _, value in matcher.find_all('بازار')] == ['economy', 'business']
+        assert len(matcher) == 2
+
+    def test_add_after_search(self):
+        """Test adding keywords after the automaton was built."""
+        matcher = KeywordMatcher()
+        matcher.add('a b', 'ab')
+        assert matcher.find_all('a b c') == [(0, 2, 'ab')]
+
+        matcher.add('b c', 'bc')
+        assert matcher.find_all('a b c') == [(0, 2, 'ab'), (1, 3, 'bc')]
+
+    def test_empty_keyword(self):
+        """Test that empty keywords are ignored."""
+        matcher = KeywordMatcher()
+        assert matcher.add('  ', 'empty') is False
+        assert len(matcher) == 0
+        assert matcher.find_all('anything') == []
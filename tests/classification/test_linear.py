@@ -0,0 +1,194 @@
+"""
+Tests for the SGD-trained linear classifier
+"""
+
+import math
+
+import pytest
+from bidnlp.classification import (
+    CSRMatrix, HashingVectorizer, LinearClassifier, TfidfVectorizer,
+)
+
+
+TEXTS = [
+    "تیم فوتبال بازی را برد",
+    "بازیکن فوتبال گل زد",
+    "تیم ملی والیبال قهرمان شد",
+    "دولت بودجه را تصویب کرد",
+    "مجلس و دولت درباره انتخابات بحث کردند",
+    "انتخابات مجلس برگزار شد",
+]
+LABELS = ['ورزش', 'ورزش', 'ورزش', 'سیاست', 'سیاست', 'سیاست']
+
+
+class TestLinearClassifier:
+    """Test cases for LinearClassifier."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.classifier = LinearClassifier(epochs=20, batch_size=2)
+        self.classifier.train(TEXTS, LABELS)
+
+    def test_predict(self):
+        """Test predicting classes."""
+        assert self.classifier.is_trained()
+        assert self.classifier.classes == ['ورزش', 'سیاست']
+        assert self.classifier.predict("فوتبال و والیبال") == 'ورزش'
+        assert self.classifier.predict("دولت و مجلس") == 'سیاست'
+
+    def test_predict_batch(self):
+        """Test that batch prediction agrees with single prediction."""
+        texts = ["فوتبال و والیبال", "دولت و مجلس", "گل", "چیزی نامعلوم"]
+        assert self.classifier.predict_batch(texts) == \
+            [self.classifier.predict(text) for text in texts]
+
+    def test_predict_proba(self):
+        """Test class probabilities."""
+        proba = self.classifier.predict_proba("فوتبال")
+
+        assert set(proba) == {'ورزش', 'سیاست'}
+        assert sum(proba.values()) == pytest.approx(1.0)
+        assert proba['ورزش'] > proba['سیاست']
+
+    def test_hinge_loss(self):
+        """Test the one-vs-rest SVM loss."""
+        classifier = LinearClassifier(loss='hinge', epochs=20, batch_size=2)
+        classifier.train(TEXTS, LABELS)
+
+        assert classifier.predict_batch(TEXTS) == LABELS
+        scores = classifier.decision_function(classifier._vectorize(["فوتبال"]))[0]
+        assert scores[0] > 0 > scores[1]
+
+    def test_log_loss_gradient_step(self):
+        """Test one SGD step against a direct softmax gradient computation."""
+        classifier = LinearClassifier(alpha=0.0, eta0=0.5, batch_size=1)
+        classifier.partial_fit_vectors([{0: 1.0}, {1: 2.0}], ['a', 'b'])
+
+        # First step on x={0: 1}, y=a with zero weights: p = [0.5, 0.5]
+        w_a0, w_b0 = 0.5 * 0.5, -0.5 * 0.5
+        b_a, b_b = 0.25, -0.25
+        # Second step on x={1: 2}, y=b
+        z = [b_a, b_b]
+        top = max(z)
+        p = [math.exp(v - top) for v in z]
+        p = [v / sum(p) for v in p]
+        w_a1 = -0.5 * p[0] * 2.0
+        w_b1 = 0.5 * (1 - p[1]) * 2.0
+        b_a -= 0.5 * p[0]
+        b_b += 0.5 * (1 - p[1])
+
+        scores = classifier.decision_function([{0: 1.0, 1: 1.0}])[0]
+        assert scores == pytest.approx([w_a0 + w_a1 + b_a, w_b0 + w_b1 + b_b])
+
+    def test_regularization_shrinks_weights(self):
+        """Test that L2 regularization keeps the weights smaller."""
+        vectors, labels = [{0: 1.0}, {1: 1.0}] * 20, ['a', 'b'] * 20
+        plain = LinearClassifier(alpha=0.0)
+        plain.partial_fit_vectors(vectors, labels)
+        regularized = LinearClassifier(alpha=0.5)
+        regularized.partial_fit_vectors(vectors, labels)
+
+        plain_scores = plain.decision_function([{0: 1.0}])[0]
+        regularized_scores = regularized.decision_function([{0: 1.0}])[0]
+        assert abs(regularized_scores[0]) < abs(plain_scores[0])
+
+    def test_partial_fit_new_class(self):
+        """Test that new labels can appear in later batches."""
+        vectorizer = HashingVectorizer(n_features=2 ** 12)
+        classifier = LinearClassifier(vectorizer=vectorizer, batch_size=1)
+        for _ in range(10):
+            classifier.partial_fit(TEXTS, LABELS)
+            classifier.partial_fit(["قیمت دلار و طلا بالا رفت", "بورس و دلار"], ['اقتصاد', 'اقتصاد'])
+
+        assert classifier.classes == ['ورزش', 'سیاست', 'اقتصاد']
+        assert classifier.predict("دلار") == 'اقتصاد'
+        assert classifier.predict("فوتبال") == 'ورزش'
+
+    def test_fit_stream(self, tmp_path):
+        """Test multi-epoch training over a stream re-read from disk."""
+        path = tmp_path / 'train.tsv'
+        path.write_text(''.join(f"{label}\t{text}\n" for text, label in zip(TEXTS, LABELS)),
+                        encoding='utf-8')
+
+        def read():
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    label, text = line.rstrip('\n').split('\t')
+                    yield text, label
+
+        classifier = LinearClassifier(vectorizer=HashingVectorizer(n_features=2 ** 12), batch_size=2)
+        classifier.fit_stream(read, epochs=20, chunksize=4)
+
+        assert classifier.predict_batch(TEXTS) == LABELS
+
+    def test_fit_stream_zero_epochs(self):
+        """Test that epochs=0 makes no pass over the stream."""
+        calls = []
+
+        def read():
+            calls.append(1)
+            return zip(TEXTS, LABELS)
+
+        classifier = LinearClassifier(vectorizer=HashingVectorizer(n_features=2 ** 12))
+        classifier.fit_stream(read, epochs=0)
+        assert calls == []
+        assert not classifier.is_trained()
+
+        classifier.fit_stream(read)
+        assert len(calls) == classifier.epochs
+
+    def test_requires_fitted_vectorizer(self):
+        """Test that streaming training needs a fixed feature space."""
+        with pytest.raises(ValueError):
+            LinearClassifier().partial_fit(TEXTS, LABELS)
+        with pytest.raises(ValueError):
+            LinearClassifier().fit_stream(lambda: zip(TEXTS, LABELS))
+
+    def test_csr_input(self):
+        """Test training and scoring on CSRMatrix input."""
+        matrix = CSRMatrix.from_dicts([{0: 1.0}, {1: 1.0}], n_features=2)
+        classifier = LinearClassifier(batch_size=1)
+        for _ in range(5):
+            classifier.partial_fit_vectors(matrix, ['x', 'y'])
+
+        scores = classifier.decision_function(matrix)
+        assert scores[0][0] > scores[0][1]
+        assert scores[1][1] > scores[1][0]
+
+    def test_invalid_params(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            LinearClassifier(loss='squared')
+        with pytest.raises(ValueError):
+            LinearClassifier(alpha=-1)
+        with pytest.raises(ValueError):
+            LinearClassifier(batch_size=0)
+
+    def test_untrained(self):
+        """Test prediction before training."""
+        with pytest.raises(ValueError):
+            LinearClassifier().decision_function([{0: 1.0}])
+
+    def test_unequal_lengths(self):
+        """Test training with unequal text/label lengths."""
+        with pytest.raises(ValueError):
+            LinearClassifier().train(TEXTS, LABELS[:2])
+
+    def test_evaluate(self):
+        """Test evaluation through the base class."""
+        result = self.classifier.evaluate(TEXTS, LABELS)
+        assert result['accuracy'] == 1.0
+
+    def test_save_and_load(self, tmp_path):
+        """Test persisting the model."""
+        path = str(tmp_path / 'linear.pkl')
+        texts = ["فوتبال و والیبال", "دولت و مجلس"]
+        expected = self.classifier.predict_proba_batch(texts)
+
+        self.classifier.save(path)
+        loaded = LinearClassifier.load(path)
+
+        assert loaded.classes == self.classifier.classes
+        assert isinstance(loaded.vectorizer, TfidfVectorizer)
+        for a, b in zip(loaded.predict_proba_batch(texts), expected):
+            assert a == pytest.approx(b)
@@ -0,0 +1,166 @@
+"""
+Tests for MinHash signatures and the LSH index
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from bidnlp.classification import MinHash, LSHIndex
+from bidnlp.utils import PersianTextMetrics
+
+
+ARTICLE = ("تیم ملی فوتبال ایران امروز در ورزشگاه آزادی به مصاف تیم ملی ژاپن "
+           "رفت و با نتیجه دو بر یک به پیروزی رسید و به مرحله بعد صعود کرد")
+NEAR_DUPLICATE = ("تیم ملی فوتبال ایران امروز در ورزشگاه آزادی به مصاف تیم ملی ژاپن "
+                  "رفت و با نتیجه دو بر یک به پیروزی رسید و به مرحله نهایی صعود کرد")
+UNRELATED = ("بانک مرکزی امروز گزارش جدیدی درباره نرخ تورم و رشد اقتصادی "
+             "کشور در سه ماه گذشته منتشر کرد")
+
+
+class TestMinHash:
+    """Test cases for MinHash."""
+
+    def test_word_shingles(self):
+        """Test word shingle extraction."""
+        minhash = MinHash(shingle_size=2)
+        assert minhash.shingles("من به مدرسه رفتم") == {"من به", "به مدرسه", "مدرسه رفتم"}
+
+    def test_char_shingles(self):
+        """Test character shingle extraction with whitespace collapsed."""
+        minhash = MinHash(shingle_type='char', shingle_size=3)
+        assert minhash.shingles("ab  cd") == {"ab ", "b c", " cd"}
+
+    def test_short_documents(self):
+        """Test documents shorter than one shingle."""
+        minhash = MinHash(shingle_size=3)
+        assert minhash.shingles("سلام دنیا") == {"سلام دنیا"}
+        assert minhash.shingles("   ") == set()
+
+    def test_shingles_are_normalized(self):
+        """Test that Arabic characters are normalized before shingling."""
+        minhash = MinHash(shingle_size=1)
+        assert minhash.shingles("كتاب") == minhash.shingles("کتاب")
+
+    def test_signature_length_and_determinism(self):
+        """Test signature length and reproducibility."""
+        sig1 = MinHash(num_perm=64, seed=3).signature(ARTICLE)
+        sig2 = MinHash(num_perm=64, seed=3).signature(ARTICLE)
+        assert len(sig1) == 64
+        assert sig1 == sig2
+
+    def test_signature_stable_across_processes(self):
+        """Test that signatures do not depend on the string hash seed."""
+        code = ("from bidnlp.classification import MinHash;"
+                "print(list(MinHash(num_perm=8).signature('سلام دنیا زیبا')))")
+        outputs = set()
+        for hash_seed in ('1', '2'):
+            result = subprocess.run(
+                [sys.executable, '-c', code], capture_output=True, text=True,
+                env=dict(os.environ, PYTHONHASHSEED=hash_seed), check=True)
+            outputs.add(result.stdout)
+        assert len(outputs) == 1
+
+    def test_jaccard_estimate(self):
+        """Test that the estimate approximates the exact Jaccard similarity."""
+        minhash = MinHash(num_perm=256)
+        exact = PersianTextMetrics.jaccard_similarity(
+            minhash.shingles(ARTICLE), minhash.shingles(NEAR_DUPLICATE))
+        estimate = MinHash.jaccard(minhash.signature(ARTICLE),
+                                   minhash.signature(NEAR_DUPLICATE))
+        assert abs(estimate - exact) < 0.15
+        assert MinHash.jaccard(minhash.signature(ARTICLE),
+                               minhash.signature(ARTICLE)) == 1.0
+
+    def test_jaccard_length_mismatch(self):
+        """Test that signatures of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            MinHash.jaccard(MinHash(num_perm=4).signature("a b c"),
+                            MinHash(num_perm=8).signature("a b c"))
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            MinHash(num_perm=0)
+        with pytest.raises(ValueError):
+            MinHash(shingle_type='sentence')
+        with pytest.raises(ValueError):
+            MinHash(shingle_size=0)
+
+
+class TestLSHIndex:
+    """Test cases for LSHIndex."""
+
+    @pytest.fixture
+    def minhash(self):
+        return MinHash(num_perm=128)
+
+    @pytest.fixture
+    def index(self, minhash):
+        index = LSHIndex(num_perm=128, bands=32)
+        index.add('article', minhash.signature(ARTICLE))
+        index.add('unrelated', minhash.signature(UNRELATED))
+        return index
+
+    def test_query_finds_near_duplicate(self, minhash, index):
+        """Test that a near-duplicate is returned and unrelated text is not."""
+        results = index.query(minhash.signature(NEAR_DUPLICATE), threshold=0.5)
+        assert [key for key, _ in results] == ['article']
+        assert 'unrelated' not in index.candidates(minhash.signature(NEAR_DUPLICATE))
+
+    def test_query_exact_duplicate(self, minhash, index):
+        """Test that an identical document has similarity 1.0."""
+        assert index.query(minhash.signature(ARTICLE))[0] == ('article', 1.0)
+
+    def test_query_with_list_signature(self, minhash, index):
+        """Test that plain lists are accepted like arrays."""
+        signature = list(minhash.signature(NEAR_DUPLICATE))
+
+        assert index.candidates(signature) == index.candidates(minhash.signature(NEAR_DUPLICATE))
+        assert index.query(signature, threshold=0.5)[0][0] == 'article'
+
+        index.add('list', list(minhash.signature(UNRELATED)))
+        assert index.query(list(minhash.signature(UNRELATED)))[0][1] == 1.0
+
+    def test_len_and_contains(self, index):
+        """Test index size and membership."""
+        assert len(index) == 2
+        assert 'article' in index
+        assert 'missing' not in index
+
+    def test_add_duplicate_key(self, minhash, index):
+        """Test that keys must be unique."""
+        with pytest.raises(ValueError):
+            index.add('article', minhash.signature(ARTICLE))
+
+    def test_remove(self, minhash, index):
+        """Test removing a document."""
+        index.remove('article')
+
+        assert 'article' not in index
+        assert index.query(minhash.signature(ARTICLE)) == []
+        assert all(index._tables[i] for i in range(index.bands))
+        with pytest.raises(KeyError):
+            index.remove('article')
+
+    def test_signature_length_checked(self, index):
+        """Test that signatures of the wrong length are rejected."""
+        with pytest.raises(ValueError):
+            index.candidates(MinHash(num_perm=64).signature(ARTICLE))
+
+    def test_invalid_bands(self):
+        """Test that bands must divide num_perm."""
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=128, bands=30)
+
+    def test_save_and_load(self, minhash, index, tmp_path):
+        """Test persisting the index to disk."""
+        path = str(tmp_path / 'index.pkl')
+        index.save(path)
+        loaded = LSHIndex.load(path)
+
+        assert len(loaded) == 2
+        assert loaded.bands == 32
+        signature = minhash.signature(NEAR_DUPLICATE)
+        assert loaded.query(signature) == index.query(signature)
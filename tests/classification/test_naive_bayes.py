@@ -0,0 +1,163 @@
+"""
+Tests for the multinomial Naive Bayes classifier
+"""
+
+import math
+
+import pytest
+from bidnlp.classification import (
+    BagOfWords, CSRMatrix, HashingVectorizer, NaiveBayesClassifier, TfidfVectorizer,
+)
+
+
+TEXTS = [
+    "تیم فوتبال بازی را برد",
+    "بازیکن فوتبال گل زد",
+    "تیم ملی والیبال قهرمان شد",
+    "دولت بودجه را تصویب کرد",
+    "مجلس و دولت درباره انتخابات بحث کردند",
+    "انتخابات مجلس برگزار شد",
+]
+LABELS = ['ورزش', 'ورزش', 'ورزش', 'سیاست', 'سیاست', 'سیاست']
+
+
+class TestNaiveBayesClassifier:
+    """Test cases for NaiveBayesClassifier."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.classifier = NaiveBayesClassifier()
+        self.classifier.train(TEXTS, LABELS)
+
+    def test_predict(self):
+        """Test predicting classes."""
+        assert self.classifier.is_trained()
+        assert self.classifier.predict("فوتبال و والیبال") == 'ورزش'
+        assert self.classifier.predict("دولت و مجلس") == 'سیاست'
+
+    def test_predict_batch(self):
+        """Test that batch prediction agrees with single prediction."""
+        texts = ["فوتبال و والیبال", "دولت و مجلس", "گل", "چیزی نامعلوم"]
+        assert self.classifier.predict_batch(texts) == \
+            [self.classifier.predict(text) for text in texts]
+
+    def test_predict_proba(self):
+        """Test class probabilities."""
+        proba = self.classifier.predict_proba("فوتبال")
+
+        assert set(proba) == {'ورزش', 'سیاست'}
+        assert sum(proba.values()) == pytest.approx(1.0)
+        assert proba['ورزش'] > proba['سیاست']
+
+    def test_log_likelihood_matches_formula(self):
+        """Test scores against a direct multinomial Naive Bayes computation."""
+        vectors = [{0: 2, 1: 1}, {1: 3}, {2: 1}]
+        labels = ['a', 'a', 'b']
+        classifier = NaiveBayesClassifier(alpha=0.5)
+        classifier.partial_fit_vectors(vectors, labels)
+
+        counts = {'a': [2, 4, 0], 'b': [0, 0, 1]}
+        priors = {'a': 2 / 3, 'b': 1 / 3}
+        query = {0: 1, 2: 2}
+        expected = []
+        for label in ['a', 'b']:
+            total = sum(counts[label]) + 0.5 * 3
+            expected.append(math.log(priors[label]) + sum(
+                value * math.log((counts[label][idx] + 0.5) / total)
+                for idx, value in query.items()))
+
+        assert classifier.joint_log_likelihood([query])[0] == pytest.approx(expected)
+
+    def test_partial_fit_matches_train(self):
+        """Test that streaming updates give the same model as one batch."""
+        vectorizer = BagOfWords().fit(self.classifier.preprocess(text) for text in TEXTS)
+        streamed = NaiveBayesClassifier(vectorizer=vectorizer)
+        streamed.partial_fit(TEXTS[:2], LABELS[:2])
+        streamed.partial_fit(TEXTS[2:], LABELS[2:])
+
+        texts = ["فوتبال و والیبال", "دولت و مجلس", "انتخابات تیم"]
+        assert streamed.classes == self.classifier.classes
+        for a, b in zip(streamed.predict_proba_batch(texts),
+                        self.classifier.predict_proba_batch(texts)):
+            assert a == pytest.approx(b)
+
+    def test_partial_fit_new_class(self):
+        """Test that new labels can appear in later batches."""
+        vectorizer = HashingVectorizer(n_features=2 ** 12, alternate_sign=False, norm=None)
+        classifier = NaiveBayesClassifier(vectorizer=vectorizer)
+        classifier.partial_fit(TEXTS, LABELS)
+        classifier.partial_fit(["قیمت دلار و طلا بالا رفت", "بورس و دلار"], ['اقتصاد', 'اقتصاد'])
+
+        assert classifier.classes == ['ورزش', 'سیاست', 'اقتصاد']
+        assert classifier.predict("دلار") == 'اقتصاد'
+        assert classifier.predict("فوتبال") == 'ورزش'
+
+    def test_partial_fit_requires_fitted_vectorizer(self):
+        """Test that partial_fit needs a fixed feature space."""
+        with pytest.raises(ValueError):
+            NaiveBayesClassifier().partial_fit(TEXTS, LABELS)
+
+    def test_tfidf_features(self):
+        """Test training on TF-IDF features."""
+        classifier = NaiveBayesClassifier(vectorizer=TfidfVectorizer())
+        classifier.train(TEXTS, LABELS)
+        assert classifier.predict("فوتبال") == 'ورزش'
+
+    def test_negative_features_rejected(self):
+        """Test that signed hashing features are rejected."""
+        classifier = NaiveBayesClassifier(vectorizer=HashingVectorizer(n_features=2 ** 8))
+        with pytest.raises(ValueError):
+            classifier.train(TEXTS, LABELS)
+
+    def test_csr_input(self):
+        """Test training and scoring on CSRMatrix input."""
+        matrix = CSRMatrix.from_dicts([{0: 1}, {1: 1}], n_features=2)
+        classifier = NaiveBayesClassifier()
+        classifier.partial_fit_vectors(matrix, ['x', 'y'])
+
+        scores = classifier.joint_log_likelihood(matrix)
+        assert scores[0][0] > scores[0][1]
+        assert scores[1][1] > scores[1][0]
+
+    def test_untrained(self):
+        """Test prediction before training."""
+        with pytest.raises(ValueError):
+            NaiveBayesClassifier().joint_log_likelihood([{0: 1}])
+
+    def test_unequal_lengths(self):
+        """Test training with unequal text/label lengths."""
+        with pytest.raises(ValueError):
+            NaiveBayesClassifier().train(TEXTS, LABELS[:2])
+
+    def test_evaluate(self):
+        """Test evaluation through the base class."""
+        result = self.classifier.evaluate(TEXTS, LABELS)
+        assert result['accuracy'] == 1.0
+
+    def test_save_and_load(self, tmp_path):
+        """Test persisting the model."""
+        path = str(tmp_path / 'nb.pkl')
+        self.classifier.save(path)
+        loaded = NaiveBayesClassifier.load(path)
+
+        texts = ["فوتبال و والیبال", "دولت و مجلس"]
+        assert loaded.classes == self.classifier.classes
+        assert loaded.predict_proba_batch(texts) == self.classifier.predict_proba_batch(texts)
+
+    def test_saved_model_is_compact(self, tmp_path):
+        """Test that a saved model holds the vocabulary, not the corpus counts."""
+        texts = [f"{text} کلمه{i}" for i, text in enumerate(TEXTS * 500)]
+        labels = LABELS * 500
+        vectorizer = BagOfWords(max_features=20)
+        vectorizer.partial_fit(texts)
+        classifier = NaiveBayesClassifier(vectorizer=vectorizer)
+        classifier.partial_fit(texts, labels)
+
+        path = tmp_path / 'nb.pkl'
+        classifier.save(str(path))
+        assert path.stat().st_size < 2000
+        # The running counts of the live vectorizer are kept
+        assert len(vectorizer._term_counts) > 3000
+
+        loaded = NaiveBayesClassifier.load(str(path))
+        assert loaded.predict_proba_batch(TEXTS) == classifier.predict_proba_batch(TEXTS)
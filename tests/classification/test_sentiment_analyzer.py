@@ -3,7 +3,7 @@ Tests for Persian sentiment analyzer
 """
 
 import pytest
-from bidnlp.classification import PersianSentimentAnalyzer
+from bidnlp.classification import PersianSentimentAnalyzer, SentimentBatchResult
 
 
 class TestPersianSentimentAnalyzer:
@@ -125,3 +125,228 @@ class TestPersianSentimentAnalyzer:
         # Should have both positive and negative counts
         assert result['positive_count'] > 0
         assert result['negative_count'] > 0
+
+    def test_multi_word_keyword(self):
+        """Test that multi-word lexicon entries match as one phrase."""
+        result = self.analyzer.analyze("این فیلم خیلی خوب بود")
+        assert result['positive_words'] == ['خیلی خوب']
+        assert result['positive_count'] == 1
+
+    def test_zwnj_keyword_spacing(self):
+        """Test that ZWNJ entries also match when written with a space."""
+        result = self.analyzer.analyze("کیفیت فوق العاده")
+        assert 'فوق‌العاده' in result['positive_words']
+
+    def test_negation_after_phrase(self):
+        """Test that a negation after a phrase negates it."""
+        result = self.analyzer.analyze("خیلی خوب نیست")
+        assert result['negative_words'] == ['NOT خیلی خوب']
+        assert result['sentiment'] == 'negative'
+
+    def test_negation_window(self):
+        """Test that negation only reaches two words before and after."""
+        analyzer = PersianSentimentAnalyzer(normalize=False,
+                                            positive_keywords={'خوب'},
+                                            negative_keywords={'بد'})
+        assert analyzer.analyze("نه الف خوب")['negative_words'] == ['NOT خوب']
+        assert analyzer.analyze("نه الف ب خوب")['positive_words'] == ['خوب']
+        assert analyzer.analyze("خوب الف نیست")['negative_words'] == ['NOT خوب']
+        assert analyzer.analyze("خوب الف ب نیست")['positive_words'] == ['خوب']
+
+    def test_negation_word_in_lexicon(self):
+        """Test that a negation word listed as a keyword negates its neighbours only."""
+        for negation in ('نیست', 'ن‌یست'):
+            analyzer = PersianSentimentAnalyzer(negative_keywords={negation, 'بد'})
+            result = analyzer.analyze(f"خوب {negation}")
+            assert result['negative_words'] == ['NOT خوب', negation]
+            assert result['sentiment'] == 'negative'
+
+            result = analyzer.analyze(f"{negation} الف ب خوب")
+            assert result['negative_words'] == [negation]
+            assert result['positive_words'] == ['خوب']
+
+    def test_added_keywords_are_used(self):
+        """Test that keywords added after analysis are matched."""
+        assert self.analyzer.predict("شاهکار") == 'neutral'
+
+        self.analyzer.add_positive_keyword('شاهکار')
+        assert self.analyzer.predict("شاهکار") == 'positive'
+
+        self.analyzer.add_negative_keywords(['فاجعه بار'])
+        assert self.analyzer.analyze("یک فاجعه بار")['negative_words'] == ['فاجعه بار']
+
+    def test_keyword_methods_update_lexicon(self):
+        """Test that keyword changes made through the methods are picked up."""
+        assert self.analyzer.predict("عالی") == 'positive'
+
+        self.analyzer.remove_keyword('عالی')
+        self.analyzer.add_positive_keyword('کتاب')
+        assert self.analyzer.predict("عالی") == 'neutral'
+        assert self.analyzer.predict("کتاب") == 'positive'
+
+        self.analyzer.remove_negation_keyword('نیست')
+        self.analyzer.remove_negation_keyword('ن\u200cیست')
+        assert self.analyzer.predict("کتاب نیست") == 'positive'
+        self.analyzer.add_negation_keyword('نیست')
+        assert self.analyzer.predict("کتاب نیست") == 'negative'
+
+    def test_keyword_sets_reassigned(self):
+        """Test that the caller's sets are used and reassigned sets are picked up."""
+        positive = {'خوب'}
+        analyzer = PersianSentimentAnalyzer(positive_keywords=positive)
+        assert analyzer.positive_keywords is positive
+        assert analyzer.predict("خوب") == 'positive'
+
+        analyzer.positive_keywords = {'کتاب'}
+        assert analyzer.predict("خوب") == 'neutral'
+        assert analyzer.predict("کتاب") == 'positive'
+
+    def test_weight_methods_update_lexicon(self):
+        """Test that changed weights and intensifiers are picked up."""
+        analyzer = PersianSentimentAnalyzer(positive_keywords={'خوب'},
+                                            negative_keywords={'بد'},
+                                            intensifiers={'خیلی': 1.5})
+        assert analyzer.predict("خوب خوب بد") == 'positive'
+        assert analyzer.analyze("خیلی خوب")['positive_weight'] == 1.5
+
+        analyzer.set_term_weight('بد', 5.0)
+        assert analyzer.predict("خوب خوب بد") == 'negative'
+        analyzer.set_term_weight('بد', None)
+        assert analyzer.predict("خوب خوب بد") == 'positive'
+
+        analyzer.set_intensifier('خیلی', 3.0)
+        assert analyzer.analyze("خیلی خوب")['positive_weight'] == 3.0
+        analyzer.set_intensifier('خیلی', None)
+        assert analyzer.analyze("خیلی خوب")['positive_weight'] == 1.0
+
+    def test_train_after_analyze(self):
+        """Test that training replaces a lexicon that was already compiled."""
+        assert self.analyzer.predict("سرد") == 'neutral'
+
+        self.analyzer.train(["غذا سرد بود", "سرد و بد", "غذا گرم بود", "گرم و عالی"],
+                            ['negative', 'negative', 'positive', 'positive'], min_df=1)
+        assert self.analyzer.predict("سرد") == 'negative'
+
+    def test_analyze_batch_matches_single(self):
+        """Test that batch columns agree with the single-text methods."""
+        texts = ["این کتاب خیلی خوب است", "بد و ضعیف", "معمولی است",
+                 "کتاب خوب بود اما قیمت گران است", "خوب نیست", ""]
+        result = self.analyzer.analyze_batch(iter(texts))
+
+        assert isinstance(result, SentimentBatchResult)
+        assert len(result) == len(texts)
+        for i, text in enumerate(texts):
+            single = self.analyzer.analyze(text)
+            assert result.labels[i] == single['sentiment']
+            assert result.scores[i] == single['score']
+            assert result.positive_counts[i] == single['positive_count']
+            assert result.negative_counts[i] == single['negative_count']
+            assert result.sentiment_scores[i] == self.analyzer.get_sentiment_score(text)
+            assert result.probabilities(i) == self.analyzer.predict_proba(text)
+
+    def test_analyze_batch_chunks(self):
+        """Test that chunking does not change the result."""
+        texts = ["خوب", "بد", "عالی است", "افتضاح", "معمولی"] * 3
+        whole = self.analyzer.analyze_batch(texts)
+        chunked = self.analyzer.analyze_batch(texts, chunksize=4)
+
+        assert chunked.labels == whole.labels
+        assert chunked.scores == whole.scores
+
+    def test_analyze_batch_parallel(self):
+        """Test the process-pool mode."""
+        texts = ["خوب", "بد", "عالی است", "افتضاح", "معمولی"] * 4
+        serial = self.analyzer.analyze_batch(texts)
+        parallel = self.analyzer.analyze_batch(texts, n_jobs=2, chunksize=3)
+
+        assert parallel.labels == serial.labels
+        assert parallel.sentiment_scores == serial.sentiment_scores
+        assert parallel.positive_counts == serial.positive_counts
+
+    def test_analyze_batch_empty(self):
+        """Test analyzing no texts."""
+        assert len(self.analyzer.analyze_batch([])) == 0
+
+    def test_unit_weights(self):
+        """Test that default weights equal the hit counts."""
+        result = self.analyzer.analyze("کتاب خوب بود اما قیمت گران و بد است")
+        assert result['positive_weight'] == result['positive_count']
+        assert result['negative_weight'] == result['negative_count']
+
+    def test_term_weights(self):
+        """Test that term weights decide between positive and negative hits."""
+        analyzer = PersianSentimentAnalyzer(positive_keywords={'خوب'},
+                                            negative_keywords={'گران'},
+                                            term_weights={'خوب': 3.0})
+        result = analyzer.analyze("خوب ولی گران")
+
+        assert result['positive_count'] == result['negative_count'] == 1
+        assert result['sentiment'] == 'positive'
+        assert result['score'] == pytest.approx(0.5)
+
+    def test_intensifiers(self):
+        """Test intensifier and diminisher multipliers."""
+        analyzer = PersianSentimentAnalyzer(
+            intensifiers=PersianSentimentAnalyzer.DEFAULT_INTENSIFIERS)
+
+        assert analyzer.analyze("بسیار بد")['negative_weight'] == pytest.approx(1.5)
+        assert analyzer.analyze("کمی بد")['negative_weight'] == pytest.approx(0.5)
+        assert analyzer.analyze("واقعا بسیار بد")['negative_weight'] == pytest.approx(1.95)
+        # Only the word directly after the modifier is scaled
+        assert analyzer.analyze("بسیار کتاب بد")['negative_weight'] == pytest.approx(1.0)
+        assert analyzer.predict("خوب ولی کمی گران") == 'positive'
+
+    def test_intensifier_with_negation(self):
+        """Test that negation flips an intensified hit."""
+        analyzer = PersianSentimentAnalyzer(intensifiers={'بسیار': 2.0})
+        result = analyzer.analyze("بسیار بد نیست")
+
+        assert result['positive_words'] == ['NOT بد']
+        assert result['positive_weight'] == pytest.approx(2.0)
+
+    def test_train_learns_weights(self):
+        """Test learning a weighted lexicon from labeled texts."""
+        texts = ["غذا عالی و تازه بود", "پرسنل مودب و غذا تازه",
+                 "عالی و مودب", "غذا سرد و دیر رسید",
+                 "سرد و بی مزه", "دیر رسید و سرد بود", "معمولی بود"]
+        labels = ['positive', 'positive', 'positive', 'negative',
+                  'negative', 'negative', 'neutral']
+        self.analyzer.train(iter(texts), iter(labels))
+
+        assert {'تازه', 'مودب', 'عالی'} <= self.analyzer.positive_keywords
+        assert {'سرد', 'دیر', 'رسید'} <= self.analyzer.negative_keywords
+        assert 'غذا' not in self.analyzer.term_weights or \
+            self.analyzer.term_weights['غذا'] < self.analyzer.term_weights['سرد']
+        assert self.analyzer.predict("غذا تازه بود") == 'positive'
+        assert self.analyzer.predict("غذا سرد بود") == 'negative'
+
+    def test_train_max_terms(self):
+        """Test limiting the learned lexicon size."""
+        texts = ["عالی تازه", "عالی مودب", "سرد دیر", "سرد بد"]
+        labels = ['positive', 'positive', 'negative', 'negative']
+        self.analyzer.train(texts, labels, min_df=1, max_terms=2)
+
+        assert self.analyzer.positive_keywords == {'عالی'}
+        assert self.analyzer.negative_keywords == {'سرد'}
+
+    def test_train_invalid_data(self):
+        """Test training data validation."""
+        with pytest.raises(ValueError):
+            self.analyzer.train(["خوب", "بد"], ['positive'])
+        with pytest.raises(ValueError):
+            self.analyzer.train(["خوب"], ['positive'])
+
+    def test_save_and_load(self, tmp_path):
+        """Test persisting the weighted lexicon as JSON."""
+        analyzer = PersianSentimentAnalyzer(term_weights={'خوب': 2.5},
+                                            intensifiers={'بسیار': 1.5})
+        path = str(tmp_path / 'lexicon.json')
+        analyzer.save(path)
+        loaded = PersianSentimentAnalyzer.load(path)
+
+        assert loaded.positive_keywords == analyzer.positive_keywords
+        assert loaded.negative_keywords == analyzer.negative_keywords
+        assert loaded.negation_keywords == analyzer.negation_keywords
+        assert loaded.term_weights == {'خوب': 2.5}
+        for text in ["بسیار خوب ولی گران", "بد نیست", "خیلی خوب"]:
+            assert loaded.analyze(text) == analyzer.analyze(text)
@@ -0,0 +1,138 @@
+"""
+Tests for sparse similarity search
+"""
+
+import pytest
+from bidnlp.classification import CSRMatrix, SimilaritySearch, TfidfVectorizer
+from bidnlp.utils import PersianTextMetrics
+
+
+def _dense(vector, n_features):
+    return [vector.get(i, 0.0) for i in range(n_features)]
+
+
+class TestSimilaritySearch:
+    """Test cases for SimilaritySearch."""
+
+    @pytest.fixture
+    def documents(self):
+        return [
+            "ایران کشور بزرگی است",
+            "ایران کشور زیبایی است",
+            "تهران پایتخت ایران است",
+            "فوتبال ورزش محبوب است",
+            "ایران کشور بزرگی است",
+        ]
+
+    def test_query_matches_cosine_similarity(self, documents):
+        """Test that scores equal PersianTextMetrics.cosine_similarity."""
+        tfidf = TfidfVectorizer()
+        vectors = tfidf.fit_transform(documents)
+        n_features = len(tfidf.vocabulary)
+
+        search = SimilaritySearch().fit(vectors)
+        results = search.query(vectors, k=len(documents))
+
+        for q, neighbors in enumerate(results):
+            for doc, score in neighbors:
+                expected = PersianTextMetrics.cosine_similarity(
+                    _dense(vectors[q], n_features), _dense(vectors[doc], n_features))
+                assert score == pytest.approx(expected)
+
+    def test_query_top_k_order(self, documents):
+        """Test that neighbors are sorted by decreasing similarity."""
+        vectors = TfidfVectorizer().fit_transform(documents)
+        search = SimilaritySearch().fit(vectors)
+
+        neighbors = search.query([vectors[0]], k=3)[0]
+        assert len(neighbors) == 3
+        assert {neighbors[0][0], neighbors[1][0]} == {0, 4}
+        assert neighbors[0][1] == pytest.approx(1.0)
+        scores = [score for _, score in neighbors]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_query_accepts_csr(self, documents):
+        """Test that CSR input gives the same results as dict input."""
+        tfidf = TfidfVectorizer()
+        vectors = tfidf.fit_transform(documents)
+        matrix = tfidf.transform(documents, output='csr')
+
+        from_dicts = SimilaritySearch().fit(vectors).query(vectors, k=2)
+        from_csr = SimilaritySearch().fit(matrix).query(matrix, k=2)
+        assert [[doc for doc, _ in n] for n in from_csr] == \
+            [[doc for doc, _ in n] for n in from_dicts]
+
+    def test_unnormalized_input(self):
+        """Test that rows are normalized when indexed."""
+        search = SimilaritySearch().fit([{0: 3.0, 1: 4.0}, {0: 10.0}])
+        neighbors = search.query([{0: 6.0, 1: 8.0}], k=2)[0]
+
+        assert neighbors[0] == (0, pytest.approx(1.0))
+        assert neighbors[1] == (1, pytest.approx(0.6))
+
+    def test_min_score_and_disjoint(self):
+        """Test min_score filtering and queries with no shared features."""
+        search = SimilaritySearch().fit([{0: 1.0}, {1: 1.0}, {0: 1.0, 1: 1.0}])
+
+        assert search.query([{0: 1.0}], k=5, min_score=0.8) == [[(0, pytest.approx(1.0))]]
+        assert search.query([{7: 1.0}, {}], k=5) == [[], []]
+
+    def test_query_iter_chunks(self):
+        """Test that queries are processed in chunks."""
+        vectors = [{i % 3: 1.0} for i in range(7)]
+        search = SimilaritySearch(chunksize=3).fit(vectors)
+
+        chunks = list(search.query_iter(vectors, k=1))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_find_duplicates(self, documents):
+        """Test near-duplicate pair detection."""
+        vectors = TfidfVectorizer().fit_transform(documents)
+        search = SimilaritySearch(chunksize=2).fit(vectors)
+
+        pairs = list(search.find_duplicates(threshold=0.99))
+        assert [(i, j) for i, j, _ in pairs] == [(0, 4)]
+        assert pairs[0][2] == pytest.approx(1.0)
+
+    def test_find_duplicates_matches_brute_force(self):
+        """Test that every pair above the threshold is found exactly once."""
+        vectors = [{i % 4: 1.0, (i * 7) % 5 + 4: 2.0, 9: 0.5} for i in range(20)]
+        search = SimilaritySearch(chunksize=6).fit(vectors)
+        all_scores = search.query(vectors, k=len(vectors))
+
+        expected = sorted((q, doc) for q, neighbors in enumerate(all_scores)
+                          for doc, score in neighbors if doc > q and score >= 0.5)
+        found = sorted((i, j) for i, j, _ in search.find_duplicates(threshold=0.5))
+        assert found == expected
+
+    def test_zero_vectors_mixed_in(self):
+        """Test that all-zero rows are never returned and do not break pair search."""
+        vectors = [{0: 1.0}, {0: 0.0, 1: 0.0}, {0: 1.0, 1: 1.0}, {}, {1: 0.0}, {0: 2.0}, {1: 1.0}]
+        search = SimilaritySearch().fit(vectors)
+
+        neighbors = search.query([{0: 1.0}], k=10)[0]
+        assert sorted(doc for doc, _ in neighbors) == [0, 2, 5]
+
+        found = sorted((i, j) for i, j, _ in search.find_duplicates(threshold=0.5))
+        assert found == [(0, 2), (0, 5), (2, 5), (2, 6)]
+        assert search.deduplicate(threshold=0.99) == [0, 1, 2, 3, 4, 6]
+
+    def test_deduplicate(self):
+        """Test that one document per duplicate group is kept."""
+        vectors = [{0: 1.0}, {1: 1.0}, {0: 2.0}, {0: 1.0, 1: 0.01}, {2: 1.0}]
+        search = SimilaritySearch().fit(vectors)
+
+        assert search.deduplicate(threshold=0.99) == [0, 1, 4]
+
+    def test_empty_index(self):
+        """Test searching an empty index."""
+        search = SimilaritySearch().fit(CSRMatrix())
+
+        assert search.query([{0: 1.0}]) == [[]]
+        assert list(search.find_duplicates()) == []
+        assert search.deduplicate() == []
+
+    def test_invalid_chunksize(self):
+        """Test that a chunksize below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SimilaritySearch(chunksize=0)
@@ -0,0 +1,82 @@
+"""
+Tests for the CSR sparse matrix container
+"""
+
+import pytest
+from bidnlp.classification import CSRMatrix
+
+
+class TestCSRMatrix:
+    """Test cases for CSRMatrix."""
+
+    def test_from_dicts_roundtrip(self):
+        """Test conversion from and to the dict format."""
+        vectors = [{0: 1.0, 3: 2.5}, {}, {2: 0.5}]
+        matrix = CSRMatrix.from_dicts(vectors)
+
+        assert matrix.shape == (3, 4)
+        assert matrix.nnz == 3
+        assert matrix.to_dicts() == vectors
+
+    def test_from_dicts_sorts_indices(self):
+        """Test that rows are stored with sorted indices."""
+        matrix = CSRMatrix.from_dicts([{5: 1.0, 1: 2.0}], n_features=10)
+
+        indices, values = matrix.row(0)
+        assert list(indices) == [1, 5]
+        assert list(values) == [2.0, 1.0]
+        assert matrix.shape == (1, 10)
+
+    def test_append_row(self):
+        """Test building a matrix row by row."""
+        matrix = CSRMatrix(n_features=3, dtype='q')
+        matrix.append_row([(0, 1), (2, 4)])
+        matrix.append_row([])
+
+        assert len(matrix) == 2
+        assert list(matrix.indptr) == [0, 2, 2]
+        assert matrix.getrow(0) == {0: 1, 2: 4}
+        assert matrix.getrow(1) == {}
+
+    def test_vstack(self):
+        """Test vertical stacking."""
+        a = CSRMatrix.from_dicts([{0: 1.0}, {1: 2.0}], n_features=3)
+        b = CSRMatrix.from_dicts([{2: 3.0}], n_features=3)
+
+        stacked = CSRMatrix.vstack([a, b])
+        assert stacked.shape == (3, 3)
+        assert stacked.to_dicts() == [{0: 1.0}, {1: 2.0}, {2: 3.0}]
+
+    def test_vstack_mismatched_columns(self):
+        """Test that stacking different widths raises error."""
+        a = CSRMatrix.from_dicts([{0: 1.0}], n_features=2)
+        b = CSRMatrix.from_dicts([{0: 1.0}], n_features=3)
+
+        with pytest.raises(ValueError):
+            CSRMatrix.vstack([a, b])
+
+    def test_invalid_buffers(self):
+        """Test that inconsistent buffers raise error."""
+        from array import array
+
+        with pytest.raises(ValueError):
+            CSRMatrix(n_features=2, indptr=array('q', [0, 2]),
+                      indices=array('i', [0]), data=array('d', [1.0]))
+
+    def test_to_numpy(self):
+        """Test zero-copy NumPy export."""
+        np = pytest.importorskip("numpy")
+        matrix = CSRMatrix.from_dicts([{0: 1.0, 2: 3.0}], n_features=3)
+
+        indptr, indices, data = matrix.to_numpy()
+        assert indptr.tolist() == [0, 2]
+        assert indices.tolist() == [0, 2]
+        assert np.allclose(data, [1.0, 3.0])
+
+    def test_dot(self):
+        """Test row products with dense vectors."""
+        matrix = CSRMatrix.from_dicts([{0: 1.0, 2: 2.0}, {}, {1: 3.0, 3: 1.0}], n_features=4)
+        weights = [[1.0, 2.0, 3.0], [0.5, 0.5, 0.5]]
+
+        # Column 3 is beyond the length of the vectors and is ignored
+        assert matrix.dot(weights) == [[7.0, 1.5], [0.0, 0.0], [6.0, 1.5]]
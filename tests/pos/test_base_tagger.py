@@ -231,6 +231,18 @@ class TestBasePOSTagger(unittest.TestCase):
 
         self.assertEqual(metrics['accuracy'], 1.0)
 
+    def test_evaluate_report(self):
+        """Test the per-tag classification report."""
+        texts = ["کتاب خوب"]
+        predicted = self.tagger.get_tags(texts[0])
+
+        metrics = self.tagger.evaluate(texts, [predicted])
+        report = metrics['classification_report']
+
+        for tag in predicted:
+            self.assertEqual(report[tag]['precision'], 1.0)
+        self.assertEqual(report['overall']['total'], len(predicted))
+
     def test_preprocess_normalization(self):
         """Test that preprocessing normalizes when enabled."""
         tagger = ConcretePOSTagger(normalize=True)
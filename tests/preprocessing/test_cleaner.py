@@ -2,10 +2,60 @@
 Tests for Persian Text Cleaner
 """
 
+import itertools
+import random
+import re
 import unittest
 from bidnlp.preprocessing import PersianTextCleaner
 
 
+def sequential_clean(cleaner, text):
+    """Reference: the cleaning rules applied one pass at a time."""
+    if not text:
+        return text
+    if cleaner.remove_html:
+        for entity, char in (('&nbsp;', ' '), ('&lt;', '<'), ('&gt;', '>'),
+                             ('&amp;', '&'), ('&quot;', '"'), ('&#39;', "'")):
+            text = text.replace(entity, char)
+        text = cleaner.html_pattern.sub('', text)
+    for remove, replace_with, pattern in (
+            (cleaner.remove_urls, cleaner.replace_urls_with, cleaner.url_pattern),
+            (cleaner.remove_emails, cleaner.replace_emails_with, cleaner.email_pattern),
+            (cleaner.remove_mentions, cleaner.replace_mentions_with, cleaner.mention_pattern),
+            (cleaner.remove_hashtags, cleaner.replace_hashtags_with, cleaner.hashtag_pattern),
+            (cleaner.remove_emojis, cleaner.replace_emojis_with, cleaner.emoji_pattern)):
+        if remove or replace_with is not None:
+            text = pattern.sub(replace_with or '', text)
+    if cleaner.lowercase_english:
+        text = ''.join(c.lower() if 'A' <= c <= 'Z' else c for c in text)
+    if cleaner.remove_extra_whitespace:
+        text = re.sub(r' +', ' ', text)
+        text = re.sub(r'\n+', '\n', text)
+        text = text.strip()
+        text = re.sub(r'\n ', '\n', text)
+    return text
+
+
+EQUIVALENCE_TEXTS = [
+    "این سایت https://example.com خوب است",
+    "ببینید www.example.com",
+    "ایمیل من test@example.com است",
+    "سلام @کاربر چطوری؟ #ایران زیباست",
+    "<p>این یک <strong>متن</strong> است</p>",
+    "۱۰&nbsp;&lt;۲۰&gt;&amp;test &amp;quot;x&amp;quot; &amp;amp;lt;",
+    "&lt;b&gt;bold&lt;/b&gt; متن",
+    "سلام 😊 چطوری؟ 👍👍",
+    "این    یک     متن\n\n\n  است  ",
+    "<p>سلام 😊 https://test.com HELLO</p>",
+    # Matches that interact when the rules are applied in sequence
+    "a.b@www.example.com",
+    "@ali.reza@gmail.com #ali@gmail.com",
+    "#abhttp://x.com @www.site.ir",
+    "www.x.com1ali@gmail.com",
+    "😊@ali😊 (http://x.com) x#tag#tag",
+]
+
+
 class TestPersianTextCleaner(unittest.TestCase):
     """Test cases for PersianTextCleaner"""
 
@@ -232,5 +282,139 @@ class TestPersianTextCleaner(unittest.TestCase):
         self.assertIn('سلام', result)
 
 
+class TestCleanEquivalence(unittest.TestCase):
+    """Test that clean matches the original rule-by-rule implementation"""
+
+    def test_all_flag_combinations(self):
+        """Test every combination of the boolean flags"""
+        for flags in itertools.product([False, True], repeat=8):
+            cleaner = PersianTextCleaner(*flags)
+            for text in EQUIVALENCE_TEXTS:
+                with self.subTest(flags=flags, text=text):
+                    self.assertEqual(cleaner.clean(text), sequential_clean(cleaner, text))
+
+    def test_custom_replacements(self):
+        """Test replacements that later rules could match"""
+        for replacement in ('', ' ', 'LINK', '@link', '#x', '<X>', '😊'):
+            cleaner = PersianTextCleaner(remove_emojis=True, replace_urls_with=replacement,
+                                         replace_emails_with=replacement,
+                                         replace_mentions_with=replacement)
+            for text in EQUIVALENCE_TEXTS:
+                with self.subTest(replacement=replacement, text=text):
+                    self.assertEqual(cleaner.clean(text), sequential_clean(cleaner, text))
+
+    def test_settings_changed_after_init(self):
+        """Test that changed attributes take effect"""
+        cleaner = PersianTextCleaner()
+        self.assertIn('<URL>', cleaner.clean("ببینید www.example.com"))
+
+        cleaner.replace_urls_with = None
+        self.assertEqual(cleaner.clean("ببینید www.example.com"), "ببینید www.example.com")
+
+        cleaner.remove_urls = True
+        self.assertEqual(cleaner.clean("ببینید www.example.com"), "ببینید")
+
+    def test_whitespace_rules(self):
+        """Test whitespace cleanup against the original regex passes"""
+        cleaner = PersianTextCleaner()
+        for text in (" a  b ", "a\n\n  b", "a\n \n b", "\n  \n\n", "a \n  b  \n", "a\tb  \t"):
+            with self.subTest(text=text):
+                self.assertEqual(cleaner.clean_whitespace(text), sequential_clean(cleaner, text))
+
+    def test_html_entities_single_pass(self):
+        """Test entity decoding against sequential replacement"""
+        cleaner = PersianTextCleaner(replace_urls_with=None, replace_emails_with=None,
+                                     replace_mentions_with=None, replace_hashtags_with=None,
+                                     remove_extra_whitespace=False)
+        text = "&amp;quot; &amp;#39; &amp;amp;quot; &amp;nbsp; &amp;lt; &nbsp;&quot;&#39;"
+        self.assertEqual(cleaner.clean_html(text),
+                         '"' + " ' &amp;quot; &nbsp; &lt;  \"'")
+
+
+class TestEntityExtraction(unittest.TestCase):
+    """Test cases for clean(..., return_entities=True)"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cleaner = PersianTextCleaner(remove_emojis=True)
+
+    def test_entities_with_offsets(self):
+        """Test extracted entities and their offsets"""
+        text = "سلام @کاربر https://t.co/x #ایران 😊 a@b.com"
+        cleaned, entities = self.cleaner.clean(text, return_entities=True)
+
+        self.assertEqual(cleaned, self.cleaner.clean(text))
+        self.assertEqual([entity[0] for entity in entities],
+                         ['mention', 'url', 'hashtag', 'emoji', 'email'])
+        for _, match, start, end in entities:
+            self.assertEqual(text[start:end], match)
+
+    def test_offsets_through_html(self):
+        """Test that offsets refer to the input text before HTML cleaning"""
+        text = "<p>ایمیل a@b.com &amp; www.x.ir</p>"
+        cleaned, entities = self.cleaner.clean(text, return_entities=True)
+
+        self.assertEqual(cleaned, "ایمیل <EMAIL> & <URL>")
+        self.assertEqual([(name, text[start:end]) for name, _, start, end in entities],
+                         [('email', 'a@b.com'), ('url', 'www.x.ir')])
+
+    def test_interacting_matches(self):
+        """Test extraction when the rules must run in sequence"""
+        text = "a.b@www.example.com @ali"
+        cleaned, entities = self.cleaner.clean(text, return_entities=True)
+
+        self.assertEqual(cleaned, sequential_clean(self.cleaner, text))
+        self.assertEqual(entities, [('url', 'www.example.com', 4, 19),
+                                    ('mention', '@ali', 20, 24)])
+
+    def test_match_joined_by_removal(self):
+        """Test a match that only formed after an earlier rule removed text"""
+        cleaner = PersianTextCleaner(remove_urls=True)
+        text = "@http://x.coسلام"
+        cleaned, entities = cleaner.clean(text, return_entities=True)
+
+        self.assertEqual(cleaned, "<MENTION>")
+        self.assertEqual(entities, [('mention', text, 0, 16), ('url', 'http://x.co', 1, 12)])
+
+    def test_entity_text_matches_offsets(self):
+        """Test that every entity's text is the input slice at its offsets"""
+        pieces = ['@', '#', 'ali', 'سلام', ' ', '.', 'http://x.co', 'www.a.ir', 'a@b.com',
+                  '😀', '☀', 'x', '-', '+']
+        rng = random.Random(0)
+        for replacement in ('', ' ', 'LINK', '@x', '#y', '😊', '<R>'):
+            cleaner = PersianTextCleaner(
+                remove_emojis=rng.random() < 0.5, replace_urls_with=replacement,
+                replace_emails_with=replacement, replace_mentions_with=replacement,
+                replace_hashtags_with=replacement, replace_emojis_with=replacement)
+            for _ in range(300):
+                text = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+                cleaned, entities = cleaner.clean(text, return_entities=True)
+                with self.subTest(replacement=replacement, text=text):
+                    self.assertEqual(cleaned, cleaner.clean(text))
+                    for _, match, start, end in entities:
+                        self.assertEqual(text[start:end], match)
+
+    def test_disabled_rules(self):
+        """Test that disabled rules produce no entities"""
+        cleaner = PersianTextCleaner(replace_urls_with=None)
+        cleaned, entities = cleaner.clean("ببینید www.example.com", return_entities=True)
+
+        self.assertEqual(cleaned, "ببینید www.example.com")
+        self.assertEqual(entities, [])
+
+    def test_empty_text(self):
+        """Test extraction from empty text"""
+        self.assertEqual(self.cleaner.clean("", return_entities=True), ("", []))
+
+    def test_batch(self):
+        """Test batch extraction"""
+        texts = ["متن اول https://example.com", "متن دوم"]
+        results = self.cleaner.batch_clean(texts, return_entities=True)
+
+        self.assertEqual([cleaned for cleaned, _ in results], self.cleaner.batch_clean(texts))
+        self.assertEqual(results[0][1], [('url', 'https://example.com', 8, 27)])
+        self.assertEqual(results[1][1], [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -168,5 +168,27 @@ class TestPersianNormalizer(unittest.TestCase):
         self.assertTrue(result.endswith('.'))  # No space before period
 
 
+    def test_char_table_follows_settings(self):
+        """Test that the fused character table is rebuilt when settings change"""
+        self.assertEqual(self.normalizer.normalize("كتاب"), "کتاب")
+
+        self.normalizer.normalize_arabic = False
+        self.assertEqual(self.normalizer.normalize("كتاب"), "كتاب")
+        self.assertNotIn(ord('ك'), self.normalizer.char_table())
+
+    def test_char_table_follows_mapping_edits(self):
+        """Test that the character table is rebuilt when a mapping is edited in place"""
+        self.assertEqual(self.normalizer.normalize("كتاب"), "کتاب")
+
+        self.normalizer.arabic_to_persian['ك'] = 'گ'
+        self.assertEqual(self.normalizer.normalize("كتاب"), "گتاب")
+
+        del self.normalizer.arabic_to_persian['ك']
+        self.assertEqual(self.normalizer.normalize("كتاب"), "كتاب")
+
+        self.normalizer.space_chars['_'] = ' '
+        self.assertEqual(self.normalizer.normalize("کتاب_خوب"), "کتاب خوب")
+
+
 if __name__ == '__main__':
     unittest.main()
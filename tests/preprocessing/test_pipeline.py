@@ -0,0 +1,159 @@
+"""
+Tests for the Persian preprocessing Pipeline
+"""
+
+import random
+import unittest
+from bidnlp.preprocessing import (
+    Pipeline, PersianNormalizer, PersianTextCleaner,
+    PersianNumberNormalizer, PersianPunctuationNormalizer,
+)
+from bidnlp.tokenization import PersianWordTokenizer
+
+
+# Random texts are drawn from these pieces: Arabic and Persian letters and
+# digits, diacritics, kashida, invisible and space characters, punctuation,
+# quotes and the entities the cleaner handles
+PIECES = list(
+    'میننبیيكؤۀةإأٱ٠١٢۱23 \n\t.,،؛؟!:;?"«»\'…—–-\u0640\u064b\u0650\u0670'
+    '\u200b\u200c\u200d\u200e\u00a0\u2009\u3000aBﻱهاتر<>&'
+) + ['http://a.com', '@ali', '#tag', 'a@b.com', '&amp;', '😀', '...']
+
+
+def hand_chain(specs):
+    """Call the components by hand, the way the pipeline replaces."""
+    funcs = []
+    for name, kwargs in specs:
+        if name == 'clean':
+            funcs.append(PersianTextCleaner(**kwargs).clean)
+        elif name == 'normalize':
+            funcs.append(PersianNormalizer(**kwargs).normalize)
+        elif name == 'punctuation':
+            funcs.append(PersianPunctuationNormalizer(**kwargs).normalize)
+        elif name == 'digits':
+            numbers = PersianNumberNormalizer()
+            funcs.append(lambda text, kwargs=kwargs: numbers.normalize_digits(text, **kwargs))
+        else:
+            funcs.append(PersianWordTokenizer(**kwargs).tokenize)
+
+    def run(text):
+        for func in funcs:
+            text = func(text)
+        return text
+    return run
+
+
+class TestPipeline(unittest.TestCase):
+    """Test cases for Pipeline"""
+
+    def test_matches_hand_chained_components(self):
+        """Test that the fused plan gives the same output as the components"""
+        specs = [
+            ('clean', {'remove_urls': True}),
+            ('normalize', {}),
+            ('digits', {'target': 'english'}),
+            ('punctuation', {}),
+            ('tokenize', {}),
+        ]
+        pipeline = Pipeline(specs)
+        expected = hand_chain(specs)
+        text = "سلام! این يك متن آزمايشي است با عدد ۱۲۳ و لینک http://example.com ، «نقل قول» می خواهم"
+
+        self.assertEqual(pipeline(text), expected(text))
+        self.assertEqual(pipeline.batch_run([text, '']), [expected(text), []])
+
+    def test_random_equivalence(self):
+        """Test equivalence on random configs and texts"""
+        options = {
+            'clean': [{}, {'remove_emails': True, 'lowercase_english': True}],
+            'normalize': [{}, {'unicode_form': None}, {'normalize_zwnj': False},
+                          {'normalize_spacing': False, 'remove_diacritics': False}],
+            'punctuation': [{}, {'target_style': 'latin'}],
+            'digits': [{}, {'target': 'persian'}],
+            'tokenize': [{}, {'normalize_zwnj': False}],
+        }
+        rng = random.Random(0)
+        for _ in range(200):
+            names = [rng.choice(['clean', 'normalize', 'punctuation', 'digits'])
+                     for _ in range(rng.randint(1, 5))]
+            if rng.random() < 0.5:
+                names.append('tokenize')
+            specs = [(name, rng.choice(options[name])) for name in names]
+            pipeline = Pipeline(specs)
+            expected = hand_chain(specs)
+            for _ in range(10):
+                text = ''.join(rng.choice(PIECES) for _ in range(rng.randint(1, 20)))
+                with self.subTest(specs=specs, text=text):
+                    self.assertEqual(pipeline(text), expected(text))
+
+    def test_fuses_character_mappings(self):
+        """Test that digit mapping joins the normalizer's translate table"""
+        pipeline = Pipeline(['normalize', ('digits', {'target': 'english'})])
+
+        self.assertEqual([step for _, step in pipeline.plan].count('translate'), 1)
+        self.assertEqual(pipeline('كتاب ٣ و ۴'), 'کتاب 3 و 4')
+
+    def test_drops_redundant_mappings(self):
+        """Test that mappings earlier stages already applied are dropped"""
+        pipeline = Pipeline(['normalize', 'digits', 'digits', 'tokenize'])
+
+        self.assertEqual(pipeline.stages, ['normalize', 'digits', 'digits_2', 'tokenize'])
+        self.assertEqual(pipeline.dropped, ['digits_2'])
+        tokenizer_table = [step.table for step in pipeline._plan
+                           if step.stage == 'tokenize' and step.table is not None][0]
+        self.assertNotIn(ord('ي'), tokenizer_table)
+        self.assertIn(ord('\u200c'), tokenizer_table)
+
+    def test_repeated_stages_kept(self):
+        """Test that repeated stages with work left are not dropped"""
+        pipeline = Pipeline(['clean', 'clean'])
+
+        self.assertEqual(pipeline.dropped, [])
+        self.assertEqual(pipeline('&amp;lt;b&amp;gt;متن'), 'متن')
+
+    def test_timings(self):
+        """Test per-stage timing"""
+        pipeline = Pipeline(['clean', 'normalize', 'tokenize'], timed=True)
+        pipeline.batch_run(["متن آزمایشی"] * 10)
+
+        self.assertEqual(set(pipeline.timings), {'clean', 'normalize', 'tokenize'})
+        self.assertTrue(all(seconds > 0 for seconds in pipeline.timings.values()))
+
+        pipeline.reset_timings()
+        self.assertEqual(pipeline.timings, {'clean': 0.0, 'normalize': 0.0, 'tokenize': 0.0})
+
+        untimed = Pipeline(['normalize'])
+        untimed("متن")
+        self.assertEqual(untimed.timings, {'normalize': 0.0})
+
+    def test_from_config(self):
+        """Test building from a JSON-style config"""
+        pipeline = Pipeline.from_config({
+            'stages': ['normalize', ['digits', {'target': 'persian'}]],
+            'timed': True,
+        })
+
+        self.assertTrue(pipeline.timed)
+        self.assertEqual(pipeline('عدد 12'), 'عدد ۱۲')
+
+    def test_invalid_config(self):
+        """Test config validation"""
+        with self.assertRaises(ValueError):
+            Pipeline(['stem'])
+        with self.assertRaises(ValueError):
+            Pipeline([('normalize', 'NFKC')])
+        with self.assertRaises(ValueError):
+            Pipeline([('normalize', {'unknown': True})])
+        with self.assertRaises(ValueError):
+            Pipeline([('digits', {'target': 'roman'})])
+        with self.assertRaises(ValueError):
+            Pipeline(['tokenize', 'normalize'])
+
+    def test_empty_text(self):
+        """Test empty input"""
+        self.assertEqual(Pipeline(['normalize'])(''), '')
+        self.assertEqual(Pipeline(['normalize', 'tokenize'])(''), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
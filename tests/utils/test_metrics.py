@@ -3,7 +3,7 @@ Tests for Persian text metrics
 """
 
 import pytest
-from bidnlp.utils import PersianTextMetrics
+from bidnlp.utils import ConfusionMatrix, PersianTextMetrics
 
 
 class TestPersianTextMetrics:
@@ -274,3 +274,92 @@ class TestPersianTextMetrics:
         assert PersianTextMetrics.recall(predicted, actual) == 0.0
         assert PersianTextMetrics.f1_score(predicted, actual) == 0.0
         assert PersianTextMetrics.jaccard_similarity(predicted, actual) == 0.0
+
+
+def _reference_report(predicted, actual, labels):
+    """Per-label report computed with the set-based metrics."""
+    report = {}
+    for label in labels:
+        pred_set = {i for i, p in enumerate(predicted) if p == label}
+        actual_set = {i for i, a in enumerate(actual) if a == label}
+        report[label] = {
+            'precision': round(PersianTextMetrics.precision(pred_set, actual_set), 4),
+            'recall': round(PersianTextMetrics.recall(pred_set, actual_set), 4),
+            'f1_score': round(PersianTextMetrics.f1_score(pred_set, actual_set), 4),
+            'support': len(actual_set),
+        }
+    report['overall'] = {
+        'accuracy': round(PersianTextMetrics.accuracy(predicted, actual), 4),
+        'total': len(actual),
+    }
+    return report
+
+
+class TestConfusionMatrix:
+    """Test cases for ConfusionMatrix class."""
+
+    PREDICTED = ['a', 'b', 'a', 'c', 'c', 'a', 'b', 'd']
+    ACTUAL = ['a', 'b', 'b', 'c', 'a', 'a', 'c', 'a']
+
+    def test_report_matches_set_metrics(self):
+        """Test the report against the set-based per-label metrics."""
+        labels = sorted(set(self.PREDICTED) | set(self.ACTUAL))
+        assert PersianTextMetrics.classification_report(self.PREDICTED, self.ACTUAL) == \
+            _reference_report(self.PREDICTED, self.ACTUAL, labels)
+
+    def test_report_with_labels(self):
+        """Test restricting the report to given labels."""
+        labels = ['a', 'c', 'z']
+        report = PersianTextMetrics.classification_report(self.PREDICTED, self.ACTUAL, labels)
+
+        assert report == _reference_report(self.PREDICTED, self.ACTUAL, labels)
+        assert report['z']['support'] == 0
+
+    def test_matrix(self):
+        """Test the nested matrix format."""
+        cm = PersianTextMetrics.confusion_matrix(self.PREDICTED, self.ACTUAL, labels=['a', 'b'])
+
+        assert cm['labels'] == ['a', 'b']
+        assert cm['total'] == 8
+        assert cm['matrix'] == {'a': {'a': 2, 'b': 0}, 'b': {'a': 1, 'b': 1}}
+
+    def test_streaming_chunks(self):
+        """Test that chunked updates equal one update."""
+        streamed = ConfusionMatrix()
+        for start in range(0, len(self.ACTUAL), 3):
+            streamed.update(self.PREDICTED[start:start + 3], self.ACTUAL[start:start + 3])
+
+        whole = ConfusionMatrix().update(self.PREDICTED, self.ACTUAL)
+        assert streamed.report() == whole.report()
+        assert streamed.to_dict() == whole.to_dict()
+        assert streamed.correct == 4
+        assert streamed.accuracy() == 0.5
+
+    def test_update_sequences(self):
+        """Test counting aligned sequences."""
+        cm = ConfusionMatrix().update_sequences(
+            [['N', 'V'], ['N', 'ADJ', 'N']],
+            [['N', 'N'], ['N', 'ADJ']])
+
+        assert cm.total == 4
+        assert cm.correct == 3
+        assert cm.counts()['N'] == (2, 2, 3)
+
+    def test_merge(self):
+        """Test combining matrices."""
+        first = ConfusionMatrix().update(self.PREDICTED[:4], self.ACTUAL[:4])
+        second = ConfusionMatrix().update(self.PREDICTED[4:], self.ACTUAL[4:])
+        whole = ConfusionMatrix().update(self.PREDICTED, self.ACTUAL)
+
+        assert first.merge(second).report() == whole.report()
+
+    def test_empty(self):
+        """Test an empty matrix."""
+        cm = ConfusionMatrix()
+        assert cm.accuracy() == 0.0
+        assert cm.report() == {'overall': {'accuracy': 0.0, 'total': 0}}
+
+    def test_different_lengths(self):
+        """Test updating with different length lists."""
+        with pytest.raises(ValueError):
+            ConfusionMatrix().update(['a'], ['a', 'b'])
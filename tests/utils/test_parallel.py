@@ -0,0 +1,41 @@
+"""
+Tests for parallel chunk processing helpers
+"""
+
+import pytest
+from bidnlp.utils.parallel import iter_chunks, map_chunks, resolve_n_jobs
+
+
+def _scale_chunk(factor, chunk):
+    """Multiply every item of a chunk by the shared factor."""
+    return [factor * item for item in chunk]
+
+
+class TestParallelHelpers:
+    """Test cases for the parallel helpers."""
+
+    def test_iter_chunks(self):
+        """Test chunking an iterable."""
+        assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(iter_chunks([], 3)) == []
+
+    def test_iter_chunks_invalid_size(self):
+        """Test that chunksize must be positive."""
+        with pytest.raises(ValueError):
+            list(iter_chunks([1], 0))
+
+    def test_resolve_n_jobs(self):
+        """Test resolving the number of processes."""
+        assert resolve_n_jobs(None) == 1
+        assert resolve_n_jobs(1) == 1
+        assert resolve_n_jobs(3) == 3
+        assert resolve_n_jobs(-1) >= 1
+
+        with pytest.raises(ValueError):
+            resolve_n_jobs(0)
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_map_chunks_preserves_order(self, n_jobs):
+        """Test that results come back in input order."""
+        results = map_chunks(_scale_chunk, 10, iter(range(7)), n_jobs=n_jobs, chunksize=2)
+        assert [item for chunk in results for item in chunk] == [i * 10 for i in range(7)]
@@ -0,0 +1,148 @@
+"""
+Tests for entry point profiling
+"""
+
+import pytest
+from bidnlp.preprocessing import PersianNormalizer, Pipeline
+from bidnlp.pos import HMMPOSTagger
+from bidnlp.stemming import PersianStemmer
+from bidnlp.utils import ProfileRegistry, profiling
+
+
+@pytest.fixture(autouse=True)
+def profiling_off():
+    """Make sure no test leaves the wrappers installed."""
+    yield
+    profiling.disable()
+
+
+class TestProfiling:
+    """Test cases for the profiling hooks."""
+
+    def test_disabled_has_no_wrappers(self):
+        """Test that the original functions are restored when disabled."""
+        stem = PersianStemmer.__dict__['stem']
+        run = Pipeline.__dict__['run']
+
+        with profiling.profile():
+            assert PersianStemmer.__dict__['stem'] is not stem
+            assert Pipeline.__dict__['__call__'] is Pipeline.__dict__['run']
+        assert not profiling.is_enabled()
+        assert PersianStemmer.__dict__['stem'] is stem
+        assert Pipeline.__dict__['run'] is run
+        assert Pipeline.__dict__['__call__'] is run
+        # Inherited methods are removed again rather than shadowed
+        assert 'tag_batch' not in HMMPOSTagger.__dict__
+
+    def test_records_calls(self):
+        """Test call counts, latencies and input sizes."""
+        stemmer = PersianStemmer()
+        with profiling.profile() as registry:
+            for word in ['کتابها', 'دانشجویان', 'خوب']:
+                stemmer.stem(word)
+            PersianNormalizer().normalize("متن آزمایشی")
+        stemmer.stem('کتابها')
+
+        stats = registry.to_dict()
+        assert stats['PersianStemmer.stem']['count'] == 3
+        assert stats['PersianStemmer.stem']['input_total'] == 6 + 9 + 3
+        assert stats['PersianStemmer.stem']['input_max'] == 9
+        assert stats['PersianNormalizer.normalize']['count'] == 1
+        entry = stats['PersianStemmer.stem']
+        assert 0 < entry['min_seconds'] <= entry['p50_seconds'] <= entry['p99_seconds'] <= entry['max_seconds']
+
+    def test_private_hot_path(self):
+        """Test that HMMPOSTagger._viterbi and inherited methods are recorded."""
+        tagger = HMMPOSTagger()
+        tagger.train([[('من', 'PRO'), ('رفتم', 'V')]])
+        with profiling.profile() as registry:
+            tagger.tag_batch(["من رفتم", "من"])
+
+        stats = registry.to_dict()
+        assert stats['HMMPOSTagger._viterbi']['count'] == 2
+        assert stats['BasePOSTagger.tag_batch']['count'] == 1
+        assert stats['BasePOSTagger.tag_batch']['input_total'] == 2
+
+    def test_nested_profiles(self):
+        """Test that an inner profile block records separately."""
+        stemmer = PersianStemmer()
+        with profiling.profile() as outer:
+            stemmer.stem('کتاب')
+            with profiling.profile() as inner:
+                stemmer.stem('کتاب')
+            assert profiling.is_enabled()
+            stemmer.stem('کتاب')
+
+        assert outer.to_dict()['PersianStemmer.stem']['count'] == 2
+        assert inner.to_dict()['PersianStemmer.stem']['count'] == 1
+
+    def test_enable_default_registry(self):
+        """Test the global switch."""
+        registry = profiling.get_registry()
+        registry.reset()
+        assert profiling.enable() is registry
+        PersianStemmer().stem('کتاب')
+        profiling.disable()
+
+        assert 'PersianStemmer.stem' in registry
+        registry.reset()
+        assert len(registry) == 0
+
+    def test_register_entry_point(self, monkeypatch):
+        """Test instrumenting extra methods."""
+        monkeypatch.setattr(profiling, '_ENTRY_POINTS', list(profiling._ENTRY_POINTS))
+        profiling.register_entry_point('bidnlp.stemming.persian_stemmer', 'PersianStemmer', 'normalize')
+
+        with profiling.profile() as registry:
+            PersianStemmer().normalize('كتاب')
+        assert registry.to_dict()['PersianStemmer.normalize']['count'] == 1
+
+
+class TestProfileRegistry:
+    """Test cases for ProfileRegistry."""
+
+    def test_percentiles(self):
+        """Test percentile estimates from the histogram."""
+        registry = ProfileRegistry()
+        for _ in range(90):
+            registry.record('f', 0.001)
+        for _ in range(10):
+            registry.record('f', 1.0)
+
+        stats = registry.to_dict(percentiles=(50, 95))['f']
+        assert stats['count'] == 100
+        assert stats['total_seconds'] == pytest.approx(10.09)
+        assert stats['p50_seconds'] == pytest.approx(0.001)
+        # Interpolated within the (0.5, 1.0] bucket
+        assert 0.5 < stats['p95_seconds'] <= 1.0
+        assert stats['input_mean'] == 0.0
+
+    def test_timer_and_merge(self):
+        """Test timing user code and merging registries."""
+        a, b = ProfileRegistry(), ProfileRegistry()
+        with a.timer('block', size=5):
+            pass
+        b.record('block', 0.5, size=10)
+        a.merge(b)
+
+        stats = a.to_dict()['block']
+        assert stats['count'] == 2
+        assert stats['max_seconds'] == 0.5
+        assert stats['input_total'] == 15
+        assert stats['input_max'] == 10
+
+    def test_prometheus(self):
+        """Test the Prometheus text format."""
+        registry = ProfileRegistry()
+        registry.record('PersianStemmer.stem', 3e-6, size=4)
+        registry.record('PersianStemmer.stem', 2.0, size=6)
+        text = registry.to_prometheus()
+
+        assert '# TYPE bidnlp_latency_seconds histogram' in text
+        assert 'bidnlp_latency_seconds_bucket{entry_point="PersianStemmer.stem",le="5e-06"} 1' in text
+        assert 'bidnlp_latency_seconds_bucket{entry_point="PersianStemmer.stem",le="2.5"} 2' in text
+        assert 'bidnlp_latency_seconds_bucket{entry_point="PersianStemmer.stem",le="+Inf"} 2' in text
+        assert 'bidnlp_latency_seconds_count{entry_point="PersianStemmer.stem"} 2' in text
+        assert 'bidnlp_input_size_total{entry_point="PersianStemmer.stem"} 10' in text
+        assert 'bidnlp_input_size_max{entry_point="PersianStemmer.stem"} 6' in text
+        assert text.endswith('\n')
@@ -2,8 +2,14 @@
 Tests for Persian stop words
 """
 
+import os
+
 import pytest
 from bidnlp.utils import PersianStopWords
+from bidnlp.utils.stopwords import read_stopwords_file, write_stopwords_module
+
+PROJECT_STOPWORDS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'stopwords.txt')
 
 
 class TestPersianStopWords:
@@ -161,3 +167,93 @@ class TestPersianStopWords:
         text = "من از به با"
         filtered = self.stopwords.remove_stopwords(text)
         assert filtered.strip() == ""
+
+    def test_shared_defaults(self):
+        """Test that the default set is shared and immutable."""
+        shared = PersianStopWords.get_shared_stopwords()
+
+        assert isinstance(shared, frozenset)
+        assert shared is PersianStopWords.get_shared_stopwords()
+        assert shared == PersianStopWords.get_default_stopwords()
+
+    def test_copy_on_write(self):
+        """Test that modifying an instance leaves the shared set untouched."""
+        other = PersianStopWords()
+        self.stopwords.add_stopword('کتاب')
+        other.stopwords.discard('از')
+
+        assert 'کتاب' not in PersianStopWords.get_shared_stopwords()
+        assert 'از' in PersianStopWords.get_shared_stopwords()
+        assert not PersianStopWords().is_stopword('کتاب')
+        assert not other.is_stopword('از')
+
+    def test_filter_tokens_batch(self):
+        """Test filtering several token lists."""
+        token_lists = [['من', 'به', 'دانشگاه'], [], ['کتاب', 'و', 'مداد']]
+        filtered = self.stopwords.filter_tokens_batch(token_lists)
+
+        assert filtered == [self.stopwords.filter_stopwords(tokens) for tokens in token_lists]
+        assert filtered[2] == ['کتاب', 'مداد']
+
+    def test_analyze(self):
+        """Test filtering and counting in one pass."""
+        text = "من به دانشگاه می روم"
+        result = self.stopwords.analyze(text)
+
+        assert ' '.join(result['tokens']) == self.stopwords.remove_stopwords(text)
+        assert result['stopword_count'] == self.stopwords.count_stopwords(text)
+        assert result['total_words'] == 5
+        assert result['stopword_ratio'] == result['stopword_count'] / 5
+        assert self.stopwords.analyze(text.split()) == result
+
+    def test_analyze_empty(self):
+        """Test one-pass analysis of empty input."""
+        result = self.stopwords.analyze("")
+        assert result == {'tokens': [], 'stopword_count': 0,
+                          'total_words': 0, 'stopword_ratio': 0.0}
+
+    def test_defaults_shipped_with_package(self):
+        """Test that the default list comes from the package, not the project root."""
+        from bidnlp.utils.stopwords_data import STOPWORDS
+
+        assert PersianStopWords.get_shared_stopwords() is STOPWORDS
+        assert len(STOPWORDS) > 1000
+
+    @pytest.mark.skipif(not os.path.exists(PROJECT_STOPWORDS), reason="stopwords.txt not available")
+    def test_generated_module_up_to_date(self, tmp_path):
+        """Test that stopwords_data matches the project's stopwords.txt."""
+        from bidnlp.utils.stopwords_data import STOPWORDS
+        assert STOPWORDS == read_stopwords_file(PROJECT_STOPWORDS)
+
+        target = tmp_path / 'stopwords_data.py'
+        write_stopwords_module(PROJECT_STOPWORDS, str(target))
+        namespace = {}
+        exec(target.read_text(encoding='utf-8'), namespace)
+        assert namespace['STOPWORDS'] == STOPWORDS
+
+    def test_load_file(self, tmp_path):
+        """Test loading and caching a custom list file."""
+        path = tmp_path / 'custom.txt'
+        path.write_text("کتاب\n  مداد \n\n", encoding='utf-8')
+
+        words = PersianStopWords.load_file(str(path))
+        assert words == frozenset({'کتاب', 'مداد'})
+        assert PersianStopWords.load_file(str(path)) is words
+
+        # A changed file is read again
+        path.write_text("کتاب\nمداد\nدفتر\n", encoding='utf-8')
+        assert 'دفتر' in PersianStopWords.load_file(str(path))
+
+    def test_stopwords_file_option(self, tmp_path):
+        """Test combining a custom list file with the defaults."""
+        path = tmp_path / 'custom.txt'
+        path.write_text("کتاب\n", encoding='utf-8')
+
+        combined = PersianStopWords(stopwords_file=str(path))
+        assert combined.is_stopword('کتاب')
+        assert combined.is_stopword('از')
+
+        only_file = PersianStopWords(stopwords_file=str(path), include_defaults=False)
+        assert only_file.get_stopwords() == {'کتاب'}
+        only_file.add_stopword('مداد')
+        assert PersianStopWords.load_file(str(path)) == frozenset({'کتاب'})
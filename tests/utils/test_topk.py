@@ -0,0 +1,80 @@
+"""
+Tests for the Space-Saving top-k counter
+"""
+
+import random
+from collections import Counter
+
+import pytest
+from bidnlp.utils.topk import SpaceSavingCounter
+
+
+class TestSpaceSavingCounter:
+    """Test cases for SpaceSavingCounter."""
+
+    def test_exact_below_capacity(self):
+        """Test that counts are exact while the capacity is not reached."""
+        counter = SpaceSavingCounter(capacity=10)
+        counter.update_many(['a', 'b', 'a', 'c', 'a', 'b'])
+
+        assert counter.most_common() == [('a', 3), ('b', 2), ('c', 1)]
+        assert counter['a'] == 3
+        assert counter['missing'] == 0
+        assert counter.error('a') == 0
+        assert counter.total == 6
+
+    def test_bounded_size(self):
+        """Test that at most capacity items are tracked."""
+        counter = SpaceSavingCounter(capacity=3)
+        counter.update_many(str(i) for i in range(100))
+
+        assert len(counter) == 3
+        assert counter.total == 100
+
+    def test_eviction_inherits_minimum(self):
+        """Test that a new item replaces the minimum and inherits its count."""
+        counter = SpaceSavingCounter(capacity=2)
+        counter.update('a', 5)
+        counter.update('b', 2)
+        counter.update('c')
+
+        assert 'b' not in counter
+        assert counter['c'] == 3
+        assert counter.error('c') == 2
+
+    def test_eviction_uses_current_counts(self):
+        """Test that counts increased after insertion are respected on eviction."""
+        counter = SpaceSavingCounter(capacity=2)
+        counter.update('a')
+        counter.update('b')
+        counter.update('a', 10)
+        counter.update('c')
+
+        assert 'a' in counter
+        assert 'b' not in counter
+
+    def test_heavy_hitters_found(self):
+        """Test that frequent items of a skewed stream are tracked with bounds."""
+        rng = random.Random(0)
+        stream = rng.choices(range(500), weights=[1 / (i + 1) for i in range(500)], k=20000)
+        exact = Counter(stream)
+
+        counter = SpaceSavingCounter(capacity=50)
+        counter.update_many(stream)
+
+        top = [item for item, _ in counter.most_common(5)]
+        assert top == [item for item, _ in exact.most_common(5)]
+        for item in counter.most_common():
+            word = item[0]
+            assert counter[word] - counter.error(word) <= exact[word] <= counter[word]
+
+    def test_most_common_n(self):
+        """Test limiting the number of returned items."""
+        counter = SpaceSavingCounter()
+        counter.update_many('aaabbc')
+        assert counter.most_common(2) == [('a', 3), ('b', 2)]
+
+    def test_invalid_capacity(self):
+        """Test that a capacity below 1 is rejected."""
+        with pytest.raises(ValueError):
+            SpaceSavingCounter(capacity=0)